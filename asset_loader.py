@@ -0,0 +1,58 @@
+"""
+Precarga de imágenes en un hilo de fondo.
+
+El hilo solo decodifica (pygame.image.load, y opcionalmente escala) sobre
+superficies que nadie más usa; convert()/convert_alpha() dependen del display y
+se hacen siempre en el hilo principal al pedir la imagen.
+
+    game.assets.preload("splash.png", size=(1920, 1080))
+    if game.assets.ready("splash.png", (1920, 1080)):
+        bg = game.assets.load("splash.png", (1920, 1080)).convert()
+
+load() de algo no precargado (o todavía en curso) decodifica/espera en el momento,
+así que siempre se puede usar en lugar de pygame.image.load.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+Key = Tuple[str, Optional[Tuple[int, int]]]
+
+
+def _decode(path: str, size: Optional[Tuple[int, int]]) -> pygame.Surface:
+    surf = pygame.image.load(path)
+    if size is not None and surf.get_size() != tuple(size):
+        # Mismo escalado que hacían las pantallas al cargar la imagen (no smoothscale)
+        surf = pygame.transform.scale(surf, size)
+    return surf
+
+
+class AssetLoader:
+    def __init__(self, workers: int = 1):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        self._pending: Dict[Key, Future] = {}
+
+    def preload(self, path: str, size: Optional[Tuple[int, int]] = None) -> None:
+        """Encolar la decodificación de `path` (escalada a `size` si se indica)."""
+        key = (path, tuple(size) if size else None)
+        if key not in self._pending:
+            self._pending[key] = self._pool.submit(_decode, *key)
+
+    def ready(self, path: str, size: Optional[Tuple[int, int]] = None) -> bool:
+        fut = self._pending.get((path, tuple(size) if size else None))
+        return fut is not None and fut.done()
+
+    def load(self, path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """Superficie decodificada (sin convertir). Libera la entrada del cache.
+
+        Si la precarga falló, el error se propaga igual que con pygame.image.load.
+        """
+        key = (path, tuple(size) if size else None)
+        fut = self._pending.pop(key, None)
+        if fut is None:
+            return _decode(*key)
+        return fut.result()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
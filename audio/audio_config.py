@@ -62,10 +62,62 @@ class MusicDef:
     fade_ms: int = 600
 
 
+@dataclass(frozen=True)
+class VoicePool:
+    """Grupo de canales del mixer reservado para una categoría de sonidos.
+
+    Atributos:
+        channels: Canales propios de la categoría (máximo de voces simultáneas).
+        priority: Mayor = más importante. Con su grupo lleno, una categoría puede
+                  usar un canal libre de otra de menor prioridad.
+        steal_oldest: Si no hay canal libre, cortar la voz más vieja del grupo;
+                      si es False, el sonido nuevo se descarta.
+    """
+    channels: int
+    priority: int
+    steal_oldest: bool = True
+
+
+@dataclass(frozen=True)
+class AudioProfile:
+    """Formato con el que se abre el mixer (se guarda en settings.json como "audio_profile").
+
+    Atributos:
+        label: Texto que muestra la pantalla de ajustes.
+        frequency: Frecuencia de muestreo en Hz.
+        buffer: Tamaño del buffer en muestras. Más chico = menos latencia entre
+                play_sfx y el sonido, pero más riesgo de cortes (underruns).
+        channels: 1 (mono) o 2 (estéreo).
+    """
+    label: str
+    frequency: int = 44100
+    buffer: int = 512
+    channels: int = 2
+
+
 # =====================
 # Mapeos por defecto
 # =====================
 
+# Grupos de voces (categoría -> canales). Los eventos eligen categoría con "category"
+# en audio_config.json; por defecto "gameplay" (o "loops" si loopean).
+VOICE_POOLS: Dict[str, VoicePool] = {
+    "ui":       VoicePool(channels=2, priority=0),
+    "gameplay": VoicePool(channels=3, priority=1),
+    "loops":    VoicePool(channels=2, priority=2, steal_oldest=False),
+    "stingers": VoicePool(channels=2, priority=3),
+}
+
+
+# Perfiles de audio. Medir con tools/bench_audio_latency.py antes de cambiar los valores.
+AUDIO_PROFILES: Dict[str, AudioProfile] = {
+    "default":     AudioProfile("Normal", buffer=512),
+    "low_latency": AudioProfile("Baja Latencia", buffer=256),
+    "safe":        AudioProfile("Seguro", buffer=1024),
+}
+DEFAULT_AUDIO_PROFILE = "default"
+
+
 # SFX: asigna cada evento a uno o varios archivos.
 SOUND_MAP: Dict[SfxEvent, SoundDef] = {
     SfxEvent.UI_HOVER: SoundDef(["ui_hover"], volume=0.6, cooldown_ms=40),
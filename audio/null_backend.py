@@ -0,0 +1,208 @@
+"""
+Backend de audio nulo: misma API y lógica que SoundManager (eventos, cooldowns,
+categorías de voz, escenas) pero sin abrir el dispositivo, sin decodificar y sin mezclar.
+
+Cada play / stop / cambio de música queda en `log` como AudioCue con la hora de
+`clock`, así que una corrida headless o un benchmark puede verificar qué sonó:
+
+    audio = create_sound_manager("null", clock=fake_clock)
+    ...
+    assert audio.names("sfx") == ["Cloud Click", "stone"]
+
+Se elige con CHEESEGATES_AUDIO=null o create_sound_manager("null") / Game(audio_backend="null").
+Con un reloj falso los cooldowns dependen solo del tiempo simulado, no del real.
+
+Tampoco toca el disco: no recorre assets/sounds ni assets/music ni lee el manifest de
+assets/baked. Los sonidos "existentes" son los que nombra la config (o los que se pasen
+en `sfx` / `music`); la config es `config` si se pasa, si no audio_config.json leído
+una sola vez por proceso.
+"""
+from __future__ import annotations
+
+import json
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .sound_manager import MUSIC_MAP, SOUND_MAP, SoundManager
+
+
+class AudioCue(NamedTuple):
+    t: float
+    op: str          # sfx, loop, stop_loop, music, stop_music, stop_all, event, prewarm
+    name: str
+    category: str = ""
+    volume: Optional[float] = None
+
+
+class _NullSound:
+    """Lo mínimo de pygame.mixer.Sound que usa SoundManager."""
+    __slots__ = ("name", "volume")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.volume = 1.0
+
+    def set_volume(self, v: float) -> None:
+        self.volume = v
+
+    def get_volume(self) -> float:
+        return self.volume
+
+    def get_num_channels(self) -> int:
+        return 0
+
+    def get_length(self) -> float:
+        return 0.0
+
+
+class _NullChannel:
+    """Canal que "suena" hasta que lo paran (solo los loops y la música lo consultan)."""
+    __slots__ = ("busy", "volume")
+
+    def __init__(self, busy: bool):
+        self.busy = busy
+        self.volume = 1.0
+
+    def get_busy(self) -> bool:
+        return self.busy
+
+    def set_volume(self, v: float) -> None:
+        self.volume = v
+
+    def stop(self) -> None:
+        self.busy = False
+
+    def fadeout(self, ms: int) -> None:
+        self.busy = False
+
+
+@lru_cache(maxsize=None)
+def _read_config(path: str) -> str:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception as e:
+        print(f"[Audio] Failed to load audio_config.json: {e}")
+        return "{}"
+
+
+class NullSoundManager(SoundManager):
+    def __init__(self, clock: Optional[Callable[[], float]] = None, max_log: int = 100000,
+                 config: Optional[dict] = None, sfx: Optional[Iterable[str]] = None,
+                 music: Optional[Iterable[str]] = None):
+        # Lo usan _load_json_config / _scan_sources, que corren dentro de super().__init__
+        self._null_config = config
+        self._null_names = (sfx, music)
+        super().__init__(clock=clock)
+        self.log = deque(maxlen=max_log)
+
+    # ---- Sin disco: config inyectada o cacheada, índice en memoria, sin bake ----
+    def _load_json_config(self) -> None:
+        if self._null_config is not None:
+            self._set_config(self._null_config)
+            return
+        try:
+            self._set_config(json.loads(_read_config(self.config_path)))
+        except Exception as e:
+            print(f"[Audio] Failed to load audio_config.json: {e}")
+
+    def _scan_sources(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        sfx, music = self._null_names
+        if sfx is None or music is None:
+            # Todo lo que nombra la config cuenta como existente. Se llama antes de cargar
+            # la config, así que se carga acá (es idempotente).
+            self._load_json_config()
+        if sfx is None:
+            sfx = {f for cfg in self._cfg_events.values() for f in cfg.get("files") or []}
+            sfx |= {f for cfg in self._cfg_scenes.values() for f in cfg.get("sfx") or []}
+            sfx |= {n for spec in SOUND_MAP.values() for n in spec.names}
+        if music is None:
+            music = {cfg.get("file") or key for key, cfg in self._cfg_music.items()}
+            music |= {spec.name for spec in MUSIC_MAP.values()}
+        return ({n.lower(): f"null:{n}" for n in sfx}, {n.lower(): f"null:{n}" for n in music})
+
+    def _apply_baked(self) -> None:
+        pass
+
+    # ---- Registro ----
+    def _record(self, op: str, name: str, category: str = "", volume: Optional[float] = None) -> None:
+        self.log.append(AudioCue(self._clock(), op, name, category, volume))
+
+    def cues(self, op: Optional[str] = None) -> List[AudioCue]:
+        return [c for c in self.log if op is None or c.op == op]
+
+    def names(self, op: str) -> List[str]:
+        return [c.name for c in self.log if c.op == op]
+
+    def clear_log(self) -> None:
+        self.log.clear()
+
+    # ---- Sin mixer ni decodificación ----
+    def _ensure_mixer(self) -> bool:
+        self._voices_ready = True
+        return True
+
+    def _decode_sfx(self, name: str):
+        if not self._sfx_index.get(name.lower()):
+            self._missing_sfx.add(name)
+            print(f"[Audio] SFX missing: {name}")
+            return None
+        snd = _NullSound(name)
+        snd.set_volume(self.sfx_volume * self.master_volume)
+        self._sfx[name] = snd
+        return snd
+
+    def _play_voice(self, snd, category: str, *, loops: int = 0, maxtime: int = 0, fade_ms: int = 0):
+        self._record("loop" if loops < 0 else "sfx", snd.name, category, round(snd.volume, 3))
+        return _NullChannel(busy=loops < 0)
+
+    def _count_event(self, key: str) -> None:
+        super()._count_event(key)
+        self._record("event", key)
+
+    def prewarm_scene(self, scene_name: str) -> None:
+        """Como SoundManager.prewarm_scene, pero en el hilo actual (no hay nada que decodificar)."""
+        cfg = self._cfg_scenes.get(scene_name) or {}
+        if "events" not in cfg and "sfx" not in cfg:
+            return
+        names = self._scene_sfx_names(cfg)
+        self._release_unused(names)
+        self._record("prewarm", scene_name)
+        if not (self.master_enabled and self.sfx_enabled):
+            return
+        for name in sorted(names):
+            if name not in self._sfx and name not in self._missing_sfx:
+                self._decode_sfx(name)
+
+    # ---- Música: se "carga" al instante y el crossfade solo se registra ----
+    def play_music(self, name: str, **kwargs) -> None:
+        if self._music_index.get(name.lower()) and name not in self._music_sounds:
+            self._music_sounds[name] = _NullSound(name)
+        super().play_music(name, **kwargs)
+
+    def _crossfade_to(self, name: str, vol: float, loops: int, fade_ms: int) -> None:
+        self._record("music", name, "music", round(vol * self.master_volume, 3))
+        self._music_channel = _NullChannel(busy=True)
+        self._current_music = name
+        self._music_sounds = {name: self._music_sounds[name]}
+
+    def stop_music(self, *, fade_ms: int = 400):
+        if self._current_music or self._music_target:
+            self._record("stop_music", self._current_music or self._music_target or "")
+        super().stop_music(fade_ms=fade_ms)
+
+    def stop_loop_sfx(self, name: str, *, fade_ms: int = 150) -> None:
+        if name in self._loop_channels:
+            self._record("stop_loop", name)
+        super().stop_loop_sfx(name, fade_ms=fade_ms)
+
+    def stop_loops(self, *, fade_ms: int = 120) -> None:
+        for name in list(self._loop_channels):
+            self._record("stop_loop", name)
+        super().stop_loops(fade_ms=fade_ms)
+
+    def stop_all(self, *, fade_ms_music: int = 300, fade_ms_sfx: int = 120) -> None:
+        self._record("stop_all", "")
+        self.stop_music(fade_ms=fade_ms_music)
+        self.stop_loops(fade_ms=fade_ms_sfx)
@@ -5,16 +5,27 @@ SoundManager: Maneja SFX y música con pygame.mixer.
 - Auto-carga SFX desde assets/sounds y música desde assets/music
 - Fade, loop, one-shot, y SFX en loop (e.g., pasos)
 - Config JSON amigable (audio/audio_config.json) para eventos/música/escenas
+- Prewarm por escena: los SFX que lista cada escena se decodifican en un hilo de fondo
 """
 from __future__ import annotations
 
 import os
+import hashlib
 import json
 import random
-from typing import Optional, Tuple
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import pygame
 
+from perf import trace
+
+from . import variants
+from .telemetry import AudioTelemetry, pcm_bytes
+
 try:
     from .audio_config import (
         SfxEvent,
@@ -23,26 +34,63 @@ try:
         MUSIC_MAP,
         SoundDef,
         MusicDef,
+        VOICE_POOLS,
+        AUDIO_PROFILES,
+        DEFAULT_AUDIO_PROFILE,
     )
 except Exception:
     SfxEvent = None
     MusicTrack = None
     SOUND_MAP = {}
     MUSIC_MAP = {}
+    VOICE_POOLS = {}
+    AUDIO_PROFILES = {}
+    DEFAULT_AUDIO_PROFILE = "default"
+
+
+_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Salidas de tools/bake_audio.py (PCM/OGG de carga rápida + manifest.json)
+BAKED_DIR = os.path.join(_BASE_DIR, "assets", "baked")
+
 
+def file_sha1(path: str) -> str:
+    """SHA-1 del archivo (clave del manifest de assets/baked)."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-def _find_file(base_dir: str, name: str, exts: Tuple[str, ...]) -> Optional[str]:
-    for ext in exts:
-        p = os.path.join(base_dir, f"{name}{ext}")
-        if os.path.exists(p):
-            return p
-    return None
+
+def _scan_dir(base_dir: str, exts: Tuple[str, ...]) -> Dict[str, str]:
+    """Indexar una carpeta de audio: nombre base en minúsculas -> ruta.
+
+    La extensión se compara sin distinguir mayúsculas (walking.MP3); si hay varias
+    versiones del mismo nombre gana la primera extensión de `exts`.
+    """
+    index: Dict[str, str] = {}
+    rank: Dict[str, int] = {}
+    try:
+        entries = os.scandir(base_dir)
+    except OSError:
+        return index
+    with entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if ext not in exts or not entry.is_file():
+                continue
+            key = stem.lower()
+            if key not in index or exts.index(ext) < rank[key]:
+                index[key] = entry.path
+                rank[key] = exts.index(ext)
+    return index
 
 
 class SoundManager:
     _instance: Optional["SoundManager"] = None
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
         # Singleton
         SoundManager._instance = self
 
@@ -61,32 +109,267 @@ class SoundManager:
         self._missing_logged = {}
         self._played_once = {}
         self._loop_channels = {}
+        # Prewarm: nombre de SFX -> Future de la decodificación en segundo plano
+        self._prewarm_pool = None
+        self._prewarm_futures = {}
+        # SFX de la escena actual pendientes de prewarm hasta que algo abra el mixer
+        self._prewarm_pending: Optional[Set[str]] = None
 
-        # Música actual
+        # Música actual / pedida (la pedida puede estar decodificándose en el worker)
         self._current_music = None
+        self._music_target = None
+        self._music_request = None
+        self._music_pool = None
+        self._music_jobs = {}
+        self._music_sounds = {}
+        self._music_keep = None
+        self._music_channel = None
+        self._music_channel_ids = []
+        self._music_slot = 0
+
+        # Mixer: (frecuencia, tamaño, canales, buffer). Se abre en el primer sonido real.
+        # Lo fija apply_settings según el perfil (AUDIO_PROFILES) guardado en settings.json.
+        self.audio_profile = DEFAULT_AUDIO_PROFILE
+        self.mixer_params = (44100, -16, 2, 512)
+        self._mixer_failed = False
+
+        # Voces: categoría -> ids de canal (VOICE_POOLS), asignados al abrir el mixer
+        self._pool_channels = {}
+        next_id = 0
+        for category, pool in VOICE_POOLS.items():
+            self._pool_channels[category] = list(range(next_id, next_id + pool.channels))
+            next_id += pool.channels
+        self._voices_ready = False
+        self._channels = []
+        self._voice_started = {}
+        # Canal -> categoría de la voz que suena en él (un préstamo lo ocupa otro grupo)
+        self._voice_owner = {}
+        # Contadores "<categoría>.borrow/steal/drop"
+        self.voice_stats = Counter()
 
         # Rutas
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        self.sounds_dir = os.path.join(base_dir, "assets", "sounds")
-        self.music_dir = os.path.join(base_dir, "assets", "music")
+        self.sounds_dir = os.path.join(_BASE_DIR, "assets", "sounds")
+        self.music_dir = os.path.join(_BASE_DIR, "assets", "music")
         self.config_path = os.path.join(os.path.dirname(__file__), "audio_config.json")
 
         # Extensiones
         self.sfx_exts = (".ogg", ".wav", ".mp3")
         self.music_exts = (".ogg", ".mp3", ".wav")
 
+        # Índice de archivos (una sola pasada por disco) + cache negativo de SFX.
+        # *_sources son los originales; los índices prefieren las versiones horneadas.
+        self.sfx_sources, self.music_sources = self._scan_sources()
+        self._sfx_index = dict(self.sfx_sources)
+        self._music_index = dict(self.music_sources)
+        self._apply_baked()
+        self._missing_sfx: Set[str] = set()
+
         # Config JSON
         self._cfg_events = {}
         self._cfg_music = {}
         self._cfg_scenes = {}
+        self._cfg_variants = {}
         self._load_json_config()
+        # Bancos de variantes (pitch/ganancia) por SFX y próximo índice del round-robin
+        self._variants = {}
+        self._variant_next = {}
+
+        # Cooldown por evento (anti-spam): SoundDef.cooldown_ms, pisado por "cooldown_ms" del JSON.
+        # La clave es el nombre del evento en minúsculas, compartida por play_event y play_event_name.
+        self._clock = clock or time.monotonic
+        self._cooldowns = {}
+        for event, spec in SOUND_MAP.items():
+            if spec.cooldown_ms:
+                self._cooldowns[event.name.lower()] = spec.cooldown_ms / 1000.0
+        for event_name, cfg in self._cfg_events.items():
+            if "cooldown_ms" in cfg:
+                self._cooldowns[event_name] = max(0, int(cfg["cooldown_ms"])) / 1000.0
+        self._last_event_play = {}
+
+        # Categoría de voz de cada archivo según el evento que lo usa (para play_sfx directo)
+        self._sfx_category = {}
+        for cfg in self._cfg_events.values():
+            if cfg.get("category"):
+                for f in cfg.get("files") or []:
+                    self._sfx_category.setdefault(f.lower(), cfg["category"])
+        # Reproducciones descartadas por cooldown, por evento
+        self.suppressed = Counter()
+        # Contadores de reproducciones, cargas, memoria y ocupación de canales (ver stats())
+        self.telemetry = AudioTelemetry(lambda: self._clock())
+
+    def _scan_sources(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Índices (nombre en minúsculas -> ruta) de SFX y música originales."""
+        return _scan_dir(self.sounds_dir, self.sfx_exts), _scan_dir(self.music_dir, self.music_exts)
+
+    def _apply_baked(self) -> None:
+        """Preferir las salidas de assets/baked (tools/bake_audio.py) que estén al día.
+
+        Al día = el original tiene el SHA-1 del manifest. Para no leer cada archivo en
+        cada arranque, si tamaño y mtime coinciden con los del bake se da por igual; si
+        el tamaño cambió está desactualizado; si solo cambió el mtime se hashea.
+        En un build congelado (PyInstaller) el bundle no cambia y al extraerlo todos
+        los mtime son nuevos: se confía en el manifest sin hashear.
+        """
+        try:
+            with open(os.path.join(BAKED_DIR, "manifest.json"), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception:
+            return
+        rate = self.mixer_params[0]
+        frozen = getattr(sys, "frozen", False)
+        for kind, sources, index in (("sounds", self.sfx_sources, self._sfx_index),
+                                     ("music", self.music_sources, self._music_index)):
+            for key, entry in (manifest.get(kind) or {}).items():
+                src = sources.get(key)
+                if not src or entry.get("rate", rate) != rate:
+                    continue
+                path = os.path.join(BAKED_DIR, entry.get("file", ""))
+                try:
+                    # Original modificado sin volver a hornear: usar el original
+                    st = os.stat(src)
+                    if st.st_size != entry.get("source_size") or not os.path.isfile(path):
+                        continue
+                    if (not frozen and st.st_mtime_ns != entry.get("source_mtime_ns")
+                            and file_sha1(src) != entry.get("sha1")):
+                        continue
+                except OSError:
+                    continue
+                index[key] = path
+
+    # ================= Mixer =================
+    def _ensure_mixer(self) -> bool:
+        """Abrir el mixer la primera vez que algo realmente va a sonar.
+
+        Una sesión con música y SFX apagados nunca abre el dispositivo de audio.
+        pre_init se aplica justo antes de init para que el buffer pedido tenga efecto.
+        """
+        if pygame.mixer.get_init() is None:
+            if self._mixer_failed:
+                return False
+            try:
+                with trace.span("mixer.init", "audio"):
+                    pygame.mixer.pre_init(*self.mixer_params)
+                    pygame.mixer.init()
+            except Exception as e:
+                # Continuar sin audio si falla (y no reintentar en cada sonido)
+                print(f"[Audio] Mixer init failed: {e}")
+                self._mixer_failed = True
+                return False
+            # Formato real que abrió SDL (el buffer no se puede consultar: se informa el pedido)
+            freq, _, channels = pygame.mixer.get_init()
+            buf = self.mixer_params[3]
+            print(f"[Audio] Mixer '{self.audio_profile}': {freq} Hz, {channels} ch, "
+                  f"buffer {buf} (~{buf * 1000.0 / freq:.1f} ms)")
+        if not self._voices_ready:
+            self._setup_voices()
+        if self._prewarm_pending:
+            names, self._prewarm_pending = self._prewarm_pending, None
+            self._submit_prewarm(names)
+        return True
+
+    # ================= Voces (canales por categoría) =================
+    def _setup_voices(self) -> None:
+        """Repartir los canales del mixer entre los grupos de VOICE_POOLS.
+
+        Todos quedan reservados: SDL nunca elige canal por su cuenta, siempre lo
+        asigna _allocate_channel según la categoría del sonido.
+        """
+        self._voices_ready = True
+        total = sum(len(ids) for ids in self._pool_channels.values())
+        # Más dos canales para la música (crossfade entre la pista saliente y la entrante)
+        music_ids = [total, total + 1]
+        total += 2
+        try:
+            pygame.mixer.set_num_channels(total)
+            pygame.mixer.set_reserved(total)
+            self._channels = [pygame.mixer.Channel(i) for i in range(total)]
+            self._music_channel_ids = music_ids
+        except Exception as e:
+            print(f"[Audio] Voice pools disabled: {e}")
+            self._channels = []
+
+    def _category_for(self, name: str, category: Optional[str], loop: bool) -> str:
+        if category in self._pool_channels:
+            return category
+        if loop:
+            return "loops"
+        return self._sfx_category.get(name.lower(), "gameplay")
+
+    def _allocate_channel(self, category: str) -> Optional[int]:
+        """Canal para una voz nueva de `category`, o None si se descarta.
+
+        Política: 1) canal libre del propio grupo; 2) canal libre de un grupo de menor
+        prioridad (préstamo); 3) si el grupo lo permite, cortar su voz más vieja;
+        si no, descartar el sonido nuevo. Solo se cortan voces de igual o menor
+        prioridad que no sean loops: un canal propio prestado a un stinger o al loop
+        de pasos sigue siendo de ellos hasta que terminen.
+        """
+        channels = self._channels
+        own = self._pool_channels[category]
+        for i in own:
+            if not channels[i].get_busy():
+                return i
+        priority = VOICE_POOLS[category].priority
+        for other, pool in sorted(VOICE_POOLS.items(), key=lambda kv: kv[1].priority):
+            if pool.priority >= priority:
+                break
+            for i in self._pool_channels[other]:
+                if not channels[i].get_busy():
+                    self.voice_stats[f"{category}.borrow"] += 1
+                    return i
+        if VOICE_POOLS[category].steal_oldest:
+            victims = [i for i in own if self._can_steal(category, self._voice_owner.get(i, category))]
+            if victims:
+                self.voice_stats[f"{category}.steal"] += 1
+                return min(victims, key=lambda i: self._voice_started.get(i, 0.0))
+        self.voice_stats[f"{category}.drop"] += 1
+        return None
+
+    @staticmethod
+    def _can_steal(category: str, owner: str) -> bool:
+        return owner != "loops" and VOICE_POOLS[owner].priority <= VOICE_POOLS[category].priority
+
+    def _play_voice(self, snd, category: str, *, loops: int = 0, maxtime: int = 0, fade_ms: int = 0):
+        """Reproducir en un canal del grupo. Devuelve el Channel o None."""
+        if not self._channels or category not in self._pool_channels:
+            return snd.play(loops=loops, maxtime=maxtime, fade_ms=fade_ms)
+        i = self._allocate_channel(category)
+        if i is None:
+            return None
+        ch = self._channels[i]
+        ch.set_volume(1.0)
+        ch.play(snd, loops=loops, maxtime=maxtime, fade_ms=fade_ms)
+        self._voice_started[i] = self._clock()
+        self._voice_owner[i] = category
+        return ch
+
+    def channel_usage(self) -> Dict[str, Tuple[int, int]]:
+        """Voces ocupadas / canales por categoría (para el HUD)."""
+        usage = {}
+        for category, ids in self._pool_channels.items():
+            busy = 0
+            if self._channels:
+                busy = sum(1 for i in ids if self._channels[i].get_busy())
+            usage[category] = (busy, len(ids))
+        return usage
+
+    def _set_music_volume(self, vol: float) -> None:
+        if self._music_channel is not None:
+            self._music_channel.set_volume(vol)
 
     # ================= Volumen/habilitar =================
+    def _cached_sounds(self):
+        """SFX cargados más sus bancos de variantes (todos llevan el volumen de SFX)."""
+        sounds = list(self._sfx.values())
+        for bank in list(self._variants.values()):
+            sounds.extend(bank)
+        return sounds
+
     def set_enabled(self, enabled: bool):
         self.master_enabled = bool(enabled)
         vol = self.master_volume if self.master_enabled else 0.0
-        pygame.mixer.music.set_volume(self.music_volume * vol)
-        for s in self._sfx.values():
+        self._set_music_volume(self.music_volume * vol)
+        for s in self._cached_sounds():
             try:
                 s.set_volume(self.sfx_volume * vol)
             except Exception:
@@ -100,10 +383,7 @@ class SoundManager:
     def set_music_enabled(self, enabled: bool):
         self.music_enabled = bool(enabled)
         if not self.music_enabled:
-            try:
-                pygame.mixer.music.stop()
-            except Exception:
-                pass
+            self.stop_music(fade_ms=0)
 
     def set_sfx_enabled(self, enabled: bool):
         self.sfx_enabled = bool(enabled)
@@ -127,15 +407,15 @@ class SoundManager:
         else:
             # Restore volumes on cached SFX so next plays have correct loudness
             try:
-                for s in self._sfx.values():
+                for s in self._cached_sounds():
                     s.set_volume(self.sfx_volume * self.master_volume)
             except Exception:
                 pass
 
     def set_master_volume(self, v: float):
         self.master_volume = max(0.0, min(1.0, v))
-        pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-        for s in self._sfx.values():
+        self._set_music_volume(self.music_volume * self.master_volume)
+        for s in self._cached_sounds():
             try:
                 s.set_volume(self.sfx_volume * self.master_volume)
             except Exception:
@@ -146,13 +426,67 @@ class SoundManager:
             except Exception:
                 pass
 
+    def apply_settings(self, data: dict) -> None:
+        """Aplicar los ajustes guardados (settings.json) sin abrir el mixer."""
+        data = data or {}
+        self.set_audio_profile(
+            data.get("audio_profile", DEFAULT_AUDIO_PROFILE),
+            buffer=data.get("audio_buffer"),
+            frequency=data.get("audio_frequency"),
+            channels=data.get("audio_channels"),
+        )
+        # "audio" es la clave vieja (un solo On/Off); music/sfx la pisan si están
+        legacy = data.get("audio", "On")
+        self.music_enabled = str(data.get("music", legacy)) == "On"
+        self.sfx_enabled = str(data.get("sfx", legacy)) == "On"
+        for key, setter in (("music_volume", self.set_music_volume), ("sfx_volume", self.set_sfx_volume)):
+            try:
+                setter(float(data.get(key, 0.8)))
+            except Exception:
+                pass
+
+    def set_audio_profile(self, name: str, buffer=None, frequency=None, channels=None) -> bool:
+        """Elegir el formato del mixer: un perfil de AUDIO_PROFILES, con overrides opcionales.
+
+        Solo tiene efecto si el mixer todavía no se abrió (se abre en el primer sonido);
+        con el mixer abierto el cambio queda para el próximo arranque. Devuelve si se aplicó.
+        """
+        profile = AUDIO_PROFILES.get(name) or AUDIO_PROFILES.get(DEFAULT_AUDIO_PROFILE)
+        if profile is None:
+            return False
+        freq, chans, buf = profile.frequency, profile.channels, profile.buffer
+        try:
+            if frequency:
+                freq = max(11025, min(96000, int(frequency)))
+            if channels:
+                chans = 1 if int(channels) == 1 else 2
+            if buffer:
+                # SDL redondea a potencia de 2; pedirla así para que el valor medido sea el real
+                buf = 1 << (max(64, min(8192, int(buffer))).bit_length() - 1)
+        except (TypeError, ValueError):
+            pass
+        params = (freq, -16, chans, buf)
+        name = name if name in AUDIO_PROFILES else DEFAULT_AUDIO_PROFILE
+        if params != self.mixer_params and pygame.mixer.get_init() is not None:
+            print(f"[Audio] Perfil '{name}' se aplica al reiniciar el juego")
+            return False
+        self.audio_profile = name
+        rate_changed = freq != self.mixer_params[0]
+        self.mixer_params = params
+        if rate_changed:
+            # Los WAV horneados solo sirven a la frecuencia del mixer
+            self._sfx_index = dict(self.sfx_sources)
+            self._music_index = dict(self.music_sources)
+            self._apply_baked()
+        return True
+
     def set_music_volume(self, v: float):
         self.music_volume = max(0.0, min(1.0, v))
-        pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
+        self._set_music_volume(self.music_volume * self.master_volume)
 
     def set_sfx_volume(self, v: float):
         self.sfx_volume = max(0.0, min(1.0, v))
-        for s in self._sfx.values():
+        for s in self._cached_sounds():
             try:
                 s.set_volume(self.sfx_volume * self.master_volume)
             except Exception:
@@ -168,41 +502,82 @@ class SoundManager:
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self._cfg_events = dict(data.get("events", {}))
-                self._cfg_music = dict(data.get("music", {}))
-                self._cfg_scenes = dict(data.get("scenes", {}))
+                    self._set_config(json.load(f))
         except Exception as e:
             print(f"[Audio] Failed to load audio_config.json: {e}")
 
+    def _set_config(self, data: dict) -> None:
+        self._cfg_events = dict(data.get("events", {}))
+        self._cfg_music = dict(data.get("music", {}))
+        self._cfg_scenes = dict(data.get("scenes", {}))
+        self._cfg_variants = {k.lower(): v for k, v in dict(data.get("variants", {})).items()}
+
     # ================= SFX =================
     def _load_sfx(self, name: str):
         if name in self._sfx:
             return self._sfx[name]
-        path = _find_file(os.path.abspath(self.sounds_dir), name, self.sfx_exts)
+        if name in self._missing_sfx:
+            return None
+        fut = self._prewarm_futures.pop(name, None)
+        if fut is not None and not fut.cancel():
+            # El prewarm ya la está decodificando: esperar solo a esa
+            return fut.result()
+        return self._decode_sfx(name)
+
+    def _decode_sfx(self, name: str):
+        path = self._sfx_index.get(name.lower())
         if not path:
-            if not self._missing_logged.get(name):
-                print(f"[Audio] SFX missing: {name}")
-                self._missing_logged[name] = True
+            self._missing_sfx.add(name)
+            print(f"[Audio] SFX missing: {name}")
             return None
         try:
-            snd = pygame.mixer.Sound(path)
+            t0 = time.perf_counter()
+            with trace.span("Sound.load", "audio", {"name": name}):
+                snd = pygame.mixer.Sound(path)
             snd.set_volume(self.sfx_volume * self.master_volume)
+            spec = self._cfg_variants.get(name.lower())
+            if spec:
+                # Se genera una sola vez, en el hilo de prewarm si la escena lo lista
+                with trace.span("Sound.variants", "audio", {"name": name}):
+                    bank = variants.make_variants(
+                        snd, int(spec.get("count", 4)), float(spec.get("pitch_cents", 0)),
+                        float(spec.get("gain_db", 0)), seed=name)
+                # make_sound crea las variantes a volumen 1.0: heredan el del original
+                for v in bank:
+                    v.set_volume(snd.get_volume())
+                self._variants[name] = bank
+            nbytes = pcm_bytes(snd) + sum(pcm_bytes(v) for v in self._variants.get(name) or [] if v is not snd)
+            self.telemetry.record_decode(name, (time.perf_counter() - t0) * 1000.0, nbytes)
             self._sfx[name] = snd
             return snd
         except Exception as e:
-            if not self._missing_logged.get(name):
-                print(f"[Audio] Failed to load SFX {name}: {e}")
-                self._missing_logged[name] = True
+            self._missing_sfx.add(name)
+            print(f"[Audio] Failed to load SFX {name}: {e}")
             return None
 
+    def _next_variant(self, name: str, snd):
+        """Round-robin sobre el banco de variantes del SFX (o el sonido tal cual)."""
+        bank = self._variants.get(name)
+        if not bank:
+            return snd
+        i = self._variant_next.get(name, 0)
+        self._variant_next[name] = (i + 1) % len(bank)
+        return bank[i]
+
     def play_sfx(self, name: str, *, volume: Optional[float] = None, loop: bool = False,
-                  maxtime: int = 0, fade_ms: int = 0) -> None:
+                  maxtime: int = 0, fade_ms: int = 0, category: Optional[str] = None) -> None:
         if not (self.master_enabled and self.sfx_enabled):
             return
+        if name in self._missing_sfx:
+            self.telemetry.misses[name] += 1
+            return
+        if not self._ensure_mixer():
+            return
         snd = self._load_sfx(name)
         if not snd:
+            self.telemetry.misses[name] += 1
             return
+        snd = self._next_variant(name, snd)
         # Compute final volume as: (event/direct volume or 1.0) * sfx_volume * master_volume
         base = 1.0 if volume is None else max(0.0, min(1.0, volume))
         final_vol = base * self.sfx_volume * self.master_volume
@@ -212,7 +587,9 @@ class SoundManager:
             pass
         loops = -1 if loop else 0
         try:
-            snd.play(loops=loops, maxtime=maxtime, fade_ms=fade_ms)
+            if self._play_voice(snd, self._category_for(name, category, loop),
+                                loops=loops, maxtime=maxtime, fade_ms=fade_ms) is not None:
+                self.telemetry.sound_plays[name] += 1
         except Exception:
             pass
 
@@ -225,14 +602,35 @@ class SoundManager:
         if not cfg:
             return
         files = cfg.get("files") or []
-        if not files:
+        if not files or not (self.master_enabled and self.sfx_enabled):
+            return
+        if not self._cooldown_ok(event_name):
             return
+        self._count_event(event_name)
         name = random.choice(files) if len(files) > 1 else files[0]
         eff_event_vol = cfg.get("volume", 1.0) if volume is None else max(0.0, min(1.0, volume))
         eff_loop = bool(cfg.get("loop", False)) if loop is None else bool(loop)
         fade_ms = int(max(0, fade_in or 0))
         # pass base event volume; play_sfx will scale by global sfx/master
-        self.play_sfx(name, volume=eff_event_vol, loop=eff_loop, fade_ms=fade_ms)
+        self.play_sfx(name, volume=eff_event_vol, loop=eff_loop, fade_ms=fade_ms,
+                      category=cfg.get("category"))
+
+    def _cooldown_ok(self, key: str) -> bool:
+        """False (y cuenta la supresión) si el evento sonó hace menos que su cooldown."""
+        cooldown = self._cooldowns.get(key)
+        if not cooldown:
+            return True
+        now = self._clock()
+        last = self._last_event_play.get(key)
+        if last is not None and now - last < cooldown:
+            self.suppressed[key] += 1
+            return False
+        self._last_event_play[key] = now
+        return True
+
+    def _count_event(self, key: str) -> None:
+        """Un evento pasó el cooldown y se va a reproducir."""
+        self.telemetry.event_plays[key] += 1
 
     def play_sfx_once(self, name: str, **kwargs) -> None:
         if self._played_once.get(name):
@@ -244,18 +642,27 @@ class SoundManager:
     def start_loop_sfx(self, name: str, *, volume: Optional[float] = None, fade_ms: int = 100) -> None:
         if not (self.master_enabled and self.sfx_enabled):
             return
+        if name in self._missing_sfx:
+            self.telemetry.misses[name] += 1
+            return
+        if not self._ensure_mixer():
+            return
         ch = self._loop_channels.get(name)
         if ch is not None and ch.get_busy():
             return
         snd = self._load_sfx(name)
         if not snd:
+            self.telemetry.misses[name] += 1
             return
+        snd = self._next_variant(name, snd)
         try:
-            ch = snd.play(loops=-1, fade_ms=max(0, fade_ms))
+            ch = self._play_voice(snd, self._category_for(name, "loops", True), loops=-1, fade_ms=max(0, fade_ms))
             if ch is not None:
                 base = 1.0 if volume is None else max(0.0, min(1.0, volume))
                 ch.set_volume(base * self.sfx_volume * self.master_volume)
                 self._loop_channels[name] = ch
+                self.telemetry.sound_plays[name] += 1
+                self.telemetry.loop_started(name)
         except Exception:
             pass
 
@@ -271,89 +678,156 @@ class SoundManager:
         except Exception:
             pass
         self._loop_channels.pop(name, None)
+        self.telemetry.loop_stopped(name)
 
     # ================= Música =================
+    # La música se decodifica a un Sound en un hilo aparte y suena en dos canales propios
+    # que se alternan, para poder hacer crossfade sin bloquear el hilo principal.
     def play_music(self, name: str, *, volume: Optional[float] = None, loop: bool = True,
                    fade_ms: int = 600) -> None:
         if not self.master_enabled or not self.music_enabled:
             return
-        path = _find_file(os.path.abspath(self.music_dir), name, self.music_exts)
+        if name == self._music_target:
+            # Ya suena (o se está preparando): no reiniciar
+            return
+        path = self._music_index.get(name.lower())
         if not path:
+            self.telemetry.misses[f"music:{name}"] += 1
             if not self._missing_logged.get(f"music:{name}"):
                 print(f"[Audio] Music missing: {name}")
                 self._missing_logged[f"music:{name}"] = True
+            self.stop_music(fade_ms=fade_ms)
+            return
+        if not self._ensure_mixer():
             return
+        vol = self.music_volume if volume is None else max(0.0, min(1.0, volume))
+        self._music_target = name
+        self._music_request = (name, vol, -1 if loop else 0, max(0, fade_ms))
+        if name not in self._music_sounds and name not in self._music_jobs:
+            if self._music_pool is None:
+                self._music_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-music")
+            self._music_jobs[name] = self._music_pool.submit(self._decode_music, name, path)
+        self.update()
+
+    def _decode_music(self, name: str, path: str):
+        t0 = time.perf_counter()
+        with trace.span("music.load", "audio", {"name": name}):
+            snd = pygame.mixer.Sound(path)
+        self.telemetry.record_decode(f"music:{name}", (time.perf_counter() - t0) * 1000.0, pcm_bytes(snd))
+        return snd
+
+    def update(self) -> None:
+        """Llamar una vez por frame: arranca la pista pedida cuando el worker la tiene lista."""
+        if self._channels and self.telemetry.sample_due():
+            music_busy = sum(1 for ch in self._music_channels() if ch.get_busy())
+            self.telemetry.sample_channels(self.channel_usage(), music_busy)
+        for name, fut in list(self._music_jobs.items()):
+            if not fut.done():
+                continue
+            del self._music_jobs[name]
+            try:
+                self._music_sounds[name] = fut.result()
+            except Exception as e:
+                if not self._missing_logged.get(f"music:{name}"):
+                    print(f"[Audio] Failed to play music {name}: {e}")
+                    self._missing_logged[f"music:{name}"] = True
+                if self._music_target == name:
+                    self._music_target = self._current_music
+                    self._music_request = None
+        req = self._music_request
+        ch = self._music_channel
+        if req is None and ch is not None and not ch.get_busy():
+            # Una pista sin loop terminó sola: ya no suena nada, play_music(name) la vuelve a arrancar
+            self._music_channel = None
+            self._current_music = None
+            self._music_target = None
+        if req is None or req[0] not in self._music_sounds:
+            return
+        self._music_request = None
+        name, vol, loops, fade_ms = req
+        self._crossfade_to(name, vol, loops, fade_ms)
+
+    def _crossfade_to(self, name: str, vol: float, loops: int, fade_ms: int) -> None:
+        old = self._music_channel
         try:
-            if fade_ms > 0:
-                try:
-                    pygame.mixer.music.fadeout(fade_ms)
-                except Exception:
-                    pass
-            pygame.mixer.music.load(path)
-            vol = self.music_volume if volume is None else max(0.0, min(1.0, volume))
-            pygame.mixer.music.set_volume(vol * self.master_volume)
-            loops = -1 if loop else 0
-            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+            if old is not None and old.get_busy():
+                if fade_ms > 0:
+                    old.fadeout(fade_ms)
+                else:
+                    old.stop()
+            if self._music_channel_ids:
+                self._music_slot ^= 1
+                ch = self._channels[self._music_channel_ids[self._music_slot]]
+            else:
+                ch = pygame.mixer.find_channel(True)
+            # El volumen del canal es el destino del fade-in
+            ch.set_volume(vol * self.master_volume)
+            ch.play(self._music_sounds[name], loops=loops, fade_ms=fade_ms)
+            self._music_channel = ch
             self._current_music = name
         except Exception as e:
-            if not self._missing_logged.get(f"music:{name}"):
-                print(f"[Audio] Failed to play music {name}: {e}")
-                self._missing_logged[f"music:{name}"] = True
+            print(f"[Audio] Failed to play music {name}: {e}")
+            self._music_target = None
+            return
+        # Conservar solo la pista actual y la que se está desvaneciendo
+        previous = self._music_keep
+        self._music_keep = name
+        for other in list(self._music_sounds):
+            if other not in (name, previous):
+                del self._music_sounds[other]
 
     def stop_music(self, *, fade_ms: int = 400):
-        try:
-            if fade_ms > 0:
-                pygame.mixer.music.fadeout(fade_ms)
-            else:
-                pygame.mixer.music.stop()
-        except Exception:
-            pass
+        self._music_target = None
+        self._music_request = None
+        ch = self._music_channel
+        if ch is not None:
+            try:
+                if fade_ms > 0:
+                    ch.fadeout(fade_ms)
+                else:
+                    ch.stop()
+            except Exception:
+                pass
+        self._music_channel = None
         self._current_music = None
 
-    def stop_all(self, *, fade_ms_music: int = 300, fade_ms_sfx: int = 120) -> None:
-        """Stop all audio: music and SFX (including loop channels)."""
-        # Stop music
-        self.stop_music(fade_ms=fade_ms_music)
-        # Stop looped SFX channels
+    def stop_loops(self, *, fade_ms: int = 120) -> None:
+        """Stop looped SFX channels (e.g. walking)."""
         try:
             for name, ch in list(self._loop_channels.items()):
                 try:
-                    if fade_ms_sfx > 0:
-                        ch.fadeout(fade_ms_sfx)
+                    if fade_ms > 0:
+                        ch.fadeout(fade_ms)
                     else:
                         ch.stop()
                 except Exception:
                     pass
+                self.telemetry.loop_stopped(name)
             self._loop_channels.clear()
         except Exception:
             pass
-        # Stop any one-shot SFX
+
+    def stop_all(self, *, fade_ms_music: int = 300, fade_ms_sfx: int = 120) -> None:
+        """Stop all audio: music and SFX (including loop channels)."""
+        self.stop_music(fade_ms=fade_ms_music)
+        self.stop_loops(fade_ms=fade_ms_sfx)
+        # Stop any one-shot SFX (pygame has no global fade; best effort: immediate stop)
         try:
-            if fade_ms_sfx > 0:
-                # pygame has no global fade; best effort: immediate stop
-                pygame.mixer.stop()
-            else:
+            for ch in self._channels:
+                if ch not in self._music_channels():
+                    ch.stop()
+            if not self._channels:
                 pygame.mixer.stop()
         except Exception:
             pass
 
     def stop_music_and_loops(self, *, fade_ms_music: int = 300, fade_ms_sfx: int = 120) -> None:
         """Stop only music and looped SFX, preserve one-shot SFX currently playing."""
-        # Stop music
         self.stop_music(fade_ms=fade_ms_music)
-        # Stop looped SFX channels
-        try:
-            for name, ch in list(self._loop_channels.items()):
-                try:
-                    if fade_ms_sfx > 0:
-                        ch.fadeout(fade_ms_sfx)
-                    else:
-                        ch.stop()
-                except Exception:
-                    pass
-            self._loop_channels.clear()
-        except Exception:
-            pass
+        self.stop_loops(fade_ms=fade_ms_sfx)
+
+    def _music_channels(self):
+        return [self._channels[i] for i in self._music_channel_ids]
 
     # Música por nombre desde JSON
     def play_music_name(self, music_name: str, *, volume: Optional[float] = None,
@@ -379,6 +853,124 @@ class SoundManager:
         music_key = cfg.get("music")
         if music_key:
             self.play_music_name(music_key)
+        self.prewarm_scene(scene_name)
+
+    def scene_music(self, scene_name: Optional[str]) -> Optional[str]:
+        """Clave de música (de "music") que declara la escena, si hay."""
+        return (self._cfg_scenes.get(scene_name) or {}).get("music") if scene_name else None
+
+    def _scene_sfx_names(self, cfg: dict) -> Set[str]:
+        names = set(cfg.get("sfx") or [])
+        for event_name in cfg.get("events") or []:
+            names.update((self._cfg_events.get(event_name) or {}).get("files") or [])
+        return names
+
+    def prewarm_scene(self, scene_name: str) -> None:
+        """Decodificar en segundo plano los SFX de la escena y liberar los que no usa.
+
+        La escena declara "events" (de audio_config.json) y/o "sfx" (nombres de archivo).
+        Los sonidos de otras escenas se liberan salvo que estén sonando.
+        Si el mixer todavía no está abierto no se abre para esto: el prewarm queda
+        pendiente hasta que algo suene (ver _ensure_mixer).
+        """
+        cfg = self._cfg_scenes.get(scene_name) or {}
+        if "events" not in cfg and "sfx" not in cfg:
+            return
+        names = self._scene_sfx_names(cfg)
+        self._release_unused(names)
+        self._prewarm_pending = None
+        if not names or not (self.master_enabled and self.sfx_enabled):
+            return
+        if pygame.mixer.get_init() is None:
+            self._prewarm_pending = names
+            return
+        self._submit_prewarm(names)
+
+    def _submit_prewarm(self, names: Set[str]) -> None:
+        if not (self.master_enabled and self.sfx_enabled):
+            return
+        if self._prewarm_pool is None:
+            self._prewarm_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-prewarm")
+        for name in sorted(names):
+            if name not in self._sfx and name not in self._prewarm_futures and name not in self._missing_sfx:
+                self._prewarm_futures[name] = self._prewarm_pool.submit(self._decode_sfx, name)
+
+    def _release_unused(self, keep: Set[str]) -> None:
+        for name, fut in list(self._prewarm_futures.items()):
+            if fut.done() or (name not in keep and fut.cancel()):
+                self._prewarm_futures.pop(name, None)
+        for name, snd in list(self._sfx.items()):
+            if name in keep or name in self._loop_channels or name in self._prewarm_futures:
+                continue
+            try:
+                if any(s.get_num_channels() > 0 for s in self._variants.get(name) or [snd]):
+                    continue  # p.ej. el stinger de victoria al pasar a WinScreen
+            except Exception:
+                pass
+            del self._sfx[name]
+            self._variants.pop(name, None)
+
+    # ================= Telemetría =================
+    def resident_bytes(self) -> Dict[str, int]:
+        """Bytes de PCM cargados ahora: SFX en cache (con variantes) y música decodificada."""
+        resident = {}
+        for name, snd in list(self._sfx.items()):
+            resident[name] = self.telemetry.sound_bytes.get(name) or pcm_bytes(snd)
+        for name, snd in list(self._music_sounds.items()):
+            key = f"music:{name}"
+            resident[key] = self.telemetry.sound_bytes.get(key) or pcm_bytes(snd)
+        return resident
+
+    def stats(self) -> dict:
+        """Todo lo medido en la sesión (se vuelca a logs/audio_stats.json al salir)."""
+        data = self.telemetry.as_dict(self.resident_bytes())
+        data["suppressed"] = dict(self.suppressed.most_common())
+        data["voices"] = dict(self.voice_stats)
+        data["profile"] = {"name": self.audio_profile, "mixer": list(self.mixer_params),
+                           "open": pygame.mixer.get_init() is not None}
+        return data
+
+    def dump_stats(self, path: Optional[str] = None) -> Optional[str]:
+        """Escribir stats() como JSON (por defecto logs/audio_stats.json) e imprimir un resumen."""
+        try:
+            data = self.stats()
+            if path is None:
+                from settings_store import logs_dir
+                path = os.path.join(logs_dir(), "audio_stats.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+        except Exception as e:
+            print(f"[Audio] No se pudieron guardar las estadísticas: {e}")
+            return None
+        print(f"[Audio] {sum(data['sound_plays'].values())} reproducciones, "
+              f"{sum(data['suppressed'].values())} suprimidas, {sum(data['misses'].values())} faltantes, "
+              f"carga {data['decode_ms_total']:.0f} ms, residente {data['resident_bytes_total'] // 1024} KB "
+              f"-> {path}")
+        return path
+
+    # ================= Validación =================
+    def validate(self) -> List[str]:
+        """Contrastar audio_config.json con los archivos indexados. Lista vacía = todo OK."""
+        problems = []
+        for event_name, cfg in sorted(self._cfg_events.items()):
+            missing = [f for f in cfg.get("files") or [] if f.lower() not in self._sfx_index]
+            if missing:
+                problems.append(f"event '{event_name}': missing {', '.join(missing)}")
+        for music_name, cfg in sorted(self._cfg_music.items()):
+            file = cfg.get("file") or music_name
+            if file.lower() not in self._music_index:
+                problems.append(f"music '{music_name}': missing {file}")
+        for scene_name, cfg in sorted(self._cfg_scenes.items()):
+            music_key = cfg.get("music")
+            if music_key and music_key not in self._cfg_music:
+                problems.append(f"scene '{scene_name}': unknown music '{music_key}'")
+            for event_name in cfg.get("events") or []:
+                if event_name not in self._cfg_events:
+                    problems.append(f"scene '{scene_name}': unknown event '{event_name}'")
+            for name in cfg.get("sfx") or []:
+                if name.lower() not in self._sfx_index:
+                    problems.append(f"scene '{scene_name}': missing sfx {name}")
+        return problems
 
     # ================= Utilidades =================
     def play_random(self, base_name: str, count: int, **kwargs):
@@ -389,13 +981,17 @@ class SoundManager:
     def get(cls) -> Optional["SoundManager"]:
         return getattr(cls, "_instance", None)
 
+
     # ================= API Declarativa (limpia) =================
     def play_event(self, event, *, volume: Optional[float] = None, loop: Optional[bool] = None) -> None:
         if not SOUND_MAP or event not in SOUND_MAP:
             return
         spec: SoundDef = SOUND_MAP[event]
-        if not spec.names:
+        if not spec.names or not (self.master_enabled and self.sfx_enabled):
             return
+        if not self._cooldown_ok(event.name.lower()):
+            return
+        self._count_event(event.name.lower())
         name = random.choice(spec.names) if len(spec.names) > 1 else spec.names[0]
         eff_vol = spec.volume if volume is None else max(0.0, min(1.0, volume))
         eff_loop = spec.loop if loop is None else bool(loop)
@@ -410,3 +1006,19 @@ class SoundManager:
         eff_loop = spec.loop if loop is None else bool(loop)
         eff_fade = spec.fade_ms if fade_ms is None else int(max(0, fade_ms))
         self.play_music(spec.name, volume=eff_vol, loop=eff_loop, fade_ms=eff_fade)
+
+
+def create_sound_manager(backend: Optional[str] = None,
+                         clock: Optional[Callable[[], float]] = None) -> SoundManager:
+    """SoundManager según `backend` o CHEESEGATES_AUDIO: "mixer" (por defecto) o "null".
+
+    "null" (audio/null_backend.py) no abre el dispositivo ni decodifica nada: registra
+    cada play/stop/música en memoria, para corridas headless y benchmarks.
+    """
+    backend = (backend or os.environ.get("CHEESEGATES_AUDIO") or "mixer").strip().lower()
+    if backend == "null":
+        from .null_backend import NullSoundManager
+        return NullSoundManager(clock=clock)
+    if backend != "mixer":
+        print(f"[Audio] Backend desconocido '{backend}', usando mixer")
+    return SoundManager(clock=clock)
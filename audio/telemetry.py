@@ -0,0 +1,106 @@
+"""
+Telemetría de audio: cuánto suena, cuánto cuesta cargar y cuánta memoria ocupa.
+
+SoundManager la alimenta en cada reproducción / carga / loop y la expone con
+SoundManager.stats(); al salir del juego se vuelca a logs/audio_stats.json.
+Todo son contadores y diccionarios chicos: no hay costo apreciable por frame.
+"""
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+from typing import Callable, Dict, Tuple
+
+from perf.frame_stats import percentile
+
+
+def pcm_bytes(snd) -> int:
+    """Bytes de PCM que ocupa un Sound en el formato del mixer (sin copiar el buffer)."""
+    try:
+        import pygame
+        freq, size, channels = pygame.mixer.get_init()
+        return int(round(snd.get_length() * freq)) * (abs(size) // 8) * channels
+    except Exception:
+        return 0
+
+
+class AudioTelemetry:
+    # Muestreo de canales ocupados: cada SAMPLE_EVERY s, últimas SAMPLES muestras (~5 min)
+    SAMPLE_EVERY = 0.5
+    SAMPLES = 600
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._t0 = clock()
+        self.event_plays = Counter()   # evento de audio_config.json / SfxEvent -> disparos
+        self.sound_plays = Counter()   # archivo -> reproducciones que consiguieron voz
+        self.misses = Counter()        # archivo (o "music:<nombre>") pedido y no encontrado
+        self.decode_ms: Dict[str, float] = {}   # archivo -> ms de carga (+ banco de variantes)
+        self.sound_bytes: Dict[str, int] = {}   # archivo -> bytes de PCM (incluye variantes)
+        self.loop_lifetimes: Dict[str, list] = {}  # loop -> [veces, total s, máx s]
+        self._loop_started: Dict[str, float] = {}
+        self.busy_samples = deque(maxlen=self.SAMPLES)  # (t, canales SFX ocupados, música)
+        self.busy_peak = Counter()     # categoría -> máximo de voces ocupadas a la vez
+        self._next_sample = 0.0
+
+    # ---- Registro ----
+    def record_decode(self, name: str, ms: float, nbytes: int) -> None:
+        self.decode_ms[name] = ms
+        self.sound_bytes[name] = nbytes
+
+    def loop_started(self, name: str) -> None:
+        self._loop_started[name] = self._clock()
+
+    def loop_stopped(self, name: str) -> None:
+        t = self._loop_started.pop(name, None)
+        if t is None:
+            return
+        dur = self._clock() - t
+        entry = self.loop_lifetimes.setdefault(name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += dur
+        entry[2] = max(entry[2], dur)
+
+    def sample_due(self) -> bool:
+        return self._clock() >= self._next_sample
+
+    def sample_channels(self, usage: Dict[str, Tuple[int, int]], music_busy: int) -> None:
+        now = self._clock()
+        self._next_sample = now + self.SAMPLE_EVERY
+        total = 0
+        for category, (busy, _) in usage.items():
+            total += busy
+            if busy > self.busy_peak[category]:
+                self.busy_peak[category] = busy
+        self.busy_samples.append((round(now - self._t0, 2), total, music_busy))
+
+    # ---- Reporte ----
+    def as_dict(self, resident: Dict[str, int]) -> dict:
+        """`resident`: archivo -> bytes de lo que sigue cargado ahora mismo."""
+        busy = sorted(s[1] for s in self.busy_samples)
+        loops = {
+            name: {"count": n, "total_s": round(total, 2), "max_s": round(longest, 2)}
+            for name, (n, total, longest) in sorted(self.loop_lifetimes.items())
+        }
+        # Loops que siguen sonando al pedir el reporte
+        now = self._clock()
+        for name, t in self._loop_started.items():
+            loops.setdefault(name, {"count": 0, "total_s": 0.0, "max_s": 0.0})["playing_s"] = round(now - t, 2)
+        return {
+            "uptime_s": round(now - self._t0, 2),
+            "event_plays": dict(self.event_plays.most_common()),
+            "sound_plays": dict(self.sound_plays.most_common()),
+            "misses": dict(self.misses.most_common()),
+            "decode_ms": {k: round(v, 2) for k, v in sorted(self.decode_ms.items(), key=lambda kv: -kv[1])},
+            "decode_ms_total": round(sum(self.decode_ms.values()), 2),
+            "resident_bytes": dict(sorted(resident.items(), key=lambda kv: -kv[1])),
+            "resident_bytes_total": sum(resident.values()),
+            "loop_lifetimes": loops,
+            "busy_channels": {
+                "peak_by_category": dict(self.busy_peak),
+                "p50": percentile(busy, 50),
+                "p95": percentile(busy, 95),
+                "max": busy[-1] if busy else 0,
+                "samples": list(self.busy_samples),
+            },
+        }
@@ -0,0 +1,55 @@
+"""
+Bancos de variantes de un SFX (pitch y ganancia) generados una sola vez con NumPy.
+
+Cada variante es un pygame.mixer.Sound ya remuestreado: reproducirla no cuesta DSP.
+El pitch se cambia remuestreando (como acelerar/frenar una cinta, así que también
+cambia un poco la duración), lo que alcanza para SFX cortos y loops de pasos.
+
+NumPy es opcional: sin NumPy, make_variants devuelve solo el sonido original.
+"""
+from __future__ import annotations
+
+import random
+from typing import List
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+
+def make_variants(snd: pygame.mixer.Sound, count: int, pitch_cents: float = 0.0,
+                  gain_db: float = 0.0, seed: str = "") -> List[pygame.mixer.Sound]:
+    """Generar `count` variantes repartidas en ±pitch_cents y ±gain_db.
+
+    El orden del banco se mezcla de forma determinística (por `seed`) para que el
+    round-robin no suene como una escala.
+    """
+    if np is None or count <= 1:
+        return [snd]
+    samples = pygame.sndarray.array(snd)
+    mono = samples.ndim == 1
+    limits = np.iinfo(samples.dtype)
+    src = samples.astype(np.float32).reshape(samples.shape[0], -1)
+    n = src.shape[0]
+    steps = np.linspace(-1.0, 1.0, count)
+    # Desfasar la ganancia respecto del pitch para no correlacionarlos
+    gain_steps = np.roll(steps, count // 2)
+    bank = []
+    for pitch_t, gain_t in zip(steps, gain_steps):
+        ratio = 2.0 ** (pitch_t * pitch_cents / 1200.0)
+        gain = 10.0 ** (gain_t * gain_db / 20.0)
+        positions = np.arange(0.0, n - 1, ratio, dtype=np.float64)
+        out = np.empty((positions.size, src.shape[1]), dtype=np.float32)
+        for c in range(src.shape[1]):
+            out[:, c] = np.interp(positions, np.arange(n), src[:, c])
+        out *= gain
+        np.clip(out, limits.min, limits.max, out=out)
+        pcm = out.astype(samples.dtype)
+        if mono:
+            pcm = pcm[:, 0]
+        bank.append(pygame.sndarray.make_sound(np.ascontiguousarray(pcm)))
+    random.Random(seed).shuffle(bank)
+    return bank
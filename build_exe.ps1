@@ -91,6 +91,13 @@ if ($isRelease -or -not $SkipDeps) {
     Write-Host "Skipping dependency install (SkipDeps enabled)." -ForegroundColor Yellow
 }
 
+# Bake audio to fast-loading formats (assets/baked, skipped when sources are unchanged)
+Write-Host "Baking audio..."
+& "$python" tools\bake_audio.py
+if ($LASTEXITCODE -ne 0) {
+    Write-Host "Audio bake failed; the build will use the source audio files." -ForegroundColor Yellow
+}
+
 # Collect data files (auto-add new top-level images + known folders)
 # PyInstaller --add-data needs src;dest with ; on Windows
 $datas = @(
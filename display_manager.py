@@ -0,0 +1,122 @@
+"""
+Gestor central de la ventana (pygame.display).
+
+- Es el único lugar que llama a pygame.display.set_mode.
+- Tras cada cambio de modo re-convierte las superficies cacheadas que se hayan
+  registrado (incluido el canvas lógico) al formato nativo de la nueva ventana.
+  Una superficie con formato distinto al del display obliga a SDL a convertir
+  píxel a píxel en cada blit.
+- Avisa del cambio a los listeners registrados y publica un evento
+  DISPLAY_CHANGED en la cola de pygame.
+"""
+import weakref
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+# Evento propio que reciben las pantallas (handle_event) tras un cambio de modo.
+# Atributos: size (tamaño real de la ventana) y flags.
+DISPLAY_CHANGED = pygame.event.custom_type()
+
+
+def _format_matches(surf: pygame.Surface, display: pygame.Surface) -> bool:
+    """True si una superficie opaca ya tiene el formato del display."""
+    return (
+        surf.get_bitsize() == display.get_bitsize()
+        and surf.get_masks()[:3] == display.get_masks()[:3]
+    )
+
+
+def reconvert(surf: pygame.Surface) -> pygame.Surface:
+    """Devuelve la superficie convertida al formato actual del display.
+
+    Respeta el alpha por píxel (convert_alpha) y evita la copia si una superficie
+    opaca ya está en el formato nativo.
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return surf
+    if surf.get_flags() & pygame.SRCALPHA:
+        return surf.convert_alpha()
+    if _format_matches(surf, display):
+        return surf
+    return surf.convert()
+
+
+class DisplayManager:
+    def __init__(self):
+        self.surface: Optional[pygame.Surface] = None
+        self.flags = 0
+        # (ref al dueño, atributo, factory opcional)
+        self._tracked: List[Tuple[weakref.ref, str, Optional[Callable[[], pygame.Surface]]]] = []
+        self._listeners: List[Callable[[pygame.Surface], None]] = []
+
+    # ================= Registro =================
+    def track(self, owner, *attrs: str, factory: Optional[Callable[[], pygame.Surface]] = None) -> None:
+        """Registrar atributos de superficie de `owner` para re-convertirlos tras un cambio de modo.
+
+        Si se pasa `factory`, en lugar de convertir se reemplaza el atributo por
+        una superficie nueva (útil para buffers que se redibujan cada frame, como el canvas).
+        El dueño se guarda con weakref: las pantallas descartadas salen solas del registro.
+        """
+        ref = weakref.ref(owner)
+        for attr in attrs:
+            self._tracked.append((ref, attr, factory))
+
+    def add_listener(self, callback: Callable[[pygame.Surface], None]) -> None:
+        """callback(surface) se llama después de cada cambio de modo."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[pygame.Surface], None]) -> None:
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    # ================= Modo de ventana =================
+    def set_mode(self, size, flags: int = 0, *, reinit: bool = False) -> pygame.Surface:
+        """Cambiar el modo de la ventana y propagar el nuevo formato.
+
+        reinit=True reinicia el subsistema de video antes (fallback cuando set_mode falla).
+        """
+        if reinit:
+            pygame.display.quit()
+            pygame.display.init()
+        self.surface = pygame.display.set_mode(size, flags)
+        self.flags = flags
+        self._reconvert_tracked()
+        self._broadcast()
+        return self.surface
+
+    def _reconvert_tracked(self) -> None:
+        alive = []
+        for ref, attr, factory in self._tracked:
+            owner = ref()
+            if owner is None:
+                continue
+            alive.append((ref, attr, factory))
+            try:
+                if factory is not None:
+                    setattr(owner, attr, factory())
+                    continue
+                surf = getattr(owner, attr, None)
+                if isinstance(surf, pygame.Surface):
+                    setattr(owner, attr, reconvert(surf))
+            except Exception as e:
+                print(f"[Display] No se pudo re-convertir {type(owner).__name__}.{attr}: {e}")
+        self._tracked = alive
+
+    def _broadcast(self) -> None:
+        for cb in list(self._listeners):
+            try:
+                cb(self.surface)
+            except Exception as e:
+                print(f"[Display] Listener falló: {e}")
+        try:
+            pygame.event.post(pygame.event.Event(DISPLAY_CHANGED, {
+                "size": self.surface.get_size(),
+                "flags": self.flags,
+            }))
+        except Exception:
+            pass
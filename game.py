@@ -1,38 +1,143 @@
 import sys
 import os
+import time
+from collections import deque
 import pygame
-from settings_store import load_settings
-from audio.sound_manager import SoundManager
+from asset_loader import AssetLoader
+from settings_store import load_settings, logs_dir
+from audio.sound_manager import create_sound_manager
+from display_manager import DisplayManager
+from perf import counters, trace
+from perf.blit_probe import BlitProbe
+from perf.frame_stats import FrameStats
+from perf.gc_policy import GCPolicy
+from perf.latency import InputLatencyTracker
+from perf.profiler import FrameProfiler
+from perf.startup import STARTUP
+from perf.watchdog import HitchWatchdog
+from ui.perf_hud import PerfHUD
 
 
 class Game:
     # Resolución lógica fija del juego (no cambia). Todo el contenido se dibuja aquí.
     WIDTH, HEIGHT = 1920, 1080
 
-    def __init__(self):
-        pygame.init()
-        # Inicializar mixer con configuración segura
-        try:
-            pygame.mixer.pre_init(44100, -16, 2, 512)
-        except Exception:
-            pass
-        try:
-            pygame.mixer.init()
-        except Exception:
-            # Continuar sin audio si falla
-            pass
+    def __init__(self, audio_backend=None):
+        # Contadores de blits/transforms/fuentes por frame: con CHEESEGATES_COUNTERS=1 desde el
+        # arranque (antes de crear cualquier fuente); si no, recién al abrir el HUD (F3)
+        if os.environ.get("CHEESEGATES_COUNTERS", "0") not in ("", "0"):
+            counters.install()
+        # Timeline Chrome trace-event (CHEESEGATES_TRACE=1 o ruta .json)
+        trace.configure_from_env()
+        # Arranque por etapas: solo video y fuentes antes del primer frame.
+        # pygame.init() abriría además el dispositivo de audio y joysticks.
+        with STARTUP.phase("pygame.display/font init"):
+            self._init_core_modules()
+        # Decodificación en segundo plano del splash completo y del menú
+        self.assets = AssetLoader()
         pygame.display.set_caption("Cheese Gates")
+        # Todos los cambios de modo pasan por el DisplayManager
+        self.display = DisplayManager()
+        self.display.add_listener(self._on_display_changed)
 
         # Cargar ajustes previos (si existen)
-        saved = load_settings() or {}
+        with STARTUP.phase("load_settings"):
+            saved = load_settings() or {}
+
+        self.last_windowed_size = (1280, 720)
+        with STARTUP.phase("display.set_mode"):
+            self._open_initial_window(saved)
+        # Primer pixel en pantalla: splash mínimo pre-horneado (splash-boot.jpg)
+        with STARTUP.phase("boot splash"):
+            self.boot_splash = self._present_boot_frame()
+        # Splash completo ya convertido (lo guarda el primer SplashScreen y lo reusan los siguientes)
+        self.splash_bg = None
+        self.display.track(self, "splash_bg")
+        self.assets.preload("splash.png", (self.WIDTH, self.HEIGHT))
+        self.assets.preload("button.png")
+
+        # Modo debug: instrumentar los blits sobre el canvas (CHEESEGATES_BLIT_PROBE=1)
+        self.blit_probe = BlitProbe.from_env()
+
+        # Superficie lógica (canvas) donde se dibuja todo a 1920x1080.
+        self.canvas = self._make_canvas()
+        # Tras un cambio de modo el canvas se recrea en el formato nativo de la nueva ventana
+        self.display.track(self, "canvas", factory=self._make_canvas)
+
+        self.clock = pygame.time.Clock()
+        self.current_screen = None
+        self.render_scale = 1.0
+        self.render_offset = (0, 0)
+        # Gestor de sonido ("mixer", o "null" para corridas headless: CHEESEGATES_AUDIO=null)
+        with STARTUP.phase("SoundManager"):
+            self.audio = create_sound_manager(audio_backend)
+            # Música/SFX y volúmenes guardados; el mixer se abre recién al primer sonido
+            self.audio.apply_settings(saved)
+        self._audio_deferred = True
+
+        # Estadísticas de frame + HUD (F3 mostrar/ocultar, F4 volcar CSV)
+        self.frame_stats = FrameStats(capacity=600)
+        self.perf_hud = PerfHUD(self.frame_stats)
+        # Título con FPS: como mucho 1 vez por segundo; CHEESEGATES_TITLE_FPS=0 lo desactiva
+        self.title_fps = os.environ.get("CHEESEGATES_TITLE_FPS", "1") != "0"
+        self._next_title_update = 0.0
+
+        # Watchdog de frames largos -> logs/hitches.log (CHEESEGATES_WATCHDOG_MS, 0 = off)
+        self.watchdog = HitchWatchdog.from_env(context=lambda: type(self.current_screen).__name__)
+        # F9: perfilar los próximos N frames con cProfile (CHEESEGATES_PROFILE_FRAMES)
+        self.profiler = FrameProfiler.from_env()
+
+        # GC: freeze tras construir pantallas, sin gc automático durante el gameplay
+        self.gc_policy = GCPolicy()
+        self._screen_changed = False
+        self.perf_hud.add_line_provider(self._gc_hud_line)
+
+        # Latencia input -> flip (HUD, columna input_ms del CSV y resumen al salir)
+        self.input_latency = InputLatencyTracker()
+        self.perf_hud.add_line_provider(self.input_latency.describe)
+
+        # Voces de audio por categoría (ocupadas/canales) y robos/descartes
+        self.perf_hud.add_line_provider(self._audio_hud_line)
+
+        # Etapas que se ejecutan de a una por frame, ya con frames presentándose
+        self._boot_steps = deque([("audio", self._boot_audio)])
+
+    def _init_core_modules(self):
+        pygame.display.init()
+        pygame.font.init()
+        # Timer de SDL: sin pygame.init() get_ticks() queda en 0 y no coincide con
+        # event.timestamp. set_timer inicializa el subsistema; luego se desactiva.
+        pygame.time.set_timer(pygame.USEREVENT, 60000)
+        pygame.time.set_timer(pygame.USEREVENT, 0)
 
+    def _present_boot_frame(self):
+        """Pintar splash-boot.jpg en la ventana y presentarlo. Devuelve la imagen (o None)."""
+        try:
+            img = pygame.image.load("splash-boot.jpg").convert()
+        except Exception:
+            return None
+        window_w, window_h = self.screen.get_size()
+        scale = min(window_w / self.WIDTH, window_h / self.HEIGHT)
+        size = (max(1, int(self.WIDTH * scale)), max(1, int(self.HEIGHT * scale)))
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(pygame.transform.smoothscale(img, size),
+                         ((window_w - size[0]) // 2, (window_h - size[1]) // 2))
+        pygame.display.flip()
+        return img
+
+    def _boot_audio(self):
+        # La música de la pantalla actual se difirió hasta tener frames en pantalla.
+        # El mixer lo abre SoundManager con el primer sonido (nunca, si el audio está apagado).
+        self._audio_deferred = False
+        self._start_scene_audio(self.current_screen)
+
+    def _open_initial_window(self, saved):
         # Ventana inicial por defecto: Pantalla Completa
         # Si hay ajustes guardados, aplicarlos; si no, iniciar en FULLSCREEN.
-        self.last_windowed_size = (1280, 720)
         try:
             if saved.get("window_mode") == "Ventana":
                 os.environ["SDL_VIDEO_CENTERED"] = "1"
-                self.screen = pygame.display.set_mode(self.last_windowed_size, pygame.RESIZABLE)
+                self.screen = self.display.set_mode(self.last_windowed_size, pygame.RESIZABLE)
             elif saved.get("window_mode") == "Ventana Sin bordes":
                 # Usar resolución guardada si existe; si coincide con el escritorio, ocuparlo
                 res = saved.get("resolution", "1920x1080")
@@ -43,52 +148,87 @@ class Game:
                 info = pygame.display.Info()
                 if w == info.current_w and h == info.current_h:
                     os.environ["SDL_VIDEO_WINDOW_POS"] = "0,0"
-                    self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.NOFRAME)
+                    self.screen = self.display.set_mode((info.current_w, info.current_h), pygame.NOFRAME)
                 else:
                     os.environ["SDL_VIDEO_CENTERED"] = "1"
-                    self.screen = pygame.display.set_mode((w, h), pygame.NOFRAME)
+                    self.screen = self.display.set_mode((w, h), pygame.NOFRAME)
             else:
                 # Default FULLSCREEN
-                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                self.screen = self.display.set_mode((0, 0), pygame.FULLSCREEN)
         except Exception:
             # Fallback seguro
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.screen = self.display.set_mode((0, 0), pygame.FULLSCREEN)
 
-        # Superficie lógica (canvas) donde se dibuja todo a 1920x1080.
-        self.canvas = pygame.Surface((self.WIDTH, self.HEIGHT)).convert_alpha()
+    def _make_canvas(self):
+        canvas = pygame.Surface((self.WIDTH, self.HEIGHT)).convert_alpha()
+        if getattr(self, "blit_probe", None):
+            return self.blit_probe.wrap(canvas)
+        if counters.installed():
+            # CountingSurface: cuenta los blits del frame para el HUD
+            return counters.CountingSurface.like(canvas)
+        return canvas
 
-        self.clock = pygame.time.Clock()
-        self.current_screen = None
-        self.render_scale = 1.0
-        self.render_offset = (0, 0)
-        # Gestor de sonido
-        self.audio = SoundManager()
+    def _toggle_perf_hud(self):
+        if not counters.installed():
+            counters.install()
+            if not isinstance(self.canvas, counters.CountingSurface):
+                # El canvas pasa a contar blits desde el próximo frame
+                self.canvas = self._make_canvas()
+                self._on_display_changed(self.screen)
+        self.perf_hud.toggle()
+
+    def _on_display_changed(self, surface):
+        """Mantener las referencias de la pantalla actual tras un cambio de modo."""
+        self.screen = surface
+        if getattr(self, "current_screen", None) is not None and hasattr(self, "canvas"):
+            self.current_screen.screen = self.canvas
+            self.current_screen.window = surface
 
+    @trace.traced("change_screen", "screen")
     def change_screen(self, screen):
-        # Stop any ongoing audio to avoid overlaps when switching screens
+        # Stop looped effects to avoid overlap; one-shot SFX (e.g., win/lose stingers) keep playing.
+        # La música no se corta acá: _start_scene_audio hace crossfade a la pista de la
+        # nueva pantalla (o nada si es la misma) o la desvanece si no declara ninguna.
         try:
             if getattr(self, "audio", None):
-                # Preserve currently playing one-shot SFX (e.g., win/lose stingers)
-                # but stop music and looped effects to avoid overlap.
-                self.audio.stop_music_and_loops(fade_ms_music=250, fade_ms_sfx=120)
+                self.audio.stop_loops(fade_ms=120)
         except Exception:
             pass
         self.current_screen = screen
+        # La política de GC actúa al final del frame, cuando la pantalla anterior ya no está en el stack
+        self._screen_changed = True
+        self._start_scene_audio(screen)
+
+    def _start_scene_audio(self, screen):
         # Start scene music for the new screen if declared
         try:
-            if getattr(self, "audio", None):
+            if getattr(self, "audio", None) and not self._audio_deferred:
+                scene_key = getattr(screen, "scene_key", None)
                 # Prefer explicit music name if provided
-                if hasattr(screen, "scene_music_name") and screen.scene_music_name:
-                    self.audio.play_music_name(screen.scene_music_name)
-                elif hasattr(screen, "scene_key") and screen.scene_key:
-                    self.audio.enter_scene(screen.scene_key)
+                music = getattr(screen, "scene_music_name", None) or self.audio.scene_music(scene_key)
+                if music:
+                    self.audio.play_music_name(music)
+                else:
+                    self.audio.stop_music(fade_ms=250)
+                if scene_key:
+                    self.audio.prewarm_scene(scene_key)
         except Exception:
             pass
 
     def run(self):
         running = True
+        frame = 0
+        # CHEESEGATES_EXIT_AFTER_FIRST_FRAME=1: medir el arranque y salir (tools/bench_startup.py)
+        exit_after_first = os.environ.get("CHEESEGATES_EXIT_AFTER_FIRST_FRAME", "0") == "1"
+        if self.watchdog:
+            self.watchdog.start()
         while running:
             dt = self.clock.tick(120) / 1000.0
+            if self.watchdog:
+                self.watchdog.beat()
+            self.profiler.begin_frame()
+            t_start = time.perf_counter()
+            counters.COUNTERS.reset()
 
             # Calcular escala y offset (letterboxing) ANTES de manejar eventos
             window_w, window_h = self.screen.get_size()
@@ -101,11 +241,21 @@ class Game:
             self.render_offset = (x_off, y_off)
 
             for event in pygame.event.get():
+                self.input_latency.on_event(event)
                 if event.type == pygame.QUIT:
                     running = False
                 # Atajo global: F11 alterna entre pantalla completa y ventana
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
                     self._toggle_fullscreen()
+                # Debug: F3 HUD de rendimiento, F4 volcar estadísticas de frame a CSV
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self._toggle_perf_hud()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    path = self.frame_stats.dump_csv(logs_dir())
+                    if path:
+                        print(f"[Perf] Estadísticas de frame guardadas en {path}")
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                    self.profiler.request(self._profile_tag())
                 elif self.current_screen:
                     # Transformar eventos de mouse a coordenadas lógicas del canvas
                     if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
@@ -127,11 +277,18 @@ class Game:
                                 'button': event.button
                             })
                     self.current_screen.handle_event(event)
+            t_events = time.perf_counter()
 
             if self.current_screen:
                 self.current_screen.update(dt)
+            # Música: arrancar/crossfade cuando el worker terminó de preparar la pista
+            self.audio.update()
+            t_update = time.perf_counter()
+            if self.current_screen:
                 # Dibujar en el canvas lógico
                 self.current_screen.draw()
+            t_draw = time.perf_counter()
+            blits, transforms, font_renders = counters.COUNTERS.snapshot()
 
             # Escalar con letterboxing al tamaño de la ventana para evitar deformaciones
             # Fondo negro (bandas) y blit centrado
@@ -140,14 +297,84 @@ class Game:
                 scaled = pygame.transform.smoothscale(self.canvas, (scaled_w, scaled_h))
                 self.screen.blit(scaled, (x_off, y_off))
 
-            pygame.display.set_caption(
-                f"Cheese Gates  |  FPS: {int(self.clock.get_fps()):>3}"
-            )
+            self.perf_hud.draw(self.screen)
+
+            # set_caption pasa por el gestor de ventanas: no hacerlo en cada frame
+            if self.title_fps and t_draw >= self._next_title_update:
+                pygame.display.set_caption(
+                    f"Cheese Gates  |  FPS: {int(self.clock.get_fps()):>3}"
+                )
+                self._next_title_update = t_draw + 1.0
             pygame.display.flip()
+            t_present = time.perf_counter()
+            if frame == 0:
+                STARTUP.first_frame()
+                if exit_after_first:
+                    running = False
+            elif self._boot_steps:
+                name, step = self._boot_steps.popleft()
+                with STARTUP.phase(f"boot:{name}"), trace.span(f"boot:{name}", "boot"):
+                    step()
 
+            input_ms = self.input_latency.on_present(t_present)
+            gc_ms, gc_collections = self.gc_policy.take_frame_stats()
+            self.frame_stats.push((
+                frame, t_start - self.frame_stats.t0,
+                (t_events - t_start) * 1000.0, (t_update - t_events) * 1000.0,
+                (t_draw - t_update) * 1000.0, (t_present - t_draw) * 1000.0,
+                (t_present - t_start) * 1000.0, dt * 1000.0,
+                blits, transforms, font_renders, gc_ms, gc_collections,
+                input_ms,
+            ))
+            if trace.TRACER.enabled:
+                trace.complete("frame", t_start, t_present, "frame", {"n": frame})
+                trace.complete("events", t_start, t_events, "frame")
+                trace.complete("update", t_events, t_update, "frame")
+                trace.complete("draw", t_update, t_draw, "frame")
+                trace.complete("present", t_draw, t_present, "frame")
+            # GC en puntos seguros: después de cambiar de pantalla o en frames con margen
+            if self._screen_changed:
+                self._screen_changed = False
+                self.gc_policy.on_screen_ready()
+            else:
+                gameplay = bool(self.current_screen and self.current_screen.is_gameplay_active())
+                self.gc_policy.on_frame_end(gameplay, (t_present - t_start) * 1000.0)
+            frame += 1
+            self.profiler.end_frame()
+            if self.blit_probe:
+                self.blit_probe.end_frame()
+
+        if self.watchdog:
+            self.watchdog.stop()
+        self.input_latency.print_summary()
+        self.audio.dump_stats()
+        self.assets.shutdown()
         pygame.quit()
         sys.exit()
 
+    def _gc_hud_line(self):
+        p = self.gc_policy
+        mode = "gameplay (manual)" if p.gameplay else "auto"
+        return (f"gc {mode}  pausas {p.collections}  total {p.total_pause_ms:.1f} ms  "
+                f"max {p.max_pause_ms:.2f} ms")
+
+    def _audio_hud_line(self):
+        usage = self.audio.channel_usage()
+        stats = self.audio.voice_stats
+        voices = "  ".join(f"{cat} {busy}/{total}" for cat, (busy, total) in usage.items())
+        steals = sum(v for k, v in stats.items() if k.endswith(".steal"))
+        drops = sum(v for k, v in stats.items() if k.endswith(".drop"))
+        kb = sum(self.audio.resident_bytes().values()) // 1024
+        return f"voces {voices}  robos {steals}  descartes {drops}  cache {kb} KB"
+
+    def _profile_tag(self):
+        """Etiqueta para capturas de perfil: pantalla actual y nivel (si aplica)."""
+        tag = type(self.current_screen).__name__ if self.current_screen else "NoScreen"
+        level = getattr(self.current_screen, "level", None)
+        if level is not None:
+            tag += f"-L{level}"
+        return tag
+
     def _toggle_fullscreen(self):
         """Alternar entre modo pantalla completa (FULLSCREEN) y ventana (RESIZABLE).
         - Si no estamos en FULLSCREEN: guardar tamaño actual y pasar a FULLSCREEN.
@@ -161,15 +388,15 @@ class Game:
             # Volver a ventana
             os.environ["SDL_VIDEO_CENTERED"] = "1"
             try:
-                self.screen = pygame.display.set_mode(self.last_windowed_size, pygame.RESIZABLE)
+                self.screen = self.display.set_mode(self.last_windowed_size, pygame.RESIZABLE)
             except Exception:
-                self.screen = pygame.display.set_mode((1280, 720), pygame.RESIZABLE)
+                self.screen = self.display.set_mode((1280, 720), pygame.RESIZABLE)
         else:
             # Guardar tamaño actual de ventana (en ventana o borderless)
             self.last_windowed_size = self.screen.get_size()
             try:
-                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                self.screen = self.display.set_mode((0, 0), pygame.FULLSCREEN)
             except Exception:
                 # Fallback a fullscreen a la resolución actual de escritorio
                 info = pygame.display.Info()
-                self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+                self.screen = self.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
@@ -0,0 +1,269 @@
+# generator.py
+# -----------------------------------------------------------------------------
+# Generador procedural de niveles en el formato de LEVELS (level_logic.py).
+#
+# Cada candidato sale de una semilla: se sortean piedras, inputs (threshold /
+# invert) y un árbol AND/OR/NOT que usa cada input una vez. Después se verifica
+# con el solver (logic/solver.py) y se puntúa:
+#
+#     score = piedras de la solución mínima + bits de "suerte"
+#     bits  = -log2(soluciones / formas de repartir las piedras en los inputs)
+#
+# (los niveles 1-4 dan ~2.1, ~11.8, ~9.6 y ~7.6). Se acepta si tiene solución, si
+# no se resuelve sin piedras y si el score cae en el rango de la dificultad pedida.
+#
+# generate_levels() reparte la generación + verificación en un pool de procesos
+# por bloques de semillas. Las semillas de cada bloque dependen solo de `seed` y
+# del número de bloque, así que la salida es la misma con 1 o N workers.
+# -----------------------------------------------------------------------------
+
+import json
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .solver import _free_ways, solve
+
+
+@dataclass(frozen=True)
+class Difficulty:
+    label: str
+    inputs: Tuple[int, int]        # rango de cantidad de inputs
+    stones: Tuple[int, int]        # rango de cantidad de piedras
+    max_weight: int                # peso máximo de una piedra
+    not_prob: float                # probabilidad de un NOT sobre cada nodo del árbol
+    invert_prob: float             # probabilidad de que un input sea invert=True
+    score: Tuple[float, float]     # rango aceptado de score [min, max)
+    time_base: float               # time_limit = base + por piedra de la solución mínima
+    time_per_stone: float
+
+
+DIFFICULTIES: Dict[str, Difficulty] = {
+    "easy": Difficulty("Fácil", (2, 3), (4, 6), 6, 0.10, 0.10, (1.5, 6.0), 60.0, 10.0),
+    "normal": Difficulty("Normal", (3, 5), (6, 9), 9, 0.20, 0.20, (6.0, 10.0), 45.0, 6.0),
+    "hard": Difficulty("Difícil", (4, 6), (8, 12), 12, 0.25, 0.20, (10.0, 16.0), 35.0, 5.0),
+}
+DEFAULT_DIFFICULTY = "normal"
+
+# Candidatos por bloque de trabajo (fijo: no depende de la cantidad de workers)
+CHUNK = 64
+
+
+# -----------------------------------------------------------------------------
+# CANDIDATOS
+# -----------------------------------------------------------------------------
+
+def _random_tree(rng: random.Random, leaves: List[Any], not_prob: float) -> Any:
+    """Árbol AND/OR que usa cada hoja una vez, con NOT sueltos (nunca NOT(NOT(x)))."""
+    if len(leaves) == 1:
+        node = leaves[0]
+    else:
+        # 2 o 3 hijos, cada uno con al menos una hoja
+        k = min(len(leaves), rng.choice((2, 2, 3)))
+        cuts = sorted(rng.sample(range(1, len(leaves)), k - 1))
+        groups = [leaves[a:b] for a, b in zip([0] + cuts, cuts + [len(leaves)])]
+        node = {"op": rng.choice(("AND", "OR")), "args": [_random_tree(rng, g, not_prob) for g in groups]}
+    if rng.random() < not_prob:
+        return {"op": "NOT", "args": [node]}
+    return node
+
+
+def _negated_leaves(node: Any, out: List[bool]) -> None:
+    if isinstance(node, int):
+        return
+    for arg in node["args"]:
+        if node["op"] == "NOT" and isinstance(arg, int):
+            out[arg] = True
+        else:
+            _negated_leaves(arg, out)
+
+
+def random_level(rng: random.Random, difficulty: Difficulty) -> Dict[str, Any]:
+    """Un candidato (sin verificar) en el formato de LEVELS, sin time_limit."""
+    n_stones = rng.randint(*difficulty.stones)
+    stones = [rng.randint(1, difficulty.max_weight) for _ in range(n_stones)]
+    top_two = sum(sorted(stones, reverse=True)[:2])
+
+    n_inputs = rng.randint(*difficulty.inputs)
+    inputs = []
+    for _ in range(n_inputs):
+        # Threshold alcanzable con dos piedras; en los invert solo se muestra
+        inputs.append({"threshold": rng.randint(1, top_two), "invert": rng.random() < difficulty.invert_prob})
+
+    leaves = list(range(n_inputs))
+    rng.shuffle(leaves)
+    circuit = _random_tree(rng, leaves, difficulty.not_prob)  # n_inputs >= 2: la raíz nunca es una hoja
+
+    cfg: Dict[str, Any] = {"inputs": inputs, "circuit": circuit, "stones": stones}
+    # Inputs negados directamente en el árbol: se muestran invertidos tras TEST (como el nivel 4)
+    negated = [False] * n_inputs
+    _negated_leaves(circuit, negated)
+    if any(negated):
+        cfg["display_invert"] = negated
+    return cfg
+
+
+def score_level(cfg: Dict[str, Any], capacity: int = 2) -> Optional[Tuple[float, int, int]]:
+    """(score, piedras de la solución mínima, soluciones), o None si no tiene solución
+    o si el conteo no entró en el presupuesto del solver."""
+    result = solve(cfg, capacity=capacity, count=True)
+    if not result.solvable or result.count_capped:
+        return None
+    return _score(cfg, result.stones_used, result.count, capacity), result.stones_used, result.count
+
+
+def _placements(cfg: Dict[str, Any], capacity: int) -> int:
+    """Formas de repartir las piedras del nivel en sus inputs, encienda o no el circuito."""
+    stones = cfg["stones"]
+    values = sorted(set(stones))
+    return _free_ways(len(cfg["inputs"]), tuple(stones.count(v) for v in values), capacity)
+
+
+def _score(cfg: Dict[str, Any], stones_used: int, solutions: int, capacity: int) -> float:
+    return stones_used - math.log2(solutions / _placements(cfg, capacity))
+
+
+def _candidate_seed(seed: int, index: int) -> str:
+    return f"{seed}:{index}"
+
+
+def _generate_chunk(seed: int, chunk: int, difficulty_name: str, capacity: int):
+    """Genera y verifica los CHUNK candidatos del bloque `chunk` (corre en un worker).
+
+    Devuelve (aceptados [(índice, score, cfg)], motivos de rechazo).
+    """
+    difficulty = DIFFICULTIES[difficulty_name]
+    lo, hi = difficulty.score
+    accepted, rejected = [], Counter()
+    for index in range(chunk * CHUNK, (chunk + 1) * CHUNK):
+        rng = random.Random(_candidate_seed(seed, index))
+        cfg = random_level(rng, difficulty)
+        # Primero lo barato: solución mínima sin contar. score >= piedras mínimas,
+        # así que los que ya se pasan del rango no llegan al conteo (lo caro).
+        quick = solve(cfg, capacity=capacity, count=False)
+        if not quick.solvable:
+            rejected["unsolvable"] += 1
+            continue
+        used = quick.stones_used
+        if used == 0:
+            rejected["no_stones"] += 1
+            continue
+        if used >= hi:
+            rejected["too_hard"] += 1
+            continue
+        # score < lo  <=>  soluciones > placements * 2^(used - lo): se cuenta solo hasta ahí
+        limit = int(_placements(cfg, capacity) * 2.0 ** (used - lo))
+        counted = solve(cfg, capacity=capacity, count_limit=limit)
+        solutions = counted.count
+        if solutions > limit:
+            rejected["too_easy"] += 1
+            continue
+        if counted.count_capped:
+            rejected["count_budget"] += 1  # conteo demasiado caro: no se puede puntuar
+            continue
+        score = _score(cfg, used, solutions, capacity)
+        if score >= hi:
+            rejected["too_hard"] += 1
+            continue
+        tl = difficulty.time_base + difficulty.time_per_stone * used
+        cfg["time_limit"] = float(5 * round(tl / 5))
+        accepted.append((index, round(score, 2), cfg))
+    return accepted, dict(rejected)
+
+
+# -----------------------------------------------------------------------------
+# GENERACIÓN EN PARALELO
+# -----------------------------------------------------------------------------
+
+def _level_key(cfg: Dict[str, Any]) -> str:
+    return json.dumps([cfg["inputs"], cfg["circuit"], sorted(cfg["stones"])], sort_keys=True)
+
+
+def generate_levels(count: int, difficulty: str = DEFAULT_DIFFICULTY, seed: int = 0,
+                    workers: Optional[int] = None, capacity: int = 2,
+                    max_chunks: int = 10000) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Genera `count` niveles verificados de la dificultad pedida.
+
+    workers: procesos del pool (None = os.cpu_count(); 0 o 1 = en este proceso).
+    Devuelve (niveles en orden de semilla, estadísticas: candidatos, rechazos, score por nivel).
+    """
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(f"Dificultad desconocida: {difficulty!r} (opciones: {', '.join(DIFFICULTIES)})")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    levels: List[Dict[str, Any]] = []
+    scores: List[float] = []
+    seen = set()
+    rejected = Counter()
+    chunks_done = 0
+
+    def collect(results: Iterable) -> bool:
+        nonlocal chunks_done
+        for accepted, why in results:
+            chunks_done += 1
+            rejected.update(why)
+            for _, score, cfg in accepted:
+                key = _level_key(cfg)
+                if key in seen:
+                    rejected["duplicate"] += 1
+                    continue
+                seen.add(key)
+                levels.append(cfg)
+                scores.append(score)
+                if len(levels) >= count:
+                    return True
+        return False
+
+    # Se piden oleadas de bloques y se consumen en orden (map), así el resultado
+    # no depende de qué worker terminó primero.
+    if workers <= 1:
+        chunk = 0
+        while chunk < max_chunks and not collect([_generate_chunk(seed, chunk, difficulty, capacity)]):
+            chunk += 1
+    else:
+        wave = workers * 4
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            start = 0
+            while start < max_chunks:
+                stop = min(start + wave, max_chunks)
+                batch = range(start, stop)
+                n = len(batch)
+                if collect(pool.map(_generate_chunk, [seed] * n, batch, [difficulty] * n, [capacity] * n)):
+                    break
+                start = stop
+
+    stats = {
+        "candidates": chunks_done * CHUNK,
+        "accepted": len(levels),
+        "rejected": dict(rejected),
+        "scores": scores,
+    }
+    if len(levels) < count:
+        print(f"[Generator] Solo {len(levels)}/{count} niveles '{difficulty}' en {chunks_done * CHUNK} candidatos")
+    return levels, stats
+
+
+# -----------------------------------------------------------------------------
+# ARCHIVOS
+# -----------------------------------------------------------------------------
+
+def write_levels(path: str, levels: List[Dict[str, Any]], first: int = 1) -> Dict[int, Dict[str, Any]]:
+    """Guarda los niveles como JSON {"<número>": cfg} (mismo formato que LEVELS)."""
+    numbered = {first + i: cfg for i, cfg in enumerate(levels)}
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({str(k): v for k, v in numbered.items()}, f, ensure_ascii=False, indent=1)
+    return numbered
+
+
+def read_levels(path: str) -> Dict[int, Dict[str, Any]]:
+    """Lee un JSON de write_levels() con claves int, listo para mezclar con LEVELS."""
+    with open(path, "r", encoding="utf-8") as f:
+        return {int(k): v for k, v in json.load(f).items()}
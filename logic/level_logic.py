@@ -4,7 +4,13 @@
 # Además, define qué piedras (pesos) spawnean por nivel.
 # -----------------------------------------------------------------------------
 
-from typing import Any, Dict, List, Tuple
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
 
 # Si un nivel no especifica "stones", se usa este default
 DEFAULT_STONES: List[int] = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
@@ -124,55 +130,225 @@ def get_stone_weights(level_num: int) -> List[int]:
     return list(LEVELS.get(level_num, {}).get("stones", DEFAULT_STONES))
 
 # -----------------------------------------------------------------------------
-# EVALUACIÓN
+# COMPILACIÓN
+# -----------------------------------------------------------------------------
+# Cada nivel se valida y se compila una sola vez (compile_level, cacheado):
+#   - program: arreglo plano de instrucciones (op, slots). Los slots 0..n-1 son los
+#     bits de los inputs; cada instrucción agrega un slot y el último es la salida.
+#   - closures generadas (input_bits, circuit, solves) con los thresholds y el árbol
+#     ya "desenrollados" en una expresión de Python, sin recorrer dicts al evaluar.
 # -----------------------------------------------------------------------------
 
-def _bit_from_weight(total_weight: int, rule: Dict[str, Any]) -> int:
-    """Convierte el peso total de un input a bit (0/1) según la regla."""
-    invert = bool(rule.get("invert", False))
-    if invert:
-        # NOT: cuenta 1 SOLO si hay 0 piedras
-        return 1 if total_weight == 0 else 0
-    # Normal: 1 si total_piedras >= threshold
-    threshold = int(rule.get("threshold", 0))
-    return 1 if total_weight >= threshold else 0
+class Op(IntEnum):
+    NOT = 0
+    AND = 1
+    OR = 2
+
+
+Instr = Tuple[Op, Tuple[int, ...]]
+
+# Anidamiento máximo de la expresión generada: el parser de Python no acepta más de
+# ~200 paréntesis anidados. Los árboles más profundos se evalúan con run_program.
+MAX_EXPR_DEPTH = 100
+
+
+class CompiledCircuit:
+    """Circuito de un nivel listo para evaluar muchas veces.
+
+    Atributos:
+        n_inputs: cantidad de inputs del nivel.
+        thresholds / inverts: regla de cada input (invert=True → 1 solo con 0 piedras).
+        program: instrucciones (op, slots de entrada) en orden de evaluación.
+        output: slot con la salida (el de la última instrucción, o un input si el
+                circuito es un input suelto).
+        input_bits(weights) -> List[int]: bits por input a partir de los pesos.
+        circuit(bits) -> int: salida del circuito (0/1) para esos bits.
+        solves(weights) -> bool: pesos → salida directamente (con cortocircuito).
+        (con árboles más profundos que MAX_EXPR_DEPTH, circuit y solves usan run_program)
+    """
+
+    __slots__ = ("n_inputs", "thresholds", "inverts", "program", "output",
+                 "input_bits", "circuit", "solves", "source")
+
+    def __init__(self, rules: List[Dict[str, Any]], tree: Any):
+        self.n_inputs = len(rules)
+        self.thresholds = tuple(int(r.get("threshold", 0)) for r in rules)
+        self.inverts = tuple(bool(r.get("invert", False)) for r in rules)
+        program: List[Instr] = []
+        try:
+            expr, depth = self._compile_node(tree, program)
+        except RecursionError:
+            raise ValueError("Circuito demasiado profundo") from None
+        self.program = tuple(program)
+        self.output = tree if isinstance(tree, int) else self.n_inputs + len(program) - 1
+
+        def input_expr(i: int) -> str:
+            if self.inverts[i]:
+                return f"(w[{i}] == 0)"
+            return f"(w[{i}] >= {self.thresholds[i]})"
+
+        bits_src = ", ".join(f"1 if {input_expr(i)} else 0" for i in range(self.n_inputs))
+        solves_src = expr.format(*(input_expr(i) for i in range(self.n_inputs)))
+        circuit_src = expr.format(*(f"b[{i}]" for i in range(self.n_inputs)))
+        self.source = solves_src
+        # Las expresiones salen de un árbol ya validado (solo índices enteros y AND/OR/NOT)
+        self.input_bits: Callable[[Sequence[int]], List[int]] = eval(f"lambda w: [{bits_src}]")
+        if depth > MAX_EXPR_DEPTH:
+            self.circuit = self.run_program
+            self.solves = lambda w: bool(self.run_program(self.input_bits(w)))
+            return
+        self.circuit: Callable[[Sequence[int]], int] = eval(f"lambda b: 1 if {circuit_src} else 0")
+        self.solves: Callable[[Sequence[int]], bool] = eval(f"lambda w: bool({solves_src})")
+
+    def _compile_node(self, node: Any, program: List[Instr]) -> Tuple[str, int]:
+        """Validar `node`, agregar sus instrucciones y devolver (expresión equivalente, profundidad).
+
+        En la expresión el input i aparece como "{i}" (se reemplaza por bit o por regla).
+        """
+        if isinstance(node, int) and not isinstance(node, bool):
+            if not 0 <= node < self.n_inputs:
+                raise ValueError(f"Input {node} fuera de rango (el nivel tiene {self.n_inputs})")
+            return "{%d}" % node, 0
+        if isinstance(node, dict):
+            name = str(node.get("op", "")).upper()
+            if name not in Op.__members__:
+                raise ValueError(f"Operación desconocida: {name}")
+            op = Op[name]
+            args = node.get("args", [])
+            if not isinstance(args, (list, tuple)) or not args:
+                raise ValueError(f"{name} sin argumentos")
+            if op is Op.NOT and len(args) != 1:
+                raise ValueError(f"NOT lleva un solo argumento, tiene {len(args)}")
+            parts = []
+            slots = []
+            depth = 0
+            for arg in args:
+                part, d = self._compile_node(arg, program)
+                parts.append(part)
+                depth = max(depth, d)
+                slots.append(arg if isinstance(arg, int) else self.n_inputs + len(program) - 1)
+            program.append((op, tuple(slots)))
+            if op is Op.NOT:
+                return f"(not {parts[0]})", depth + 1
+            return "(" + (" and " if op is Op.AND else " or ").join(parts) + ")", depth + 1
+        raise TypeError(f"Nodo inválido en circuito: {node!r}")
+
+    def run_program(self, bits: Sequence[int]) -> int:
+        """Evaluar `program` instrucción por instrucción (referencia de las closures)."""
+        slots = list(bits[:self.n_inputs])
+        for op, args in self.program:
+            if op is Op.NOT:
+                slots.append(1 - slots[args[0]])
+            elif op is Op.AND:
+                slots.append(1 if all(slots[a] for a in args) else 0)
+            else:
+                slots.append(1 if any(slots[a] for a in args) else 0)
+        return slots[self.output]
+
+    def eval_partial(self, bits: Sequence[Any]) -> Any:
+        """Evaluar con bits desconocidos (None): 0/1 si ya está decidido, None si no.
+
+        AND con algún 0 da 0 y OR con algún 1 da 1 aunque falten bits (cortocircuito).
+        """
+        slots = list(bits[:self.n_inputs])
+        for op, args in self.program:
+            if op is Op.NOT:
+                v = slots[args[0]]
+                slots.append(None if v is None else 1 - v)
+                continue
+            vals = [slots[a] for a in args]
+            decisive = 0 if op is Op.AND else 1
+            if decisive in vals:
+                slots.append(decisive)
+            elif None in vals:
+                slots.append(None)
+            else:
+                slots.append(1 - decisive)
+        return slots[self.output]
+
+    # ---- Evaluación por lotes (NumPy) ----
+    def circuit_batch(self, bits: "np.ndarray") -> "np.ndarray":
+        """Salida del circuito para cada fila de `bits` (batch, n_inputs) → bool (batch,).
 
+        Recorre `program` una vez con operaciones booleanas sobre columnas enteras.
+        """
+        _require_numpy()
+        bits = np.asarray(bits).astype(bool, copy=False).reshape(-1, self.n_inputs)
+        slots = [bits[:, i] for i in range(self.n_inputs)]
+        for op, args in self.program:
+            if op is Op.NOT:
+                slots.append(~slots[args[0]])
+            else:
+                ufunc = np.logical_and if op is Op.AND else np.logical_or
+                acc = ufunc(slots[args[0]], slots[args[1]]) if len(args) > 1 else slots[args[0]].copy()
+                for a in args[2:]:
+                    ufunc(acc, slots[a], out=acc)
+                slots.append(acc)
+        return slots[self.output].copy()
 
-def _eval_node(node: Any, bits: List[int]) -> int:
-    """Evalúa recursivamente el árbol de la compuerta, devolviendo 0/1."""
-    if isinstance(node, int):
-        return bits[node]
+    def input_bits_batch(self, weights: "np.ndarray") -> "np.ndarray":
+        """Pesos totales por input (batch, n_inputs) → bits bool (batch, n_inputs)."""
+        _require_numpy()
+        weights = np.asarray(weights).reshape(-1, self.n_inputs)
+        thresholds = np.asarray(self.thresholds)
+        inverts = np.asarray(self.inverts, dtype=bool)
+        return np.where(inverts, weights == 0, weights >= thresholds)
 
-    if isinstance(node, dict):
-        op = str(node.get("op", "")).upper()
-        args = node.get("args", [])
+    def truth_table(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Las 2^n combinaciones de bits (fila k = k en binario, input 0 el más alto) y su salida."""
+        _require_numpy()
+        if self.n_inputs > 24:
+            raise ValueError(f"Tabla de verdad de {self.n_inputs} inputs es demasiado grande")
+        rows = np.arange(1 << self.n_inputs, dtype=np.int64)
+        shifts = np.arange(self.n_inputs - 1, -1, -1, dtype=np.int64)
+        bits = ((rows[:, None] >> shifts) & 1).astype(bool)
+        return bits, self.circuit_batch(bits)
 
-        if op == "NOT":
-            val = _eval_node(args[0], bits)
-            return 1 - val
 
-        vals = [_eval_node(arg, bits) for arg in args]
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("La evaluación por lotes requiere NumPy (pip install numpy)")
 
-        if op == "AND":
-            return 1 if all(vals) else 0
-        if op == "OR":
-            return 1 if any(vals) else 0
 
-        raise ValueError(f"Operación desconocida: {op}")
+def compile_circuit(cfg: Dict[str, Any]) -> CompiledCircuit:
+    """Compilar la config de un nivel (formato de LEVELS); no usa el cache."""
+    return CompiledCircuit(list(cfg["inputs"]), cfg["circuit"])
 
-    raise TypeError(f"Nodo inválido en circuito: {node!r}")
 
+_COMPILED: Dict[int, Tuple[Dict[str, Any], CompiledCircuit]] = {}
+
+
+def compile_level(level_num: int) -> CompiledCircuit:
+    """Circuito compilado de LEVELS[level_num], cacheado por nivel.
+
+    Si se reemplaza el dict del nivel se recompila solo; si se lo modifica en el lugar,
+    llamar a clear_compiled_cache().
+    """
+    cfg = LEVELS[level_num]
+    hit = _COMPILED.get(level_num)
+    if hit is not None and hit[0] is cfg:
+        return hit[1]
+    compiled = compile_circuit(cfg)
+    _COMPILED[level_num] = (cfg, compiled)
+    return compiled
+
+
+def clear_compiled_cache() -> None:
+    _COMPILED.clear()
+
+# -----------------------------------------------------------------------------
+# EVALUACIÓN
+# -----------------------------------------------------------------------------
 
 def compute_input_bits(level_num: int, weights: List[int]) -> List[int]:
     """
     A partir de los pesos totales por input (sumando piedras en cada caja),
     devuelve los bits (0/1) aplicando threshold o NOT según el config del nivel.
     """
-    cfg = LEVELS[level_num]
-    rules = cfg["inputs"]
-    if len(weights) < len(rules):
-        weights = list(weights) + [0] * (len(rules) - len(weights))
-    return [_bit_from_weight(w, rules[i]) for i, w in enumerate(weights)]
+    compiled = compile_level(level_num)
+    if len(weights) < compiled.n_inputs:
+        weights = list(weights) + [0] * (compiled.n_inputs - len(weights))
+    return compiled.input_bits(weights)
 
 
 def evaluate_level(level_num: int, input_zones: List[Any]) -> Tuple[bool, List[int]]:
@@ -182,15 +358,28 @@ def evaluate_level(level_num: int, input_zones: List[Any]) -> Tuple[bool, List[i
       - is_complete (bool): True si la expresión del circuito da 1
       - bits (List[int]):   los bits calculados por input (para mostrar, ej. "1 0 1 ...")
     """
-    cfg = LEVELS[level_num]
     # 1) Obtener pesos actuales de cada zona de input
     weights = [z.get_total_weight() for z in input_zones]
 
     # 2) Convertir a bits según reglas del nivel
     bits = compute_input_bits(level_num, weights)
 
-    # 3) Evaluar el árbol de compuertas
-    is_complete = bool(_eval_node(cfg["circuit"], bits))
-
-    print()
+    # 3) Evaluar el circuito compilado
+    is_complete = bool(compile_level(level_num).circuit(bits))
     return is_complete, bits
+
+
+def evaluate_batch(level_num: int, weights: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Evaluar el nivel para muchas combinaciones de pesos a la vez (requiere NumPy).
+
+    `weights`: (batch, n_inputs) con el peso total de piedras de cada input.
+    Devuelve (is_complete bool (batch,), bits bool (batch, n_inputs)).
+    """
+    compiled = compile_level(level_num)
+    bits = compiled.input_bits_batch(weights)
+    return compiled.circuit_batch(bits), bits
+
+
+def truth_table(level_num: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Tabla de verdad del circuito del nivel sobre sus bits de input (requiere NumPy)."""
+    return compile_level(level_num).truth_table()
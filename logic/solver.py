@@ -0,0 +1,346 @@
+# solver.py
+# -----------------------------------------------------------------------------
+# Solver exhaustivo de niveles: ¿se puede encender el circuito con las piedras
+# del nivel, cuál es la solución con menos piedras y cuántas soluciones hay?
+#
+# Modelo (igual que el juego):
+#   - cada InputZone acepta hasta `capacity` piedras (InputZone.max_stones = 2);
+#   - no hace falta usar todas las piedras;
+#   - una solución es qué pesos van en cada input. Piedras del mismo peso son
+#     intercambiables: dos soluciones que solo cambian piedras iguales cuentan una vez.
+#
+# Cómo poda:
+#   1) Por input: qué bits son posibles con las piedras que hay (un threshold que ni
+#      las dos piedras más pesadas alcanzan no puede valer 1, etc.).
+#   2) Cortocircuito: se recorren los bits input por input evaluando el circuito con
+#      bits desconocidos (eval_partial). Si ya da 0 se corta; si ya da 1 el resto de
+#      los inputs queda libre. Salen "cubos" disjuntos de bits (0, 1 o libre).
+#   3) Para cada cubo, DP sobre (inputs que faltan, multiconjunto de piedras que quedan)
+#      con memo compartido entre cubos. Los pesos se manejan como multiconjunto
+#      (conteo por peso distinto), así que piedras iguales no se permutan.
+#      El conteo resuelve los inputs libres de un cubo con una fórmula por clase de
+#      peso (_free_ways).
+#   4) La solución mínima es un branch and bound sobre todos los cubos: solo prueba
+#      opciones dominantes y poda con cotas por input y la mejor solución encontrada.
+#
+# El conteo exacto (3) es exponencial en inputs restringidos y pesos distintos
+# (20 piedras / 8 inputs ya son decenas de segundos), así que es opcional
+# (count=True) y tiene un presupuesto de pasos (count_budget): si se agota, count
+# queda como cota inferior y count_capped=True. La solución mínima (4) escala bien.
+# -----------------------------------------------------------------------------
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import comb
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .level_logic import DEFAULT_STONES, LEVELS, compile_circuit
+
+# Valor de un input en un cubo: 0, 1 o FREE (cualquiera)
+FREE = 2
+
+# Pasos del conteo antes de cortarlo (opciones probadas en count_dp + estados de
+# _free_ways nuevos): del orden de 1-2 s
+COUNT_BUDGET = 500_000
+
+Placement = Tuple[Tuple[int, ...], ...]
+
+
+@dataclass(frozen=True)
+class SolveResult:
+    """Resultado de solve().
+
+    Atributos:
+        solvable: si existe alguna forma de encender el circuito.
+        placement: solución mínima (menos piedras, luego menos peso total): pesos
+                   por input, en el orden de "inputs". None si no hay solución.
+        stones_used: piedras de la solución mínima.
+        count: cantidad de soluciones distintas (None si se pidió count=False).
+        cubes: patrones de bits (con inputs libres) que encienden el circuito.
+        count_capped: el conteo se cortó (count_limit o count_budget); count es
+                      entonces una cota inferior, no el total.
+    """
+    solvable: bool
+    placement: Optional[Placement]
+    stones_used: int
+    count: Optional[int]
+    cubes: int
+    count_capped: bool = False
+
+
+class _CountBudgetExceeded(Exception):
+    pass
+
+
+def _feasible_bits(invert: bool, threshold: int, stones: Sequence[int], capacity: int) -> Tuple[int, ...]:
+    """Bits que puede tomar un input con este pool de piedras (mirándolo solo)."""
+    if invert:
+        return (1, 0) if stones else (1,)
+    bits = []
+    if sum(sorted(stones, reverse=True)[:capacity]) >= threshold:
+        bits.append(1)
+    if threshold > 0:
+        bits.append(0)
+    return tuple(bits)
+
+
+@lru_cache(maxsize=None)
+def _spread(state: Tuple[int, ...], capacity: int) -> Tuple[Tuple[Tuple[int, ...], int, int], ...]:
+    """Formas de dar piedras de UN peso a inputs libres.
+
+    `state[k]` = inputs que ya tienen k piedras. Devuelve (nuevo estado, piedras
+    usadas, multiplicidad) para cada manera de repartir (los inputs son distintos,
+    así que se cuentan las elecciones de cuáles reciben cuántas).
+    """
+    out = []
+
+    def rec(k: int, nxt: List[int], used: int, mult: int) -> None:
+        if k == len(state):
+            out.append((tuple(nxt), used, mult))
+            return
+        # Repartir los state[k] inputs con k piedras según cuántas nuevas reciben (t)
+        def split(t: int, left: int, used: int, mult: int) -> None:
+            if t == capacity - k:
+                nxt[k + t] += left
+                rec(k + 1, nxt, used + t * left, mult)
+                nxt[k + t] -= left
+                return
+            for m in range(left + 1):
+                nxt[k + t] += m
+                split(t + 1, left - m, used + t * m, mult * comb(left, m))
+                nxt[k + t] -= m
+        split(0, state[k], used, mult)
+
+    rec(0, [0] * len(state), 0, 1)
+    return tuple(out)
+
+
+@lru_cache(maxsize=None)
+def _free_ways(m: int, counts: Tuple[int, ...], capacity: int) -> int:
+    """Formas de llenar m inputs libres (hasta `capacity` piedras c/u) con el pool `counts`.
+
+    DP por clase de peso sobre cuántos inputs tienen 0, 1, ..., capacity piedras:
+    polinomial en m, en lugar de recorrer multiconjuntos de piedras restantes.
+    """
+    states = {(m,) + (0,) * capacity: 1}
+    for c in counts:
+        nxt: Dict[Tuple[int, ...], int] = {}
+        for state, ways in states.items():
+            for new_state, used, mult in _spread(state, capacity):
+                if used <= c:
+                    nxt[new_state] = nxt.get(new_state, 0) + ways * mult
+        states = nxt
+    return sum(states.values())
+
+
+def _allows(spec: Tuple[bool, int, int], size: int, total: int) -> bool:
+    invert, threshold, want = spec
+    if want == FREE:
+        return True
+    bit = (size == 0) if invert else (total >= threshold)
+    return bit == bool(want)
+
+
+def solve(cfg: Dict[str, Any], capacity: int = 2, count: bool = False,
+          count_limit: Optional[int] = None, count_budget: Optional[int] = COUNT_BUDGET) -> SolveResult:
+    """Resolver un nivel en el formato de LEVELS.
+
+    Por defecto solo busca la solución mínima. count=True (o count_limit) cuenta además
+    las soluciones, con dos cortes que dejan count_capped=True:
+      - count_limit: se deja de contar en cuanto se pasa de ese número (count > count_limit);
+      - count_budget: pasos máximos del conteo (None = sin tope; puede tardar minutos).
+    """
+    if count_limit is not None:
+        count = True
+    compiled = compile_circuit(cfg)
+    n = compiled.n_inputs
+    stones = list(cfg.get("stones", DEFAULT_STONES))
+    values = sorted(set(stones))
+    counts0 = tuple(stones.count(v) for v in values)
+
+    # Opciones por input: multiconjuntos de hasta `capacity` piedras (índices en `values`)
+    options = []
+    for r in range(capacity + 1):
+        for idx in combinations_with_replacement(range(len(values)), r):
+            need = tuple((j, idx.count(j)) for j in sorted(set(idx)))
+            if all(counts0[j] >= k for j, k in need):
+                options.append((r, sum(values[j] for j in idx), need))
+
+    # 1) + 2) Cubos de bits que encienden el circuito
+    feasible = [
+        _feasible_bits(compiled.inverts[i], compiled.thresholds[i], stones, capacity) for i in range(n)
+    ]
+    bits: List[Any] = [f[0] if len(f) == 1 else None for f in feasible]
+    cubes: List[Tuple[int, ...]] = []
+
+    def walk(i: int) -> None:
+        value = compiled.eval_partial(bits)
+        if value == 0:
+            return
+        if value == 1:
+            cubes.append(tuple(FREE if b is None else b for b in bits))
+            return
+        while bits[i] is not None:
+            i += 1
+        for b in feasible[i]:
+            bits[i] = b
+            walk(i + 1)
+        bits[i] = None
+
+    walk(0)
+    if count_limit is not None:
+        # Los cubos con más inputs libres suman más soluciones y se cuentan casi gratis
+        cubes.sort(key=lambda cube: -cube.count(FREE))
+
+    # 3) Conteo: DP por cubo. Spec de input = (invert, threshold, bit pedido); los inputs
+    #    se ordenan por spec (los libres al final) para compartir memo entre cubos.
+    allowed: Dict[Tuple[bool, int, int], list] = {}
+
+    def take(counts: Tuple[int, ...], need) -> Optional[Tuple[int, ...]]:
+        if any(counts[j] < k for j, k in need):
+            return None
+        rest = list(counts)
+        for j, k in need:
+            rest[j] -= k
+        return tuple(rest)
+
+    steps = 0
+    free_seen = set()
+
+    @lru_cache(maxsize=None)
+    def count_dp(specs: Tuple[Tuple[bool, int, int], ...], counts: Tuple[int, ...]) -> int:
+        """Formas de llenar los inputs `specs` con las piedras `counts`."""
+        nonlocal steps
+        if not specs:
+            return 1
+        if specs[0][2] == FREE:
+            # Solo quedan inputs libres: conteo cerrado por clase de peso. Cuesta
+            # (clases de peso) x (estados de carga de m inputs); se cobra la primera vez.
+            m = len(specs)
+            if (m, counts) not in free_seen:
+                free_seen.add((m, counts))
+                steps += len(counts) * comb(m + capacity, capacity) // 2
+                if count_budget is not None and steps > count_budget:
+                    raise _CountBudgetExceeded
+            return _free_ways(m, counts, capacity)
+        spec = specs[0]
+        opts = allowed.get(spec)
+        if opts is None:
+            opts = allowed[spec] = [o for o in options if _allows(spec, o[0], o[1])]
+        steps += len(opts)
+        if count_budget is not None and steps > count_budget:
+            raise _CountBudgetExceeded
+        total = 0
+        for _, _, need in opts:
+            rest = take(counts, need)
+            if rest is not None:
+                total += count_dp(specs[1:], rest)
+        return total
+
+    def candidates(spec: Tuple[bool, int, int], counts: Tuple[int, ...]) -> List[tuple]:
+        """Opciones dominantes para un input que no puede quedar vacío, de menor a mayor.
+
+        Las condiciones de esos inputs (alcanzar el threshold, o NOT que tiene que valer 0)
+        son monótonas: cambiar una piedra por otra más pesada nunca rompe a otro input.
+        Alcanza con, por cada prefijo ordenado de piedras que todavía no llega al
+        threshold (hasta `capacity` - 1 piedras), la piedra siguiente más liviana que lo completa.
+        """
+        invert, threshold, _ = spec
+        avail = [j for j, c in enumerate(counts) if c]
+        if not avail:
+            return []
+        if invert:
+            return [((avail[0], 1),)]
+        cands = []
+        left = list(counts)
+
+        def extend(prefix: List[int], start: int, weight: int) -> None:
+            for b in avail[start:]:
+                if not left[b]:
+                    continue
+                if weight + values[b] >= threshold:
+                    picked = prefix + [b]
+                    cands.append(tuple((j, picked.count(j)) for j in sorted(set(picked))))
+                    break
+                if len(prefix) + 1 < capacity:
+                    left[b] -= 1
+                    extend(prefix + [b], avail.index(b), weight + values[b])
+                    left[b] += 1
+
+        extend([], 0, 0)
+        cands.sort(key=lambda need: (sum(k for _, k in need), sum(values[j] * k for j, k in need)))
+        return cands
+
+    def lower_bound(spec: Tuple[bool, int, int]) -> Tuple[int, int]:
+        """(piedras, peso) mínimos del input con el pool completo (cota para podar)."""
+        cands = candidates(spec, counts0)
+        if not cands:
+            return (capacity + 1, 0)  # imposible: poda cualquier rama que lo incluya
+        need = cands[0]
+        return (sum(k for _, k in need), min(sum(values[j] * k for j, k in c) for c in cands))
+
+    # 4) Branch and bound de la solución mínima sobre todos los cubos, con la mejor
+    #    encontrada hasta ahora como cota.
+    best = None
+
+    def search(specs, bounds, i: int, counts, stones_used: int, weight: int, chosen: list) -> None:
+        nonlocal best
+        if best is not None and (stones_used + bounds[i][0], weight + bounds[i][1]) >= best[:2]:
+            return
+        if i == len(specs):
+            best = (stones_used, weight, tuple(chosen))
+            return
+        for need in candidates(specs[i], counts):
+            picked = tuple(values[j] for j, k in need for _ in range(k))
+            chosen.append(picked)
+            search(specs, bounds, i + 1, take(counts, need), stones_used + len(picked),
+                   weight + sum(picked), chosen)
+            chosen.pop()
+
+    total = 0
+    capped = False
+    for cube in cubes:
+        specs = [
+            (compiled.inverts[i], 0 if compiled.inverts[i] else compiled.thresholds[i], cube[i]) for i in range(n)
+        ]
+        if count and not capped:
+            order = sorted(range(n), key=lambda i: (specs[i][2] == FREE, specs[i]))
+            try:
+                total += count_dp(tuple(specs[i] for i in order), counts0)
+            except _CountBudgetExceeded:
+                capped = True
+            if count_limit is not None and total > count_limit:
+                capped = True
+        # Los inputs que aceptan quedar vacíos no suman piedras a la solución mínima;
+        # primero los thresholds más altos (menos opciones).
+        order = sorted((i for i in range(n) if not _allows(specs[i], 0, 0)),
+                       key=lambda i: (-specs[i][1], specs[i]))
+        cube_specs = [specs[i] for i in order]
+        # bounds[i] = cota (piedras, peso) de los inputs i.. en adelante
+        bounds = [(0, 0)] * (len(cube_specs) + 1)
+        for k in range(len(cube_specs) - 1, -1, -1):
+            lb = lower_bound(cube_specs[k])
+            bounds[k] = (bounds[k + 1][0] + lb[0], bounds[k + 1][1] + lb[1])
+        previous = best
+        search(cube_specs, bounds, 0, counts0, 0, 0, [])
+        if best is not previous:
+            placement: List[Tuple[int, ...]] = [()] * n
+            for i, chosen in zip(order, best[2]):
+                placement[i] = chosen
+            best = (best[0], best[1], tuple(placement))
+
+    return SolveResult(
+        solvable=best is not None,
+        placement=best[2] if best else None,
+        stones_used=best[0] if best else 0,
+        count=total if count else None,
+        cubes=len(cubes),
+        count_capped=capped,
+    )
+
+
+def solve_level(level_num: int, capacity: int = 2, count: bool = False,
+                count_budget: Optional[int] = COUNT_BUDGET) -> SolveResult:
+    """solve() sobre LEVELS[level_num]."""
+    return solve(LEVELS[level_num], capacity=capacity, count=count, count_budget=count_budget)
@@ -2,6 +2,9 @@ import sys
 import os
 import atexit
 
+# Primero que nada: el timeline de arranque mide desde aquí hasta el primer frame
+from perf.startup import STARTUP
+
 def main():
     # Ajustar el directorio de trabajo cuando se ejecuta como EXE (PyInstaller onefile)
     # para que las rutas relativas (imágenes, fuentes, etc.) funcionen.
@@ -52,13 +55,20 @@ def main():
             pass
 
     if os.environ.get("CHEESEGATES_SUPPRESS_LIBPNG", "1") != "0":
-        _install_libpng_warning_filter()
+        with STARTUP.phase("libpng filter"):
+            _install_libpng_warning_filter()
+    STARTUP.install_import_hook()
     # Importar tarde para evitar que se emitan warnings antes de instalar el filtro
-    from game import Game
-    from screens.splash_screen import SplashScreen
-    game = Game()
-    splash_screen = SplashScreen(game)
-    game.change_screen(splash_screen)
+    with STARTUP.phase("import game"):
+        from game import Game
+    with STARTUP.phase("import splash_screen"):
+        from screens.splash_screen import SplashScreen
+    with STARTUP.phase("Game()"):
+        game = Game()
+    with STARTUP.phase("SplashScreen()"):
+        splash_screen = SplashScreen(game)
+    with STARTUP.phase("change_screen"):
+        game.change_screen(splash_screen)
     game.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+"""
+Detector de blits lentos (modo debug).
+
+Activar con CHEESEGATES_BLIT_PROBE=1. El canvas se crea como ProbedSurface, una
+subclase de pygame.Surface que intercepta blit/blits y registra por línea de código:
+
+- formato de la superficie origen y si el blit obliga a SDL a convertir píxel a
+  píxel (bits por píxel o máscaras RGB distintas, o una superficie opaca con
+  colorkey / alpha de superficie),
+- si tiene alpha por píxel,
+- píxeles movidos y tiempo gastado.
+
+Imprime un reporte por frame cuando los blits superan CHEESEGATES_BLIT_PROBE_MS
+(por defecto 2.0 ms) y un reporte de sesión al salir.
+"""
+import atexit
+import os
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from .counters import CountingSurface
+
+_PYGAME_DIR = os.path.dirname(pygame.__file__)
+_PERF_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def describe_format(surf: pygame.Surface) -> str:
+    """Formato legible: bits por píxel, alpha por píxel y máscaras RGBA."""
+    masks = "/".join(f"{m:x}" for m in surf.get_masks())
+    alpha = " SRCALPHA" if has_pixel_alpha(surf) else ""
+    return f"{surf.get_bitsize()}bpp{alpha} [{masks}]"
+
+
+def formats_match(src: pygame.Surface, dst: pygame.Surface) -> bool:
+    """True si SDL puede copiar sin convertir cada píxel.
+
+    Solo cuentan bits por píxel y máscaras RGB: un fondo .convert() (sin alpha) sobre
+    el canvas SRCALPHA es el camino rápido previsto, aunque difiera la máscara de alpha.
+    Una superficie sin SRCALPHA con colorkey o alpha de superficie sí se procesa
+    píxel a píxel. El alpha por píxel se reporta aparte.
+    """
+    if src.get_bitsize() != dst.get_bitsize() or src.get_masks()[:3] != dst.get_masks()[:3]:
+        return False
+    if not has_pixel_alpha(src):
+        return src.get_colorkey() is None and src.get_alpha() in (None, 255)
+    return True
+
+
+def has_pixel_alpha(surf: pygame.Surface) -> bool:
+    # Con máscara de alpha (set_alpha() también prende SRCALPHA en superficies opacas)
+    return surf.get_masks()[3] != 0
+
+
+def _call_site() -> Tuple[str, int, str]:
+    """Primer frame fuera de perf/ y de pygame (p.ej. el draw() de la pantalla)."""
+    f = sys._getframe(2)
+    while f is not None:
+        fn = f.f_code.co_filename
+        if not fn.startswith(_PERF_DIR) and not fn.startswith(_PYGAME_DIR):
+            break
+        f = f.f_back
+    if f is None:
+        return ("?", 0, "?")
+    try:
+        path = os.path.relpath(f.f_code.co_filename)
+    except ValueError:
+        path = f.f_code.co_filename
+    return (path, f.f_lineno, f.f_code.co_name)
+
+
+class _SiteStats:
+    __slots__ = ("calls", "pixels", "ns", "mismatched", "alpha", "fmt")
+
+    def __init__(self):
+        self.calls = 0
+        self.pixels = 0
+        self.ns = 0
+        self.mismatched = 0
+        self.alpha = 0
+        self.fmt = ""
+
+
+class BlitProbe:
+    def __init__(self, frame_budget_ms: float = 2.0, top: int = 8):
+        self.frame_budget_ms = frame_budget_ms
+        self.top = top
+        self.frame_index = 0
+        self._frame: Dict[Tuple[str, int, str], _SiteStats] = {}
+        self._session: Dict[Tuple[str, int, str], _SiteStats] = {}
+        atexit.register(self.print_session_report)
+
+    @classmethod
+    def from_env(cls) -> Optional["BlitProbe"]:
+        if os.environ.get("CHEESEGATES_BLIT_PROBE", "0") in ("", "0"):
+            return None
+        try:
+            budget = float(os.environ.get("CHEESEGATES_BLIT_PROBE_MS", "2.0"))
+        except ValueError:
+            budget = 2.0
+        return cls(frame_budget_ms=budget)
+
+    def wrap(self, surf: pygame.Surface) -> "ProbedSurface":
+        """Superficie vacía con el mismo tamaño y formato que `surf`, instrumentada."""
+        probed = ProbedSurface.like(surf)
+        probed._probe = self
+        return probed
+
+    # ================= Registro =================
+    def record(self, site, src: pygame.Surface, dst: pygame.Surface, rect: pygame.Rect, ns: int) -> None:
+        match = formats_match(src, dst)
+        alpha = has_pixel_alpha(src)
+        pixels = rect.width * rect.height
+        for table in (self._frame, self._session):
+            st = table.get(site)
+            if st is None:
+                st = table[site] = _SiteStats()
+                st.fmt = describe_format(src)
+            st.calls += 1
+            st.pixels += pixels
+            st.ns += ns
+            if not match:
+                st.mismatched += 1
+            if alpha:
+                st.alpha += 1
+
+    def end_frame(self) -> None:
+        """Cerrar el frame: imprimir reporte si los blits superaron el presupuesto."""
+        total_ms = sum(st.ns for st in self._frame.values()) / 1e6
+        if total_ms > self.frame_budget_ms:
+            print(f"[BlitProbe] frame {self.frame_index}: {total_ms:.2f} ms en blits")
+            self._print_table(self._frame)
+        self._frame = {}
+        self.frame_index += 1
+
+    # ================= Reportes =================
+    def _print_table(self, table) -> None:
+        rows = sorted(table.items(), key=lambda kv: kv[1].ns, reverse=True)[:self.top]
+        for (path, line, func), st in rows:
+            flags = []
+            if st.mismatched:
+                flags.append(f"CONVERSIÓN x{st.mismatched}")
+            if st.alpha:
+                flags.append(f"alpha x{st.alpha}")
+            print(
+                f"    {st.ns / 1e6:8.2f} ms  {st.calls:6d} blits  {st.pixels / 1e6:8.2f} Mpx  "
+                f"{path}:{line} ({func})  {st.fmt}  {' '.join(flags)}"
+            )
+
+    def print_session_report(self) -> None:
+        if not self._session:
+            return
+        total_ms = sum(st.ns for st in self._session.values()) / 1e6
+        frames = max(1, self.frame_index)
+        print(f"[BlitProbe] sesión: {frames} frames, {total_ms:.1f} ms en blits "
+              f"({total_ms / frames:.2f} ms/frame)")
+        self._print_table(self._session)
+
+
+class ProbedSurface(CountingSurface):
+    """Canvas que, además de contar, reporta cada blit a su BlitProbe.
+
+    CountingSurface.blits pasa por blit(), así que Group.draw también queda registrado.
+    """
+
+    _probe: Optional[BlitProbe] = None
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        t0 = time.perf_counter_ns()
+        rect = super().blit(source, dest, area, special_flags)
+        ns = time.perf_counter_ns() - t0
+        if self._probe is not None:
+            self._probe.record(_call_site(), source, self, rect, ns)
+        return rect
@@ -0,0 +1,113 @@
+"""
+Contadores por frame de operaciones de dibujo costosas: blits sobre el canvas,
+llamadas a pygame.transform y renders de fuente.
+
+install() reemplaza las funciones de pygame.transform y la clase pygame.font.Font
+por versiones que cuentan (el código del juego las resuelve por atributo en cada
+llamada, así que no hace falta tocarlo). Los blits se cuentan en el canvas, que
+se crea como CountingSurface. uninstall() deja pygame como estaba.
+
+El juego los instala con CHEESEGATES_COUNTERS=1 al arrancar, o la primera vez que
+se abre el HUD (F3); en ese caso las fuentes creadas antes no cuentan sus renders.
+
+Solo cuenta lo que corre en el hilo que llamó a install() (el del game loop): los
+escalados/decodificaciones de AssetLoader u otros hilos de fondo no son costo del
+frame que se está midiendo.
+"""
+import threading
+
+import pygame
+
+
+class FrameCounters:
+    __slots__ = ("blits", "transforms", "font_renders")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.blits = 0
+        self.transforms = 0
+        self.font_renders = 0
+
+    def snapshot(self):
+        return (self.blits, self.transforms, self.font_renders)
+
+
+COUNTERS = FrameCounters()
+
+_TRANSFORM_FUNCS = (
+    "scale", "smoothscale", "scale_by", "smoothscale_by", "rotate", "rotozoom", "flip", "scale2x",
+)
+_installed = False
+_main_thread = threading.get_ident()
+# Originales de pygame que reemplaza install() (nombre -> objeto)
+_originals = {}
+
+
+class CountingSurface(pygame.Surface):
+    """Surface que cuenta blits (se usa para el canvas)."""
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        COUNTERS.blits += 1
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = []
+        for item in blit_sequence:
+            rects.append(self.blit(*item))
+        return rects if doreturn else None
+
+    @classmethod
+    def like(cls, surf: pygame.Surface) -> "CountingSurface":
+        """Superficie vacía con el mismo tamaño y formato que `surf`."""
+        return cls(surf.get_size(), surf.get_flags(), surf)
+
+
+class CountingFont(pygame.font.Font):
+    def render(self, *args, **kwargs):
+        if threading.get_ident() == _main_thread:
+            COUNTERS.font_renders += 1
+        return super().render(*args, **kwargs)
+
+
+def _counted(func):
+    def wrapper(*args, **kwargs):
+        if threading.get_ident() == _main_thread:
+            COUNTERS.transforms += 1
+        return func(*args, **kwargs)
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def installed() -> bool:
+    return _installed
+
+
+def install() -> None:
+    """Instalar los contadores (idempotente). Llamar antes de crear pantallas/fuentes."""
+    global _installed, _main_thread
+    if _installed:
+        return
+    _main_thread = threading.get_ident()
+    for name in _TRANSFORM_FUNCS:
+        func = getattr(pygame.transform, name, None)
+        if func is not None:
+            _originals[name] = func
+            setattr(pygame.transform, name, _counted(func))
+    _originals["Font"] = pygame.font.Font
+    pygame.font.Font = CountingFont
+    _installed = True
+
+
+def uninstall() -> None:
+    """Restaurar pygame.transform y pygame.font.Font (idempotente)."""
+    global _installed
+    if not _installed:
+        return
+    pygame.font.Font = _originals.pop("Font")
+    for name, func in _originals.items():
+        setattr(pygame.transform, name, func)
+    _originals.clear()
+    _installed = False
@@ -0,0 +1,80 @@
+"""
+Estadísticas de frame en un ring buffer de tamaño fijo.
+
+Cada frame de Game.run guarda una fila con el tiempo de cada fase (eventos,
+update, draw, present) y los contadores de perf.counters. Se usa para el HUD
+(percentiles y gráfico) y se puede volcar a CSV bajo demanda.
+"""
+import csv
+import os
+import time
+from typing import Dict, List, Optional, Sequence
+
+FIELDS = (
+    "frame", "t", "events_ms", "update_ms", "draw_ms", "present_ms", "work_ms", "dt_ms",
+    "blits", "transforms", "font_renders", "gc_ms", "gc_collections",
+    "input_ms",
+)
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Percentil (0..100) por el método nearest-rank sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(p / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+class FrameStats:
+    def __init__(self, capacity: int = 600, fields: Sequence[str] = FIELDS):
+        self.capacity = int(capacity)
+        self.fields = tuple(fields)
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self._rows: List[Optional[tuple]] = [None] * self.capacity
+        self._next = 0
+        self.count = 0
+        self.t0 = time.perf_counter()
+
+    def push(self, row: tuple) -> None:
+        """Agregar una fila (en el orden de self.fields); pisa la más vieja al llenarse."""
+        self._rows[self._next] = row
+        self._next = (self._next + 1) % self.capacity
+        self.count += 1
+
+    def rows(self) -> List[tuple]:
+        """Filas en orden cronológico (de la más vieja a la más nueva)."""
+        if self.count < self.capacity:
+            return self._rows[:self._next]
+        return self._rows[self._next:] + self._rows[:self._next]
+
+    def column(self, name: str, last: Optional[int] = None) -> List[float]:
+        i = self._index[name]
+        rows = self.rows()
+        if last is not None:
+            rows = rows[-last:]
+        return [r[i] for r in rows]
+
+    def summary(self, name: str) -> Dict[str, float]:
+        values = sorted(self.column(name))
+        if not values:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1],
+        }
+
+    def dump_csv(self, directory: str) -> Optional[str]:
+        """Volcar el buffer a <directory>/frame_stats-YYYYmmdd-HHMMSS.csv y devolver la ruta."""
+        path = os.path.join(directory, time.strftime("frame_stats-%Y%m%d-%H%M%S.csv"))
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(self.fields)
+                for row in self.rows():
+                    w.writerow(f"{v:.3f}" if isinstance(v, float) else v for v in row)
+        except Exception as e:
+            print(f"[Perf] No se pudo escribir {path}: {e}")
+            return None
+        return path
@@ -0,0 +1,96 @@
+"""
+Política de recolección de basura (gc cíclico) para frames de juego.
+
+- Tras construir una pantalla: gc.collect() completo y gc.freeze() para sacar los
+  objetos de larga vida (imágenes, fuentes, config) de las recolecciones futuras.
+- Durante el gameplay activo se desactiva la recolección automática: las
+  colecciones de generación 0/1 se hacen solo en frames ociosos (el trabajo del
+  frame dejó margen dentro del presupuesto), con un tope de seguridad.
+- Al pausar o salir del gameplay se reactiva el gc y se recolecta ahí (punto seguro).
+- Los tiempos de pausa se miden con gc.callbacks y se reportan por frame.
+"""
+import gc
+import time
+
+from . import trace
+
+
+class GCPolicy:
+    def __init__(self, frame_budget_ms: float = 1000.0 / 120, idle_min_objects: int = 2000,
+                 force_objects: int = 50000):
+        self.frame_budget_ms = frame_budget_ms
+        # Objetos pendientes en gen0 a partir de los cuales conviene recolectar en un frame ocioso
+        self.idle_min_objects = idle_min_objects
+        # Tope de seguridad: recolectar aunque el frame no tenga margen
+        self.force_objects = force_objects
+        self.gameplay = False
+
+        # Estadísticas (ms)
+        self.frame_pause_ms = 0.0
+        self.frame_collections = 0
+        self.total_pause_ms = 0.0
+        self.max_pause_ms = 0.0
+        self.collections = 0
+        self._gc_start = None
+        gc.callbacks.append(self._on_gc)
+
+    def close(self) -> None:
+        try:
+            gc.callbacks.remove(self._on_gc)
+        except ValueError:
+            pass
+        if self.gameplay:
+            gc.enable()
+            self.gameplay = False
+
+    # ================= Medición =================
+    def _on_gc(self, phase, info) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            end = time.perf_counter()
+            ms = (end - self._gc_start) * 1000.0
+            self.frame_pause_ms += ms
+            self.frame_collections += 1
+            self.total_pause_ms += ms
+            self.collections += 1
+            if ms > self.max_pause_ms:
+                self.max_pause_ms = ms
+            trace.complete(f"gc gen{info.get('generation', '?')}", self._gc_start, end, "gc",
+                           {"collected": info.get("collected", 0)})
+            self._gc_start = None
+
+    def take_frame_stats(self):
+        """(ms en pausas de gc, cantidad de colecciones) desde la última llamada."""
+        stats = (self.frame_pause_ms, self.frame_collections)
+        self.frame_pause_ms = 0.0
+        self.frame_collections = 0
+        return stats
+
+    # ================= Puntos seguros =================
+    def on_screen_ready(self) -> None:
+        """Llamar una vez construida y activada una pantalla nueva (fuera de su stack)."""
+        # Descongelar primero: lo que se congeló con la pantalla anterior ya puede ser basura
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+
+    def on_frame_end(self, gameplay_active: bool, work_ms: float) -> None:
+        """Aplicar la política al final de un frame, después de present."""
+        if gameplay_active and not self.gameplay:
+            gc.disable()
+            self.gameplay = True
+        elif not gameplay_active and self.gameplay:
+            # Pausa o fin del nivel: punto seguro para recolectar lo acumulado
+            gc.enable()
+            self.gameplay = False
+            gc.collect(1)
+            return
+        if not self.gameplay:
+            return
+        pending = gc.get_count()[0]
+        idle = work_ms < self.frame_budget_ms * 0.5
+        if (idle and pending >= self.idle_min_objects) or pending >= self.force_objects:
+            # Cada 10 colecciones de gen0 toca una de gen1 (como el umbral por defecto)
+            gen = 1 if gc.get_count()[1] >= 10 else 0
+            gc.collect(gen)
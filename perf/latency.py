@@ -0,0 +1,72 @@
+"""
+Latencia de input a pantalla: desde que un evento de input entra al juego hasta
+el display.flip del primer frame que lo refleja.
+
+El inicio se toma del timestamp del evento si pygame lo expone (ms de SDL, misma
+base que pygame.time.get_ticks()); si no, del momento en que sale de
+pygame.event.get. Solo se miden KEYDOWN y MOUSEBUTTONDOWN.
+"""
+import time
+from collections import deque
+
+import pygame
+
+from .frame_stats import percentile
+
+_KINDS = {pygame.KEYDOWN: "key", pygame.MOUSEBUTTONDOWN: "click"}
+
+
+class InputLatencyTracker:
+    def __init__(self, window: int = 256):
+        self._pending = []
+        self.samples = {kind: deque(maxlen=window) for kind in _KINDS.values()}
+        self.total = 0
+
+    def on_event(self, event) -> None:
+        kind = _KINDS.get(event.type)
+        if kind is None:
+            return
+        now = time.perf_counter()
+        t_in = now
+        ts = getattr(event, "timestamp", None)
+        if ts is not None:
+            # Pasar el timestamp de SDL (ms) a la base de perf_counter
+            t_in = now - max(0, pygame.time.get_ticks() - ts) / 1000.0
+        self._pending.append((kind, t_in))
+
+    def on_present(self, t_present: float) -> float:
+        """Cerrar las mediciones pendientes tras el flip. Devuelve la máxima del frame (ms)."""
+        if not self._pending:
+            return 0.0
+        worst = 0.0
+        for kind, t_in in self._pending:
+            ms = (t_present - t_in) * 1000.0
+            self.samples[kind].append(ms)
+            if ms > worst:
+                worst = ms
+        self.total += len(self._pending)
+        self._pending.clear()
+        return worst
+
+    def summary(self, kind: str):
+        values = sorted(self.samples[kind])
+        if not values:
+            return None
+        return {
+            "n": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": values[-1],
+        }
+
+    def describe(self) -> str:
+        parts = []
+        for kind in self.samples:
+            s = self.summary(kind)
+            if s:
+                parts.append(f"{kind} p50 {s['p50']:.1f} p95 {s['p95']:.1f} max {s['max']:.1f} ms (n={s['n']})")
+        return "input->flip  " + ("   ".join(parts) if parts else "sin datos")
+
+    def print_summary(self) -> None:
+        if self.total:
+            print(f"[Perf] Latencia {self.describe()}")
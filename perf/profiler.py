@@ -0,0 +1,87 @@
+"""
+Captura de cProfile de N frames bajo demanda (F9 en juego).
+
+Al presionar la tecla se perfilan los siguientes N frames (CHEESEGATES_PROFILE_FRAMES,
+por defecto 300) y se escriben en logs/profiles/ del directorio de datos:
+- <nombre>.prof: para snakeviz / pstats / gprof2dot
+- <nombre>.txt:  resumen ordenado por tiempo acumulado
+El nombre lleva la pantalla y el nivel en los que se tomó la captura.
+"""
+import cProfile
+import io
+import os
+import pstats
+import time
+from typing import Optional
+
+
+class FrameProfiler:
+    def __init__(self, frames: int = 300, out_dir: Optional[str] = None):
+        self.frames = max(1, int(frames))
+        self.out_dir = out_dir
+        self._profile: Optional[cProfile.Profile] = None
+        self._pending_tag: Optional[str] = None
+        self._tag = ""
+        self._count = 0
+
+    @classmethod
+    def from_env(cls) -> "FrameProfiler":
+        try:
+            frames = int(os.environ.get("CHEESEGATES_PROFILE_FRAMES", "300"))
+        except ValueError:
+            frames = 300
+        return cls(frames)
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def request(self, tag: str) -> None:
+        """Pedir una captura a partir del próximo frame (se ignora si ya hay una en curso)."""
+        if self.active or self._pending_tag is not None:
+            return
+        self._pending_tag = tag
+        print(f"[Profile] Perfilando {self.frames} frames ({tag})...")
+
+    def begin_frame(self) -> None:
+        if self._pending_tag is None:
+            return
+        self._tag = self._pending_tag
+        self._pending_tag = None
+        self._count = 0
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Otro profiler activo (p.ej. un debugger)
+            print(f"[Profile] No se pudo iniciar: {e}")
+            return
+        self._profile = profile
+
+    def end_frame(self) -> None:
+        if self._profile is None:
+            return
+        self._count += 1
+        if self._count >= self.frames:
+            self._finish()
+
+    def _finish(self) -> None:
+        profile = self._profile
+        self._profile = None
+        profile.disable()
+        out_dir = self.out_dir
+        if out_dir is None:
+            from settings_store import logs_dir
+            out_dir = os.path.join(logs_dir(), "profiles")
+        try:
+            os.makedirs(out_dir, exist_ok=True)
+            base = os.path.join(out_dir, time.strftime("profile-%Y%m%d-%H%M%S") + f"-{self._tag}")
+            profile.dump_stats(base + ".prof")
+            buf = io.StringIO()
+            buf.write(f"{self._tag}: {self._count} frames\n\n")
+            pstats.Stats(profile, stream=buf).sort_stats("cumulative").print_stats(60)
+            with open(base + ".txt", "w", encoding="utf-8") as f:
+                f.write(buf.getvalue())
+            print(f"[Profile] Guardado en {base}.prof / .txt")
+        except Exception as e:
+            print(f"[Profile] No se pudo guardar el perfil: {e}")
@@ -0,0 +1,165 @@
+"""
+Timeline de arranque: desde el inicio del proceso hasta el primer frame presentado.
+
+main.py importa este módulo antes que nada; STARTUP.phase("...") mide cada etapa
+(filtro de stderr, imports, init de video, set_mode, ajustes, SoundManager,
+SplashScreen, etapas diferidas) y un hook sobre __import__ registra el tiempo
+de cada import nuevo (inclusivo, como python -X importtime) hasta el primer frame.
+
+Reporte:
+- Siempre se escribe logs/startup.txt al salir (o al primer frame, si se pide).
+- CHEESEGATES_STARTUP_REPORT=1 lo imprime en consola al presentar el primer frame.
+- CHEESEGATES_STARTUP_REPORT=<ruta.json> lo vuelca como JSON (lo usa tools/bench_startup.py).
+"""
+import atexit
+import builtins
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+
+def _seconds_since_process_start() -> Optional[float]:
+    """Tiempo desde que el SO creó el proceso (incluye extracción del EXE onefile). Best effort."""
+    try:
+        if os.name == "nt":
+            import ctypes
+            from ctypes import wintypes
+
+            creation, exit_, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.kernel32.GetProcessTimes(
+                handle, ctypes.byref(creation), ctypes.byref(exit_), ctypes.byref(kernel), ctypes.byref(user)
+            ):
+                return None
+            now = wintypes.FILETIME()
+            ctypes.windll.kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+            to_int = lambda ft: (ft.dwHighDateTime << 32) | ft.dwLowDateTime  # noqa: E731
+            return (to_int(now) - to_int(creation)) / 1e7
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/stat", "rb") as f:
+                # El nombre del proceso va entre paréntesis y puede tener espacios
+                fields = f.read().rsplit(b")", 1)[1].split()
+            start_ticks = int(fields[19])
+            with open("/proc/uptime", "rb") as f:
+                uptime = float(f.read().split()[0])
+            return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        return None
+    return None
+
+
+class StartupTracer:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.pre_python_s = _seconds_since_process_start()
+        self.phases: List[Tuple[str, float, float, int]] = []
+        self.imports: List[Tuple[str, float, int]] = []
+        self.first_frame_s: Optional[float] = None
+        self._depth = 0
+        self._import_depth = 0
+        self._orig_import = None
+        self._written = False
+        atexit.register(self._write_on_exit)
+
+    # ================= Fases =================
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases.append((name, start - self.t0, time.perf_counter() - self.t0, self._depth))
+
+    # ================= Imports =================
+    def install_import_hook(self) -> None:
+        if self._orig_import is not None:
+            return
+        orig = self._orig_import = builtins.__import__
+        modules = sys.modules
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in modules:
+                return orig(name, globals, locals, fromlist, level)
+            start = time.perf_counter()
+            self._import_depth += 1
+            try:
+                return orig(name, globals, locals, fromlist, level)
+            finally:
+                self._import_depth -= 1
+                self.imports.append((name, time.perf_counter() - start, self._import_depth))
+
+        builtins.__import__ = timed_import
+
+    def uninstall_import_hook(self) -> None:
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    # ================= Reporte =================
+    def first_frame(self) -> None:
+        """Llamar tras el primer display.flip."""
+        if self.first_frame_s is not None:
+            return
+        self.first_frame_s = time.perf_counter() - self.t0
+        self.uninstall_import_hook()
+        target = os.environ.get("CHEESEGATES_STARTUP_REPORT", "")
+        if target.lower().endswith(".json"):
+            self.write_json(target)
+        elif target not in ("", "0"):
+            print(self.report())
+        if target not in ("", "0"):
+            self.write_text()
+
+    def as_dict(self) -> dict:
+        return {
+            "pre_python_s": self.pre_python_s,
+            "first_frame_s": self.first_frame_s,
+            "phases": [
+                {"name": n, "start_s": s, "end_s": e, "depth": d} for n, s, e, d in sorted(self.phases, key=lambda p: p[1])
+            ],
+            "imports": [{"name": n, "s": dur, "depth": d} for n, dur, d in self.imports],
+        }
+
+    def report(self) -> str:
+        lines = ["[Startup] Timeline de arranque (ms desde la carga de main.py)"]
+        if self.pre_python_s is not None:
+            lines.append(f"  antes de Python (proceso/bootloader): {self.pre_python_s * 1000:8.1f} ms")
+        for name, start, end, depth in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"  {'  ' * depth}{name:<32} {start * 1000:8.1f} -> {end * 1000:8.1f}  ({(end - start) * 1000:7.1f} ms)")
+        if self.first_frame_s is not None:
+            lines.append(f"  primer frame presentado:             {self.first_frame_s * 1000:8.1f} ms")
+        top = sorted(self.imports, key=lambda i: i[1], reverse=True)[:20]
+        if top:
+            lines.append("  imports más lentos (inclusivo, nivel de anidamiento):")
+            for name, dur, depth in top:
+                lines.append(f"    {name:<34} {dur * 1000:7.1f} ms  [{depth}]")
+        return "\n".join(lines)
+
+    def write_text(self) -> None:
+        try:
+            from settings_store import logs_dir
+            with open(os.path.join(logs_dir(), "startup.txt"), "w", encoding="utf-8") as f:
+                f.write(self.report() + "\n")
+            self._written = True
+        except Exception:
+            pass
+
+    def write_json(self, path: str) -> None:
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.as_dict(), f, indent=1)
+        except Exception as e:
+            print(f"[Startup] No se pudo escribir {path}: {e}")
+
+    def _write_on_exit(self) -> None:
+        self.uninstall_import_hook()
+        if not self._written and self.phases:
+            self.write_text()
+
+
+STARTUP = StartupTracer()
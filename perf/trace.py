@@ -0,0 +1,192 @@
+"""
+Timeline de eventos en formato Chrome trace-event (Perfetto / about:tracing).
+
+Activar con CHEESEGATES_TRACE=1 (escribe logs/trace-YYYYmmdd-HHMMSS.json en el
+directorio de datos) o CHEESEGATES_TRACE=<ruta.json>.
+
+API:
+    with trace.span("GameScreen.__init__", "screen"): ...
+    @trace.traced("load_level", "asset")
+    trace.complete("update", t0, t1, "frame")    # tiempos de time.perf_counter()
+    trace.instant("change_screen")
+
+Con el tracer desactivado, span() devuelve un context manager compartido que no
+hace nada. Con el tracer activo, el hilo principal solo encola tuplas; un hilo
+de fondo las serializa y escribe el JSON.
+"""
+import atexit
+import functools
+import json
+import os
+import queue
+import threading
+import time
+from typing import Optional
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "t0")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.t0, time.perf_counter(), self.cat, self.args)
+        return False
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+
+    # ================= Ciclo de vida =================
+    def start(self, path: str) -> None:
+        if self.enabled:
+            return
+        self.path = path
+        self.enabled = True
+        self._writer = threading.Thread(target=self._write_loop, name="trace-writer", daemon=True)
+        self._writer.start()
+        main = threading.main_thread()
+        self._queue.put(("M", "thread_name", "", 0.0, 0.0, main.ident, {"name": "main"}))
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Vaciar la cola y cerrar el archivo (se llama solo al salir)."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._queue.put(None)
+        if self._writer is not None:
+            self._writer.join(timeout=5.0)
+            self._writer = None
+        print(f"[Trace] Timeline guardado en {self.path}")
+
+    # ================= Registro =================
+    def span(self, name: str, cat: str = "game", args=None):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def complete(self, name: str, start: float, end: float, cat: str = "game", args=None) -> None:
+        if self.enabled:
+            self._queue.put(("X", name, cat, start, end - start, threading.get_ident(), args))
+
+    def instant(self, name: str, cat: str = "game", args=None) -> None:
+        if self.enabled:
+            self._queue.put(("i", name, cat, time.perf_counter(), 0.0, threading.get_ident(), args))
+
+    # ================= Escritura (hilo de fondo) =================
+    def _write_loop(self) -> None:
+        try:
+            f = open(self.path, "w", encoding="utf-8")
+        except Exception as e:
+            print(f"[Trace] No se pudo abrir {self.path}: {e}")
+            self.enabled = False
+            return
+        with f:
+            # Formato "JSON Array": el cierre "]" es opcional, un crash deja un archivo legible
+            f.write("[\n")
+            first = True
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                ph, name, cat, ts, dur, tid, args = item
+                ev = {"name": name, "ph": ph, "pid": self._pid, "tid": tid}
+                if ph != "M":
+                    ev["cat"] = cat
+                    ev["ts"] = round((ts - self._t0) * 1e6, 3)
+                if ph == "X":
+                    ev["dur"] = round(dur * 1e6, 3)
+                elif ph == "i":
+                    ev["s"] = "t"
+                if args:
+                    ev["args"] = args
+                f.write(("" if first else ",\n") + json.dumps(ev, default=str))
+                first = False
+                if self._queue.empty():
+                    f.flush()
+            f.write("\n]\n")
+
+
+TRACER = Tracer()
+
+
+def span(name: str, cat: str = "game", args=None):
+    return TRACER.span(name, cat, args)
+
+
+def complete(name: str, start: float, end: float, cat: str = "game", args=None) -> None:
+    TRACER.complete(name, start, end, cat, args)
+
+
+def instant(name: str, cat: str = "game", args=None) -> None:
+    TRACER.instant(name, cat, args)
+
+
+def traced(name: str, cat: str = "game"):
+    """Decorador: registra cada llamada como un span (sin costo extra si está desactivado)."""
+    def deco(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with _Span(TRACER, name, cat, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def _install_asset_hooks() -> None:
+    """Registrar cada pygame.image.load como span 'image.load' con el archivo."""
+    import pygame
+
+    original = pygame.image.load
+
+    @functools.wraps(original)
+    def load(file, *args, **kwargs):
+        with span("image.load", "asset", {"file": str(file)}):
+            return original(file, *args, **kwargs)
+
+    pygame.image.load = load
+
+
+def configure_from_env() -> bool:
+    """Activar el tracer según CHEESEGATES_TRACE. Devuelve True si quedó activo."""
+    value = os.environ.get("CHEESEGATES_TRACE", "0")
+    if value in ("", "0") or TRACER.enabled:
+        return TRACER.enabled
+    if value == "1":
+        from settings_store import logs_dir
+        path = os.path.join(logs_dir(), time.strftime("trace-%Y%m%d-%H%M%S.json"))
+    else:
+        path = value
+    TRACER.start(path)
+    _install_asset_hooks()
+    return True
@@ -0,0 +1,107 @@
+"""
+Watchdog de hitches: detecta frames del loop principal que tardan más que un umbral.
+
+Un hilo de fondo revisa cada pocos ms cuándo empezó el frame actual
+(Game.run llama a beat() al inicio de cada frame). Si el frame supera el umbral,
+captura el stack del hilo principal con sys._current_frames(), lo etiqueta con la
+pantalla actual y lo agrega a logs/hitches.log (rotativo) en el directorio de datos.
+
+CHEESEGATES_WATCHDOG_MS=<ms> cambia el umbral (por defecto 50); 0 lo desactiva.
+"""
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional, Tuple
+
+
+class HitchWatchdog:
+    def __init__(self, threshold_ms: float = 50.0, log_path: Optional[str] = None,
+                 context: Optional[Callable[[], str]] = None):
+        self.threshold_s = max(0.001, threshold_ms / 1000.0)
+        self.poll_s = self.threshold_s / 4.0
+        self.log_path = log_path
+        self._context = context
+        self._main_ident = threading.main_thread().ident
+        # (id, inicio) del frame actual en una sola tupla: el hilo del watchdog la lee
+        # de una vez y nunca ve el id de un frame con el inicio del anterior
+        self._frame: Tuple[int, Optional[float]] = (0, None)
+        self._reported_id = -1
+        self._finished_hitch = None   # (frame_id, duración total) pendiente de loguear
+        self.hitches = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._log = self._make_logger(log_path)
+
+    @classmethod
+    def from_env(cls, context=None) -> Optional["HitchWatchdog"]:
+        try:
+            threshold = float(os.environ.get("CHEESEGATES_WATCHDOG_MS", "50"))
+        except ValueError:
+            threshold = 50.0
+        if threshold <= 0:
+            return None
+        from settings_store import logs_dir
+        return cls(threshold, os.path.join(logs_dir(), "hitches.log"), context)
+
+    @staticmethod
+    def _make_logger(log_path: Optional[str]) -> logging.Logger:
+        log = logging.getLogger("cheesegates.hitches")
+        log.propagate = False
+        log.setLevel(logging.INFO)
+        if log_path and not log.handlers:
+            try:
+                handler = logging.handlers.RotatingFileHandler(
+                    log_path, maxBytes=512 * 1024, backupCount=3, encoding="utf-8", delay=True
+                )
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                log.addHandler(handler)
+            except Exception as e:
+                print(f"[Watchdog] No se pudo abrir {log_path}: {e}")
+        return log
+
+    # ================= Hilo principal =================
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="hitch-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._frame = (self._frame[0], None)
+
+    def beat(self) -> None:
+        """Marcar el inicio de un frame."""
+        now = time.perf_counter()
+        frame_id, start = self._frame
+        if self._reported_id == frame_id and start is not None:
+            self._finished_hitch = (frame_id, now - start)
+        self._frame = (frame_id + 1, now)
+
+    # ================= Hilo watchdog =================
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            finished = self._finished_hitch
+            if finished is not None:
+                self._finished_hitch = None
+                self._log.info(f"frame {finished[0]} terminó en {finished[1] * 1000:.0f} ms")
+            frame_id, start = self._frame
+            if start is None or self._reported_id == frame_id:
+                continue
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.threshold_s:
+                self._reported_id = frame_id
+                self._capture(frame_id, elapsed)
+
+    def _capture(self, frame_id: int, elapsed: float) -> None:
+        frame = sys._current_frames().get(self._main_ident)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "  (sin stack)\n"
+        try:
+            where = self._context() if self._context else "?"
+        except Exception:
+            where = "?"
+        self.hitches += 1
+        self._log.info(f"HITCH frame {frame_id} lleva {elapsed * 1000:.0f} ms en {where}\n{stack}")
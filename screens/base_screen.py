@@ -1,7 +1,15 @@
 import pygame
+from perf import trace
 
 
 class Screen:
+    def __init_subclass__(cls, **kwargs):
+        # Cada construcción de pantalla aparece como span en el timeline (CHEESEGATES_TRACE)
+        super().__init_subclass__(**kwargs)
+        init = cls.__dict__.get("__init__")
+        if init is not None:
+            cls.__init__ = trace.traced(f"{cls.__name__}.__init__", "screen")(init)
+
     def __init__(self, game):
         self.game = game
         # Superficie lógica de dibujo (canvas) si existe; si no, la ventana.
@@ -9,6 +17,16 @@ class Screen:
         # Referencia opcional a la ventana física
         self.window = game.screen
 
+    def track_surfaces(self, *attrs):
+        """Registrar superficies cacheadas para re-convertirlas tras un cambio de modo de ventana."""
+        display = getattr(self.game, "display", None)
+        if display is not None:
+            display.track(self, *attrs)
+
+    def is_gameplay_active(self):
+        """True mientras el jugador está en juego activo (sin pausa). Lo usa la política de GC."""
+        return False
+
     def update(self, dt):
         """Update screen logic"""
         pass
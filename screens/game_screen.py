@@ -9,6 +9,7 @@ from ui.pause_modal import PauseModal
 from ui.settings_modal import SettingsModal
 from ui.button import Button
 from logic.level_logic import get_stone_weights
+from perf import trace
 
 # Lógica de niveles (AND/OR/NOT)
 from logic.level_logic import LEVELS, evaluate_level
@@ -29,6 +30,7 @@ class GameScreen(Screen):
             self.background = pygame.transform.smoothscale(background_raw, (self.game.WIDTH, self.game.HEIGHT))
         else:
             self.background = background_raw
+        self.track_surfaces("background")
 
         # Zonas
         self.setup_game_zones()
@@ -393,7 +395,8 @@ class GameScreen(Screen):
             self.test_platform_target_scale = self.test_platform_expand_scale
             
             try:
-                is_complete, bits = evaluate_level(self.level, self.input_zones)
+                with trace.span("evaluate_level", "logic", {"level": self.level}):
+                    is_complete, bits = evaluate_level(self.level, self.input_zones)
             except Exception:
                 weights = [z.get_total_weight() for z in self.input_zones]
                 bits = [1 if w >= 1 else 0 for w in weights[:2]]
@@ -442,6 +445,9 @@ class GameScreen(Screen):
         # Safety bounds
         self.test_platform_scale = max(0.9, min(self.test_platform_scale, 1.2))
 
+    def is_gameplay_active(self):
+        return not (self.pause_modal or self.settings_modal or self.level_complete)
+
     def update(self, dt):
         if self.pause_modal or self.settings_modal:
             if self.settings_modal:
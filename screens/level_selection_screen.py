@@ -9,6 +9,7 @@ class LevelSelectionScreen(Screen):
         # ===== Fondo =====
         self.bg_raw = pygame.image.load("level-selection-bg.png").convert()
         self.bg = pygame.transform.smoothscale(self.bg_raw, (self.game.WIDTH, self.game.HEIGHT))
+        self.track_surfaces("bg_raw", "bg")
 
         # ===== Botón TUTORIAL con fondo button.png y fuente/color custom =====
         button_bg = pygame.image.load("button.png").convert_alpha()
@@ -8,10 +8,13 @@ class LoseScreen(Screen):
         self.level = level
         # Scene music will be started by Game.change_screen
         self.scene_music_name = "lose"
+        # SFX de la escena (prewarm) en audio_config.json
+        self.scene_key = "lose"
 
         # Fondo a pantalla completa
         bg_raw = pygame.image.load(bg_path).convert()
         self.background = pygame.transform.smoothscale(bg_raw, (self.game.WIDTH, self.game.HEIGHT))
+        self.track_surfaces("background")
 
         # Botón skin
         button_skin = pygame.image.load("button.png").convert_alpha()
@@ -2,6 +2,7 @@ import math
 import random
 import pygame
 from settings_store import load_settings, save_settings
+from audio.audio_config import AUDIO_PROFILES, DEFAULT_AUDIO_PROFILE
 from .base_screen import Screen
 
 
@@ -26,6 +27,7 @@ class SettingsScreen(Screen):
             self.background = None
         # Build a warm orange gradient once (used regardless of bg image)
         self.grad_bg = self._build_orange_gradient(self.game.WIDTH, self.game.HEIGHT)
+        self.track_surfaces("background", "grad_bg")
 
         # Settings model
         self.settings = {
@@ -33,6 +35,12 @@ class SettingsScreen(Screen):
             "window_mode": {"options": ["Pantalla Completa", "Ventana Sin bordes", "Ventana"], "current": 0},
             "music": {"options": ["On", "Off"], "current": 0},
             "sfx": {"options": ["On", "Off"], "current": 0},
+            # Perfil del mixer (AUDIO_PROFILES): se muestra la etiqueta, se guarda la clave
+            "audio_profile": {
+                "options": [p.label for p in AUDIO_PROFILES.values()],
+                "keys": list(AUDIO_PROFILES),
+                "current": list(AUDIO_PROFILES).index(DEFAULT_AUDIO_PROFILE),
+            },
         }
         # Volume state (0.0 .. 1.0)
         self.music_volume = 0.8
@@ -384,39 +392,51 @@ class SettingsScreen(Screen):
                 info = pygame.display.Info()
                 if width == info.current_w and height == info.current_h:
                     size = (info.current_w, info.current_h)
-            self.game.screen = pygame.display.set_mode(size, flags)
+            self.game.screen = self.game.display.set_mode(size, flags)
         except Exception:
-            pygame.display.quit()
-            pygame.display.init()
-            self.game.screen = pygame.display.set_mode((width, height), flags)
+            self.game.screen = self.game.display.set_mode((width, height), flags, reinit=True)
 
         # Audio toggles -> SoundManager
         music_on = (self.settings["music"]["options"][self.settings["music"]["current"]] == "On")
         sfx_on = (self.settings["sfx"]["options"][self.settings["sfx"]["current"]] == "On")
+        profile = self.settings["audio_profile"]["keys"][self.settings["audio_profile"]["current"]]
+        profile_now = True
+        saved = load_settings() or {}
         try:
             if getattr(self.game, "audio", None):
                 self.game.audio.set_music_enabled(bool(music_on))
                 self.game.audio.set_sfx_enabled(bool(sfx_on))
                 self.game.audio.set_music_volume(float(self.music_volume))
                 self.game.audio.set_sfx_volume(float(self.sfx_volume))
+                profile_now = self.game.audio.set_audio_profile(
+                    profile,
+                    buffer=saved.get("audio_buffer"),
+                    frequency=saved.get("audio_frequency"),
+                    channels=saved.get("audio_channels"),
+                )
         except Exception:
             pass
 
-        # Persist
+        # Persist (conservando claves que esta pantalla no edita, p. ej. audio_buffer)
         try:
-            save_settings({
+            data = dict(saved)
+            data.update({
                 "resolution": f"{width}x{height}",
                 "window_mode": mode,
                 "music": self.settings["music"]["options"][self.settings["music"]["current"]],
                 "sfx": self.settings["sfx"]["options"][self.settings["sfx"]["current"]],
                 "music_volume": round(float(self.music_volume), 3),
                 "sfx_volume": round(float(self.sfx_volume), 3),
+                "audio_profile": profile,
             })
+            save_settings(data)
         except Exception:
             pass
 
         # Toast + caption
         self.info_message = f"Modo de ventana: {mode} | Música: {'On' if music_on else 'Off'} | SFX: {'On' if sfx_on else 'Off'}"
+        if not profile_now:
+            self.info_message += " | Audio: se aplica al reiniciar"
         self.info_timer = 2.0
         real_w, real_h = self.game.screen.get_size()
         pygame.display.set_caption(f"Cheese Gates - {mode} - {real_w}x{real_h}")
@@ -442,6 +462,9 @@ class SettingsScreen(Screen):
             self.settings["sfx"]["current"] = self.settings["sfx"]["options"].index(sfx)
         elif audio in ("On", "Off"):
             self.settings["sfx"]["current"] = self.settings["sfx"]["options"].index(audio)
+        profile = data.get("audio_profile")
+        if profile in self.settings["audio_profile"]["keys"]:
+            self.settings["audio_profile"]["current"] = self.settings["audio_profile"]["keys"].index(profile)
         # Volumes (0.0..1.0)
         mv = data.get("music_volume")
         sv = data.get("sfx_volume")
@@ -6,8 +6,21 @@ class SplashScreen(Screen):
     def __init__(self, game):
         super().__init__(game)
         self.scene_key = "splash"
-        self.background = pygame.image.load("splash.png").convert()
-        self.original_bg = pygame.transform.scale(self.background, (self.game.WIDTH, self.game.HEIGHT))
+        # Mientras el splash completo se decodifica en segundo plano se muestra la
+        # versión mínima del arranque (game.boot_splash) escalada. Ya decodificado,
+        # queda en game.splash_bg para las próximas veces que se vuelva al splash.
+        self.bg_size = (self.game.WIDTH, self.game.HEIGHT)
+        boot = getattr(self.game, "boot_splash", None)
+        if getattr(self.game, "splash_bg", None) is not None:
+            self.original_bg = self.game.splash_bg
+            self.full_bg_pending = False
+        elif boot is not None:
+            self.game.assets.preload("splash.png", self.bg_size)
+            self.original_bg = pygame.transform.scale(boot, self.bg_size)
+            self.full_bg_pending = True
+        else:
+            self._swap_full_background()
+        self.track_surfaces("original_bg")
 
         # Sin zoom: mostramos el mensaje enseguida
         self.show_press_enter = True
@@ -30,6 +43,12 @@ class SplashScreen(Screen):
 
     # Música de escena se inicia en Game.change_screen
 
+    def _swap_full_background(self):
+        self.original_bg = self.game.assets.load("splash.png", self.bg_size).convert()
+        self.full_bg_pending = False
+        self.game.splash_bg = self.original_bg
+        self.game.boot_splash = None
+
     def update_text(self):
         """Recrear superficie del texto con la opacidad actual"""
         self.text = self.font.render("Press Enter to Start", True, (255, 255, 255))
@@ -40,6 +59,9 @@ class SplashScreen(Screen):
             self.text_rect = self.text.get_rect(center=(self.game.WIDTH // 2, self.game.HEIGHT - 100))
 
     def update(self, dt):
+        if self.full_bg_pending and self.game.assets.ready("splash.png", self.bg_size):
+            self._swap_full_background()
+
         if self.show_press_enter and self.text_visible and not self.menu_modal:
             # Animación de fade del texto
             self.text_opacity += self.opacity_direction * self.opacity_speed * dt
@@ -80,9 +102,9 @@ class SplashScreen(Screen):
                     from .tutorial_screen import TutorialScreen
                     self.game.change_screen(TutorialScreen(self.game, bg_path="tutorial-bg.png"))
                 elif option == "exit":
-                    pygame.quit()
-                    import sys
-                    sys.exit()
+                    # Salir por el mismo camino que cerrar la ventana (Game.run vuelca
+                    # estadísticas y libera recursos antes de pygame.quit)
+                    pygame.event.post(pygame.event.Event(pygame.QUIT))
 
         else:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN and self.show_press_enter:
@@ -11,6 +11,7 @@ class TutorialScreen(Screen):
         # Fullscreen background
         bg_raw = pygame.image.load(bg_path).convert()
         self.background = pygame.transform.smoothscale(bg_raw, (self.game.WIDTH, self.game.HEIGHT))
+        self.track_surfaces("background")
 
         # Text (animated like splash)
         self.font = pygame.font.Font("font/BlackCastleMF.ttf", 36)
@@ -7,6 +7,8 @@ class WinScreen(Screen):
     def __init__(self, game, level=1, bg_path="win-bg.png", max_level=None):
         super().__init__(game)
         self.level = level
+        # SFX de la escena (prewarm) en audio_config.json
+        self.scene_key = "win"
 
         # Detectar max_level si no viene dado
         if max_level is None:
@@ -23,6 +25,7 @@ class WinScreen(Screen):
         # Fondo a pantalla completa
         bg_raw = pygame.image.load(bg_path).convert()
         self.background = pygame.transform.smoothscale(bg_raw, (game.WIDTH, game.HEIGHT))
+        self.track_surfaces("background")
 
         # Skin, fuente y color
         button_skin = pygame.image.load("button.png").convert_alpha()
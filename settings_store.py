@@ -10,8 +10,8 @@ import sys
 from typing import Dict, Optional
 
 
-def _config_path() -> str:
-    """Return path to settings.json.
+def user_data_dir() -> str:
+    """Return the writable directory for settings and logs.
     - In frozen (PyInstaller) mode, use a writable user dir (APPDATA on Windows).
     - In dev mode, keep it next to the source for simplicity.
     """
@@ -27,10 +27,24 @@ def _config_path() -> str:
             os.makedirs(base, exist_ok=True)
         except Exception:
             pass
-        return os.path.join(base, "settings.json")
+        return base
     # Dev: alongside source
-    base = os.path.dirname(__file__)
-    return os.path.join(base, "settings.json")
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def logs_dir() -> str:
+    """Return (and create) the logs/ folder inside the user data dir."""
+    path = os.path.join(user_data_dir(), "logs")
+    try:
+        os.makedirs(path, exist_ok=True)
+    except Exception:
+        pass
+    return path
+
+
+def _config_path() -> str:
+    """Return path to settings.json inside the user data dir."""
+    return os.path.join(user_data_dir(), "settings.json")
 
 
 def load_settings() -> Optional[Dict[str, str]]:
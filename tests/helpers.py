@@ -0,0 +1,92 @@
+"""Referencias simples (sin compilar ni podar) para comparar contra logic/."""
+import random
+from itertools import combinations_with_replacement
+
+
+def eval_tree(node, bits):
+    """Evaluar el árbol de "circuit" recorriendo los dicts, como el evaluador original."""
+    if isinstance(node, int):
+        return bits[node]
+    vals = [eval_tree(a, bits) for a in node["args"]]
+    op = node["op"].upper()
+    if op == "NOT":
+        return 1 - vals[0]
+    if op == "AND":
+        return 1 if all(vals) else 0
+    return 1 if any(vals) else 0
+
+
+def input_bits(rules, weights):
+    return [
+        (1 if w == 0 else 0) if r.get("invert") else (1 if w >= r["threshold"] else 0)
+        for r, w in zip(rules, weights)
+    ]
+
+
+def brute_force(cfg, capacity=2):
+    """(cantidad de soluciones, (piedras, peso) de la mínima o None) probando todo."""
+    values = sorted(set(cfg["stones"]))
+    counts = [cfg["stones"].count(v) for v in values]
+    options = [idx for r in range(capacity + 1) for idx in combinations_with_replacement(range(len(values)), r)]
+    n = len(cfg["inputs"])
+    total, best = 0, None
+
+    def rec(i, weights, used, weight):
+        nonlocal total, best
+        if i == n:
+            if eval_tree(cfg["circuit"], input_bits(cfg["inputs"], weights)):
+                total += 1
+                if best is None or (used, weight) < best:
+                    best = (used, weight)
+            return
+        for idx in options:
+            if any(idx.count(j) > counts[j] for j in set(idx)):
+                continue
+            for j in idx:
+                counts[j] -= 1
+            w = sum(values[j] for j in idx)
+            rec(i + 1, weights + [w], used + len(idx), weight + w)
+            for j in idx:
+                counts[j] += 1
+
+    rec(0, [], 0, 0)
+    return total, best
+
+
+def random_tree(rng, leaves, allow_not=True):
+    if len(leaves) == 1 and (not allow_not or rng.random() < 0.7):
+        return leaves[0]
+    if len(leaves) == 1:
+        return {"op": "NOT", "args": [leaves[0]]}
+    cut = rng.randint(1, len(leaves) - 1)
+    node = {"op": rng.choice(("AND", "OR")),
+            "args": [random_tree(rng, leaves[:cut], allow_not), random_tree(rng, leaves[cut:], allow_not)]}
+    if allow_not and rng.random() < 0.2:
+        return {"op": "NOT", "args": [node]}
+    return node
+
+
+def random_cfg(rng, n_inputs, n_stones, max_weight=6):
+    leaves = [rng.randrange(n_inputs) for _ in range(rng.randint(n_inputs, n_inputs + 2))]
+    leaves[:n_inputs] = rng.sample(range(n_inputs), n_inputs)
+    rng.shuffle(leaves)
+    return {
+        "inputs": [{"threshold": rng.randint(1, 2 * max_weight), "invert": rng.random() < 0.2}
+                   for _ in range(n_inputs)],
+        "circuit": random_tree(rng, leaves),
+        "stones": [rng.randint(1, max_weight) for _ in range(n_stones)],
+    }
+
+
+def rng_for(seed):
+    return random.Random(seed)
+
+
+class FakeClock:
+    """Reloj manual para el `clock` de SoundManager: el tiempo solo avanza al asignar `t`."""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
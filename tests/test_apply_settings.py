@@ -0,0 +1,30 @@
+import pygame
+import pytest
+
+from audio.null_backend import NullSoundManager
+
+from helpers import FakeClock
+
+
+@pytest.mark.parametrize("data, music, sfx", [
+    ({}, True, True),
+    ({"audio": "Off"}, False, False),
+    ({"audio": "Off", "music": "On"}, True, False),
+    ({"audio": "On", "sfx": "Off"}, True, False),
+    ({"music": "Off", "sfx": "On"}, False, True),
+])
+def test_flags_fall_back_to_legacy_audio_key(data, music, sfx):
+    audio = NullSoundManager(clock=FakeClock(), config={})
+    audio.apply_settings(data)
+    assert (audio.music_enabled, audio.sfx_enabled) == (music, sfx)
+
+
+def test_legacy_audio_off_keeps_the_mixer_closed():
+    from audio.sound_manager import SoundManager
+
+    pygame.mixer.quit()
+    audio = SoundManager()
+    audio.apply_settings({"audio": "Off"})
+    audio.enter_scene("menu")
+    audio.play_event_name("ui_click")
+    assert pygame.mixer.get_init() is None
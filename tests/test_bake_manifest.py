@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+import audio.sound_manager as sm
+from audio.sound_manager import SoundManager, file_sha1
+
+
+@pytest.fixture
+def baked(tmp_path, monkeypatch):
+    """Un SFX original y su versión horneada con el manifest de tools/bake_audio.py."""
+    src = tmp_path / "sounds" / "beep.mp3"
+    src.parent.mkdir()
+    src.write_bytes(b"original-audio-data")
+    baked_dir = tmp_path / "baked"
+    (baked_dir / "sounds").mkdir(parents=True)
+    (baked_dir / "sounds" / "beep.wav").write_bytes(b"pcm")
+    st = os.stat(src)
+    manifest = {"sounds": {"beep": {"sha1": file_sha1(str(src)), "source_size": st.st_size,
+                                    "source_mtime_ns": st.st_mtime_ns, "file": "sounds/beep.wav",
+                                    "rate": 44100}}, "music": {}}
+    (baked_dir / "manifest.json").write_text(json.dumps(manifest))
+    monkeypatch.setattr(sm, "BAKED_DIR", str(baked_dir))
+    return src, str(baked_dir / "sounds" / "beep.wav")
+
+
+def _index_for(src):
+    manager = SoundManager()
+    manager.sfx_sources = {"beep": str(src)}
+    manager.music_sources = {}
+    manager._sfx_index = dict(manager.sfx_sources)
+    manager._music_index = {}
+    manager._apply_baked()
+    return manager._sfx_index["beep"]
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+def test_fresh_bake_is_used(baked):
+    src, out = baked
+    assert _index_for(src) == out
+
+
+def test_same_size_edit_is_stale(baked):
+    src, _ = baked
+    src.write_bytes(b"ORIGINAL-AUDIO-DATA")  # mismo tamaño, otro contenido
+    _bump_mtime(src)
+    assert _index_for(src) == str(src)
+
+
+def test_size_change_is_stale(baked):
+    src, _ = baked
+    src.write_bytes(b"longer original-audio-data")
+    assert _index_for(src) == str(src)
+
+
+def test_touch_without_changes_keeps_bake(baked):
+    src, out = baked
+    _bump_mtime(src)  # p.ej. un checkout: cambia el mtime, el hash sigue igual
+    assert _index_for(src) == out
+
+
+def test_other_mixer_rate_ignores_bake(baked):
+    src, _ = baked
+    manager = SoundManager()
+    manager.mixer_params = (22050, -16, 2, 512)
+    manager.sfx_sources = {"beep": str(src)}
+    manager.music_sources = {}
+    manager._sfx_index = dict(manager.sfx_sources)
+    manager._apply_baked()
+    assert manager._sfx_index["beep"] == str(src)
+
+
+def test_frozen_build_skips_hashing(baked, monkeypatch):
+    src, out = baked
+    _bump_mtime(src)  # al extraer el bundle todos los mtime cambian
+
+    def no_hash(path):
+        raise AssertionError("no debería hashear en un build congelado")
+
+    monkeypatch.setattr(sm.sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sm, "file_sha1", no_hash)
+    assert _index_for(src) == out
@@ -0,0 +1,49 @@
+from itertools import product
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from logic.level_logic import LEVELS, compile_circuit, evaluate_batch, evaluate_level, truth_table  # noqa: E402
+
+from helpers import eval_tree, random_cfg, rng_for  # noqa: E402
+
+
+class _Zone:
+    def __init__(self, weight):
+        self.weight = weight
+
+    def get_total_weight(self):
+        return self.weight
+
+
+@pytest.mark.parametrize("level", sorted(LEVELS))
+def test_evaluate_batch_matches_scalar(level):
+    n = len(LEVELS[level]["inputs"])
+    rng = np.random.default_rng(level)
+    weights = rng.integers(0, 16, size=(500, n))
+    weights[rng.random(weights.shape) < 0.3] = 0
+    done, bits = evaluate_batch(level, weights)
+    for row, d, b in zip(weights, done, bits):
+        scalar_done, scalar_bits = evaluate_level(level, [_Zone(int(w)) for w in row])
+        assert bool(d) == scalar_done
+        assert b.astype(int).tolist() == scalar_bits
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_truth_table_matches_interpreter(seed):
+    rng = rng_for(seed)
+    cfg = random_cfg(rng, rng.randint(1, 7), 0)
+    bits, out = compile_circuit(cfg).truth_table()
+    n = len(cfg["inputs"])
+    assert bits.shape == (1 << n, n)
+    for k, row in enumerate(product((0, 1), repeat=n)):
+        assert bits[k].astype(int).tolist() == list(row)
+        assert bool(out[k]) == bool(eval_tree(cfg["circuit"], list(row)))
+
+
+def test_level_truth_table_shape():
+    bits, out = truth_table(2)
+    assert bits.shape == (16, 4) and out.dtype == bool
+    # (I0 OR I1) AND (I2 OR I3): 3 * 3 combinaciones encienden
+    assert int(out.sum()) == 9
@@ -0,0 +1,34 @@
+import pygame
+import pytest
+
+from perf.blit_probe import formats_match
+
+
+@pytest.fixture(scope="module")
+def canvas():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    yield pygame.Surface((64, 64), pygame.SRCALPHA).convert_alpha()
+    pygame.display.quit()
+
+
+def test_opaque_converted_background_is_fast_path(canvas):
+    assert formats_match(pygame.Surface((8, 8)).convert(), canvas)
+
+
+def test_converted_alpha_sprite_matches(canvas):
+    assert formats_match(pygame.Surface((8, 8), pygame.SRCALPHA).convert_alpha(), canvas)
+
+
+def test_different_depth_or_masks_is_flagged(canvas):
+    assert not formats_match(pygame.Surface((8, 8), depth=16), canvas)
+    assert not formats_match(pygame.Surface((8, 8), 0, 24), canvas)
+
+
+def test_colorkey_or_surface_alpha_is_flagged(canvas):
+    keyed = pygame.Surface((8, 8)).convert()
+    keyed.set_colorkey((0, 0, 0))
+    faded = pygame.Surface((8, 8)).convert()
+    faded.set_alpha(128)
+    assert not formats_match(keyed, canvas)
+    assert not formats_match(faded, canvas)
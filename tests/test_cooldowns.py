@@ -0,0 +1,70 @@
+from audio.audio_config import SOUND_MAP, SfxEvent
+from audio.null_backend import NullSoundManager
+
+from helpers import FakeClock
+
+
+CONFIG = {"events": {
+    "ui_click": {"files": ["Cloud Click"], "cooldown_ms": 60},
+    "ui_hover": {"files": ["Cloud Click"], "cooldown_ms": 500},
+    "win": {"files": ["Win sound"]},
+}}
+
+
+def _audio(config=CONFIG):
+    return NullSoundManager(clock=FakeClock(), config=config)
+
+
+def test_repeat_inside_cooldown_is_suppressed():
+    audio = _audio()
+    audio.play_event_name("ui_click")
+    audio._clock.t = 0.059
+    audio.play_event_name("ui_click")
+    assert audio.names("event") == ["ui_click"]
+    assert audio.suppressed["ui_click"] == 1
+
+    audio._clock.t = 0.06
+    audio.play_event_name("ui_click")
+    assert audio.names("event") == ["ui_click", "ui_click"]
+
+
+def test_suppressed_play_does_not_extend_cooldown():
+    audio = _audio()
+    for t in (0.0, 0.03, 0.06):
+        audio._clock.t = t
+        audio.play_event_name("ui_click")
+    assert audio.names("event") == ["ui_click", "ui_click"]
+    assert audio.suppressed["ui_click"] == 1
+
+
+def test_events_without_cooldown_always_play():
+    audio = _audio()
+    for _ in range(3):
+        audio.play_event_name("win")
+    assert audio.names("event") == ["win"] * 3
+    assert not audio.suppressed
+
+
+def test_json_overrides_sound_def():
+    assert SOUND_MAP[SfxEvent.UI_HOVER].cooldown_ms == 40
+    audio = _audio()
+    assert audio._cooldowns["ui_hover"] == 0.5
+    audio.play_event(SfxEvent.UI_HOVER)
+    audio._clock.t = 0.1
+    audio.play_event(SfxEvent.UI_HOVER)
+    assert audio.suppressed["ui_hover"] == 1
+
+
+def test_json_zero_disables_cooldown():
+    audio = _audio({"events": {"ui_hover": {"files": ["Cloud Click"], "cooldown_ms": 0}}})
+    audio.play_event(SfxEvent.UI_HOVER)
+    audio.play_event(SfxEvent.UI_HOVER)
+    assert audio.names("event") == ["ui_hover", "ui_hover"]
+
+
+def test_cooldown_shared_between_apis():
+    audio = _audio()
+    audio.play_event(SfxEvent.UI_CLICK)
+    audio.play_event_name("ui_click")
+    assert audio.names("event") == ["ui_click"]
+    assert audio.suppressed["ui_click"] == 1
@@ -0,0 +1,54 @@
+import threading
+
+import pygame
+import pytest
+
+from perf import counters
+
+
+@pytest.fixture
+def installed():
+    counters.install()
+    yield
+    counters.uninstall()
+
+
+def test_uninstall_restores_pygame():
+    scale, font = pygame.transform.scale, pygame.font.Font
+    counters.install()
+    assert pygame.transform.scale is not scale and pygame.font.Font is counters.CountingFont
+    counters.uninstall()
+    assert pygame.transform.scale is scale and pygame.font.Font is font
+    assert not counters.installed()
+
+
+def test_background_thread_transforms_are_not_counted(installed):
+    surf = pygame.Surface((16, 16))
+    counters.COUNTERS.reset()
+
+    worker = threading.Thread(target=lambda: pygame.transform.scale(surf, (8, 8)))
+    worker.start()
+    worker.join()
+    assert counters.COUNTERS.transforms == 0
+
+    pygame.transform.scale(surf, (8, 8))
+    assert counters.COUNTERS.transforms == 1
+
+
+def test_asset_loader_scales_like_the_baseline(tmp_path):
+    from asset_loader import AssetLoader
+
+    src = pygame.Surface((4, 4))
+    src.fill((0, 0, 0))
+    src.set_at((0, 0), (255, 255, 255))
+    path = tmp_path / "img.png"
+    pygame.image.save(src, str(path))
+
+    loader = AssetLoader()
+    try:
+        loader.preload(str(path), (8, 8))
+        out = loader.load(str(path), (8, 8))
+    finally:
+        loader.shutdown()
+    expected = pygame.transform.scale(pygame.image.load(str(path)), (8, 8))
+    assert pygame.image.tobytes(out, "RGB") == pygame.image.tobytes(expected, "RGB")
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from logic.generator import DIFFICULTIES, generate_levels, read_levels, write_levels
+from logic.solver import solve
+
+
+@pytest.mark.parametrize("difficulty", ["easy", "normal"])
+def test_output_independent_of_workers(difficulty):
+    serial, serial_stats = generate_levels(12, difficulty, seed=7, workers=1)
+    pooled, pooled_stats = generate_levels(12, difficulty, seed=7, workers=3)
+    assert len(serial) == 12
+    assert json.dumps(serial, sort_keys=True) == json.dumps(pooled, sort_keys=True)
+    assert serial_stats["scores"] == pooled_stats["scores"]
+
+
+def test_levels_are_verified():
+    difficulty = DIFFICULTIES["easy"]
+    levels, stats = generate_levels(15, "easy", seed=3, workers=1)
+    lo, hi = difficulty.score
+    for cfg, score in zip(levels, stats["scores"]):
+        assert set(cfg) >= {"inputs", "circuit", "stones", "time_limit"}
+        assert difficulty.inputs[0] <= len(cfg["inputs"]) <= difficulty.inputs[1]
+        result = solve(cfg)
+        assert result.solvable and result.stones_used > 0
+        assert lo <= score < hi
+
+
+def test_seed_changes_output():
+    a, _ = generate_levels(5, "easy", seed=1, workers=1)
+    b, _ = generate_levels(5, "easy", seed=2, workers=1)
+    assert a != b
+
+
+def test_unknown_difficulty():
+    with pytest.raises(ValueError):
+        generate_levels(1, "imposible")
+
+
+def test_write_read_roundtrip(tmp_path):
+    levels, _ = generate_levels(3, "easy", seed=0, workers=1)
+    path = tmp_path / "levels.json"
+    numbered = write_levels(str(path), levels, first=10)
+    assert read_levels(str(path)) == numbered
+    assert sorted(numbered) == [10, 11, 12]
@@ -0,0 +1,92 @@
+from itertools import product
+
+import pytest
+
+from logic.level_logic import LEVELS, compile_circuit, compile_level, evaluate_level
+
+from helpers import eval_tree, input_bits, random_cfg, rng_for
+
+
+def _configs():
+    cfgs = [LEVELS[k] for k in sorted(LEVELS)]
+    for seed in range(60):
+        rng = rng_for(seed)
+        cfgs.append(random_cfg(rng, rng.randint(1, 6), 0))
+    return cfgs
+
+
+@pytest.mark.parametrize("cfg", _configs())
+def test_compiled_matches_interpreter_on_all_bits(cfg):
+    compiled = compile_circuit(cfg)
+    for bits in product((0, 1), repeat=compiled.n_inputs):
+        expected = eval_tree(cfg["circuit"], list(bits))
+        assert compiled.circuit(bits) == expected
+        assert compiled.run_program(bits) == expected
+        assert compiled.eval_partial(bits) == expected
+
+
+@pytest.mark.parametrize("cfg", _configs())
+def test_compiled_weights_match_interpreter(cfg):
+    compiled = compile_circuit(cfg)
+    rng = rng_for(len(cfg["inputs"]))
+    for _ in range(200):
+        weights = [rng.choice((0, 0, rng.randint(1, 15))) for _ in cfg["inputs"]]
+        bits = input_bits(cfg["inputs"], weights)
+        assert compiled.input_bits(weights) == bits
+        assert compiled.solves(weights) == bool(eval_tree(cfg["circuit"], bits))
+
+
+class _Zone:
+    def __init__(self, weight):
+        self.weight = weight
+
+    def get_total_weight(self):
+        return self.weight
+
+
+def test_evaluate_level_uses_the_cached_compiled_circuit():
+    assert compile_level(4) is compile_level(4)
+    zones = [_Zone(w) for w in (0, 9, 12, 0, 0)]
+    done, bits = evaluate_level(4, zones)
+    assert done and bits == [0, 1, 1, 0, 0]
+
+
+def test_partial_evaluation_short_circuits():
+    compiled = compile_circuit({"inputs": [{"threshold": 1}] * 3,
+                                "circuit": {"op": "AND", "args": [0, {"op": "OR", "args": [1, 2]}]}})
+    assert compiled.eval_partial([0, None, None]) == 0
+    assert compiled.eval_partial([1, 1, None]) == 1
+    assert compiled.eval_partial([1, 0, None]) is None
+
+
+@pytest.mark.parametrize("circuit, error", [
+    ({"op": "XOR", "args": [0, 1]}, ValueError),
+    ({"op": "AND", "args": [0, 5]}, ValueError),
+    ({"op": "NOT", "args": [0, 1]}, ValueError),
+    ({"op": "AND", "args": []}, ValueError),
+    ({"op": "AND", "args": [0, "1"]}, TypeError),
+])
+def test_invalid_circuits_are_rejected(circuit, error):
+    with pytest.raises(error):
+        compile_circuit({"inputs": [{"threshold": 1}, {"threshold": 2}], "circuit": circuit})
+
+
+def _not_chain(depth):
+    node = {"op": "AND", "args": [0, 1]}
+    for _ in range(depth):
+        node = {"op": "NOT", "args": [node]}
+    return node
+
+
+@pytest.mark.parametrize("depth", [50, 198, 600])
+def test_deep_circuits_still_evaluate(depth):
+    compiled = compile_circuit({"inputs": [{"threshold": 1}, {"threshold": 2}], "circuit": _not_chain(depth)})
+    for bits in product((0, 1), repeat=2):
+        expected = (bits[0] & bits[1]) ^ (depth % 2)
+        assert compiled.circuit(list(bits)) == compiled.run_program(list(bits)) == expected
+    assert compiled.solves([1, 2]) == (depth % 2 == 0)
+
+
+def test_too_deep_circuit_is_a_value_error():
+    with pytest.raises(ValueError):
+        compile_circuit({"inputs": [{"threshold": 1}, {"threshold": 2}], "circuit": _not_chain(5000)})
@@ -0,0 +1,26 @@
+from audio.sound_manager import create_sound_manager
+
+from helpers import FakeClock
+
+
+def test_non_looping_track_can_be_replayed_after_it_ends():
+    audio = create_sound_manager("null", clock=FakeClock())
+    audio.play_music("background", loop=False)
+    assert audio.names("music") == ["background"]
+
+    audio.play_music("background", loop=False)  # sigue sonando: no se reinicia
+    assert audio.names("music") == ["background"]
+
+    audio._music_channel.busy = False  # la pista terminó sola
+    audio.update()
+    audio.play_music("background", loop=False)
+    assert audio.names("music") == ["background", "background"]
+
+
+def test_music_change_while_playing_crossfades():
+    audio = create_sound_manager("null", clock=FakeClock())
+    audio.play_music("background")
+    audio.play_music("losegamemusic")
+    audio.update()
+    assert audio.names("music") == ["background", "losegamemusic"]
+    assert audio._current_music == "losegamemusic"
@@ -0,0 +1,61 @@
+import builtins
+import os
+
+import pytest
+
+from audio.null_backend import NullSoundManager
+from audio.sound_manager import create_sound_manager
+
+from helpers import FakeClock
+
+CONFIG = {
+    "events": {
+        "ui_hover": {"files": ["Cloud Click"], "cooldown_ms": 40, "category": "ui"},
+        "win": {"files": ["Win sound"], "category": "stingers"},
+    },
+    "music": {"menu": {"file": "background", "loop": True}},
+    "scenes": {"menu": {"music": "menu", "events": ["ui_hover"]}},
+}
+
+
+@pytest.fixture
+def no_disk(monkeypatch):
+    def deny(*args, **kwargs):
+        raise AssertionError(f"disk access: {args[:1]}")
+
+    for mod, name in ((builtins, "open"), (os, "scandir"), (os, "stat"), (os, "listdir")):
+        monkeypatch.setattr(mod, name, deny)
+
+
+def test_null_backend_does_no_disk_io(no_disk):
+    clock = FakeClock()
+    audio = NullSoundManager(clock=clock, config=CONFIG)
+    audio.enter_scene("menu")
+    audio.play_event_name("ui_hover")
+    audio.play_event_name("ui_hover")  # dentro del cooldown
+    clock.t = 1.0
+    audio.play_event_name("ui_hover")
+    audio.play_event_name("win")
+    assert audio.names("music") == ["background"]
+    assert audio.names("sfx") == ["Cloud Click", "Cloud Click", "Win sound"]
+    assert audio.suppressed["ui_hover"] == 1
+
+
+def test_explicit_index_marks_the_rest_missing(no_disk):
+    audio = NullSoundManager(clock=FakeClock(), config=CONFIG, sfx=["Cloud Click"], music=[])
+    audio.play_event_name("win")
+    audio.play_music("background")
+    assert audio.names("sfx") == []
+    assert audio.names("music") == []
+    assert audio.telemetry.misses == {"Win sound": 1, "music:background": 1}
+
+
+def test_default_config_is_read_once(monkeypatch):
+    create_sound_manager("null")  # primer uso: lee audio_config.json
+    opened = []
+    real_open = builtins.open
+    monkeypatch.setattr(builtins, "open", lambda *a, **k: opened.append(a[0]) or real_open(*a, **k))
+    audio = create_sound_manager("null")
+    audio.play_sfx("stone")
+    assert opened == []
+    assert audio.names("sfx") == ["stone"]
@@ -0,0 +1,36 @@
+import pygame
+import pytest
+
+from audio.sound_manager import SoundManager
+
+
+@pytest.fixture
+def audio():
+    pygame.mixer.quit()
+    manager = SoundManager()
+    manager.apply_settings({"music": "Off", "sfx": "On"})
+    yield manager
+    pygame.mixer.quit()
+
+
+def test_prewarm_does_not_open_the_mixer(audio):
+    audio.enter_scene("level")
+    assert pygame.mixer.get_init() is None
+    assert not audio._prewarm_futures
+    assert "stone" in audio._prewarm_pending
+
+
+def test_pending_prewarm_runs_when_something_plays(audio):
+    audio.enter_scene("level")
+    audio.play_sfx("stone")
+    assert pygame.mixer.get_init() is not None
+    assert audio._prewarm_pending is None
+    for fut in list(audio._prewarm_futures.values()):
+        fut.result(timeout=10)
+    assert "walking" in audio._sfx or "walking" in audio._prewarm_futures
+
+
+def test_scene_change_replaces_pending_prewarm(audio):
+    audio.enter_scene("level")
+    audio.enter_scene("menu")
+    assert "stone" not in audio._prewarm_pending
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from logic.level_logic import LEVELS
+from logic.solver import solve, solve_level
+
+from helpers import brute_force, random_cfg, rng_for
+
+
+@pytest.mark.parametrize("level", sorted(LEVELS))
+def test_levels_match_brute_force(level):
+    count, best = brute_force(LEVELS[level])
+    result = solve_level(level, count=True)
+    assert result.count == count
+    assert not result.count_capped
+    assert result.solvable and result.stones_used == best[0]
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_random_levels_match_brute_force(seed):
+    rng = rng_for(seed)
+    capacity = rng.choice((1, 2, 3))
+    # Con capacidad 3 la fuerza bruta crece rápido: niveles un poco más chicos
+    cfg = random_cfg(rng, rng.randint(2, 4 if capacity < 3 else 3), rng.randint(0, 6))
+    count, best = brute_force(cfg, capacity)
+    result = solve(cfg, capacity=capacity, count=True)
+    assert result.count == count
+    assert result.solvable == (best is not None)
+    if best is not None:
+        assert result.stones_used == best[0]
+        placed = [w for p in result.placement for w in p]
+        assert sum(placed) == best[1]
+        # La solución mínima usa piedras que existen, sin pasarse de la capacidad
+        assert all(len(p) <= capacity for p in result.placement)
+        for w in set(placed):
+            assert placed.count(w) <= cfg["stones"].count(w)
+
+
+def test_capacity_three_uses_three_stones():
+    cfg = {"inputs": [{"threshold": 6}], "circuit": 0, "stones": [2, 2, 2]}
+    assert not solve(cfg).solvable
+    result = solve(cfg, capacity=3, count=True)
+    assert result.solvable and result.placement == ((2, 2, 2),) and result.count == 1
+
+
+def test_count_limit_only_decides_the_threshold():
+    cfg = LEVELS[4]
+    exact = solve(cfg, count=True).count
+    assert solve(cfg, count_limit=exact).count == exact
+    capped = solve(cfg, count_limit=exact // 10)
+    assert capped.count_capped and capped.count > exact // 10
+
+
+def _large_level(n_inputs, n_stones):
+    rng = rng_for(1)
+    half = n_inputs // 2
+    return {
+        "inputs": [{"threshold": rng.randint(3, 14), "invert": False} for _ in range(n_inputs)],
+        "circuit": {"op": "AND", "args": [{"op": "OR", "args": [i, i + half]} for i in range(half)]},
+        "stones": [rng.randint(1, 12) for _ in range(n_stones)],
+    }
+
+
+@pytest.mark.parametrize("n_inputs, n_stones", [(8, 20), (10, 30), (16, 60)])
+def test_large_levels_stay_bounded(n_inputs, n_stones):
+    """El conteo exacto de estos niveles tarda de decenas de segundos a horas: con el
+    presupuesto por defecto tiene que cortarse y avisarlo, y la mínima sigue saliendo."""
+    cfg = _large_level(n_inputs, n_stones)
+    t0 = time.perf_counter()
+    quick = solve(cfg)
+    counted = solve(cfg, count=True)
+    elapsed = time.perf_counter() - t0
+    assert quick.solvable and quick.count is None and not quick.count_capped
+    assert counted.count_capped
+    assert counted.stones_used == quick.stones_used
+    assert elapsed < 30.0
@@ -0,0 +1,44 @@
+import pygame
+import pytest
+
+pytest.importorskip("numpy")
+
+from audio.sound_manager import SoundManager  # noqa: E402
+
+
+@pytest.fixture
+def audio():
+    pygame.mixer.quit()
+    manager = SoundManager()
+    manager.apply_settings({"music": "Off", "sfx": "On", "sfx_volume": 0.5})
+    manager.set_master_volume(0.8)
+    assert manager._ensure_mixer()
+    yield manager
+    pygame.mixer.quit()
+
+
+def _volumes(audio, name):
+    return [v.get_volume() for v in audio._variants[name]]
+
+
+def _approx(v, n):
+    # SDL guarda el volumen en 1/128
+    return pytest.approx([v] * n, abs=0.01)
+
+
+def test_variants_inherit_base_volume(audio):
+    snd = audio._load_sfx("walking")
+    assert len(audio._variants["walking"]) > 1
+    assert _volumes(audio, "walking") == [snd.get_volume()] * len(audio._variants["walking"])
+    assert snd.get_volume() == pytest.approx(0.4, abs=0.01)
+
+
+def test_volume_changes_reach_variants(audio):
+    audio._load_sfx("stone")
+    n = len(audio._variants["stone"])
+    audio.set_sfx_volume(0.25)
+    assert _volumes(audio, "stone") == _approx(0.2, n)
+    audio.set_master_volume(0.4)
+    assert _volumes(audio, "stone") == _approx(0.1, n)
+    audio.set_enabled(False)
+    assert _volumes(audio, "stone") == _approx(0.0, n)
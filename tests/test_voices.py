@@ -0,0 +1,123 @@
+import pytest
+
+from audio.audio_config import VOICE_POOLS
+from audio.null_backend import NullSoundManager, _NullSound
+from audio.sound_manager import SoundManager
+
+from helpers import FakeClock
+
+
+class FakeChannel:
+    def __init__(self):
+        self.busy = False
+        self.played = []
+
+    def get_busy(self):
+        return self.busy
+
+    def set_volume(self, v):
+        pass
+
+    def play(self, snd, **kwargs):
+        self.busy = True
+        self.played.append(snd.name)
+
+
+@pytest.fixture
+def audio():
+    audio = NullSoundManager(clock=FakeClock(), sfx=["a", "b", "c", "d"], music=[])
+    total = sum(pool.channels for pool in VOICE_POOLS.values())
+    audio._channels = [FakeChannel() for _ in range(total)]
+    return audio
+
+
+def _fill(audio, category):
+    for i in audio._pool_channels[category]:
+        audio._channels[i].busy = True
+
+
+def test_own_free_channel_first(audio):
+    assert audio._allocate_channel("gameplay") == audio._pool_channels["gameplay"][0]
+    assert not audio.voice_stats
+
+
+def test_borrows_from_lower_priority(audio):
+    _fill(audio, "gameplay")
+    assert audio._allocate_channel("gameplay") in audio._pool_channels["ui"]
+    assert audio.voice_stats["gameplay.borrow"] == 1
+
+
+def test_never_borrows_from_higher_priority(audio):
+    _fill(audio, "ui")
+    own = audio._pool_channels["ui"]
+    audio._voice_started = {own[0]: 2.0, own[1]: 1.0}
+    assert audio._allocate_channel("ui") == own[1]
+    assert audio.voice_stats == {"ui.steal": 1}
+
+
+def test_steals_oldest_voice(audio):
+    _fill(audio, "ui")
+    _fill(audio, "gameplay")
+    own = audio._pool_channels["gameplay"]
+    audio._voice_started = {own[0]: 3.0, own[1]: 1.0, own[2]: 2.0}
+    assert audio._allocate_channel("gameplay") == own[1]
+    assert audio.voice_stats["gameplay.steal"] == 1
+
+
+def test_drops_when_pool_cannot_steal(audio):
+    assert not VOICE_POOLS["loops"].steal_oldest
+    for category in ("ui", "gameplay", "loops"):
+        _fill(audio, category)
+    assert audio._allocate_channel("loops") is None
+    assert audio.voice_stats["loops.drop"] == 1
+
+
+def test_play_voice_rotates_through_oldest(audio):
+    _fill(audio, "ui")
+    own = audio._pool_channels["gameplay"]
+    for k, name in enumerate("abcd"):
+        audio._clock.t = float(k)
+        ch = SoundManager._play_voice(audio, _NullSound(name), "gameplay")
+        assert ch is not None
+    # El cuarto corta al primero (el más viejo) y queda con la hora nueva
+    assert audio._channels[own[0]].played == ["a", "d"]
+    assert audio._voice_started[own[0]] == 3.0
+    assert audio.voice_stats == {"gameplay.steal": 1}
+
+
+def test_dropped_voice_does_not_play(audio):
+    for category in ("ui", "gameplay", "loops"):
+        _fill(audio, category)
+    assert SoundManager._play_voice(audio, _NullSound("a"), "loops", loops=-1) is None
+    assert not any(ch.played for ch in audio._channels)
+
+
+def test_steal_skips_borrowed_higher_priority_voices(audio):
+    ui = audio._pool_channels["ui"]
+    # Los stingers llenan su grupo y piden prestado un canal de ui
+    for k, name in enumerate("abc"):
+        audio._clock.t = float(k)
+        SoundManager._play_voice(audio, _NullSound(name), "stingers")
+    _fill(audio, "gameplay")
+    _fill(audio, "loops")
+    assert audio._voice_owner[ui[0]] == "stingers"
+    assert audio.voice_stats["stingers.borrow"] == 1
+    audio._clock.t = 3.0
+    SoundManager._play_voice(audio, _NullSound("d"), "ui")
+    audio._clock.t = 4.0
+    SoundManager._play_voice(audio, _NullSound("a"), "ui")
+    # El stinger (el más viejo del grupo) no se corta: ui roba su propia voz
+    assert audio._channels[ui[0]].played == ["c"]
+    assert audio._channels[ui[1]].played == ["d", "a"]
+    assert audio.voice_stats["ui.steal"] == 1
+
+
+def test_borrowed_loop_is_never_stolen(audio):
+    ui = audio._pool_channels["ui"]
+    _fill(audio, "loops")
+    SoundManager._play_voice(audio, _NullSound("a"), "loops", loops=-1)
+    SoundManager._play_voice(audio, _NullSound("b"), "loops", loops=-1)
+    assert all(audio._voice_owner[i] == "loops" for i in ui)
+    assert SoundManager._play_voice(audio, _NullSound("c"), "ui") is None
+    assert audio.voice_stats["ui.drop"] == 1
+    assert [audio._channels[i].played for i in ui] == [["a"], ["b"]]
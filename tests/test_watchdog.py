@@ -0,0 +1,28 @@
+import time
+
+from perf.watchdog import HitchWatchdog
+
+
+def test_slow_frame_is_reported_once_under_its_own_id():
+    dog = HitchWatchdog(threshold_ms=20)
+    captured = []
+    dog._capture = lambda frame_id, elapsed: captured.append((frame_id, elapsed))
+    dog.start()
+    try:
+        dog.beat()
+        time.sleep(0.1)
+        dog.beat()
+        time.sleep(0.01)
+    finally:
+        dog.stop()
+    assert [frame_id for frame_id, _ in captured] == [1]
+    assert captured[0][1] >= 0.02
+    assert dog._finished_hitch is None or dog._finished_hitch[0] == 1
+
+
+def test_stop_keeps_frame_id():
+    dog = HitchWatchdog(threshold_ms=20)
+    dog.beat()
+    dog.beat()
+    dog.stop()
+    assert dog._frame == (2, None)
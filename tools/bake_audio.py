@@ -0,0 +1,135 @@
+"""
+Transcodifica el audio a formatos de carga rápida en assets/baked/ (lo usa SoundManager).
+
+- SFX (assets/sounds): se decodifican con el mixer a PCM 16-bit en el formato del mixer
+  del juego y se guardan como WAV; si ambos canales son idénticos se guarda en mono.
+  Cargar un WAV en el formato nativo evita decodificar MP3 y re-muestrear en el juego.
+- Música (assets/music): se pasa a OGG Vorbis con ffmpeg si está instalado; si no, se
+  sigue usando el original.
+
+Cada salida queda registrada en assets/baked/manifest.json con el SHA-1 del original
+(y su tamaño y mtime, para que el juego no tenga que hashearlo en cada arranque):
+si el original no cambió no se vuelve a transcodificar.
+
+Uso:
+    python tools/bake_audio.py [--force]
+"""
+import argparse
+import array
+import json
+import os
+import shutil
+import subprocess
+import sys
+import wave
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from audio.sound_manager import BAKED_DIR, SoundManager, file_sha1 as _sha1  # noqa: E402
+
+
+def _source_stat(path: str) -> dict:
+    """Tamaño y mtime del original: con esto el juego evita hashearlo en cada arranque."""
+    st = os.stat(path)
+    return {"source_size": st.st_size, "source_mtime_ns": st.st_mtime_ns}
+
+
+def _rel(path: str) -> str:
+    return os.path.relpath(path, ROOT).replace(os.sep, "/")
+
+
+def bake_sfx(src: str, dst: str, rate: int, channels: int) -> dict:
+    snd = pygame.mixer.Sound(src)
+    samples = array.array("h", snd.get_raw())
+    if channels == 2 and samples[0::2] == samples[1::2]:
+        samples = samples[0::2]
+        channels = 1
+    with wave.open(dst, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+    return {"channels": channels, "rate": rate}
+
+
+def bake_music(src: str, dst: str, ffmpeg: str) -> dict:
+    subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-i", src, "-vn", "-c:a", "libvorbis", "-q:a", "5", dst],
+        check=True,
+    )
+    return {}
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--force", action="store_true", help="transcodificar todo aunque el hash no haya cambiado")
+    args = ap.parse_args(argv)
+
+    manager = SoundManager()
+    pygame.mixer.pre_init(*manager.mixer_params)
+    pygame.mixer.init()
+    # Formato real que abrió el mixer (el del juego): 16-bit con signo
+    freq, _, channels = pygame.mixer.get_init()
+
+    manifest_path = os.path.join(BAKED_DIR, "manifest.json")
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            old = json.load(f)
+    except Exception:
+        old = {}
+    manifest = {"sounds": {}, "music": {}}
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        print("[Bake] ffmpeg no encontrado: la música queda en su formato original")
+        # Conservar los OGG de un bake anterior cuyo original no cambió
+        for key, entry in (old.get("music") or {}).items():
+            src = manager.music_sources.get(key)
+            if src and entry.get("sha1") == _sha1(src):
+                manifest["music"][key] = dict(entry, **_source_stat(src))
+
+    jobs = [("sounds", manager.sfx_sources, ".wav", lambda s, d: bake_sfx(s, d, freq, channels))]
+    if ffmpeg:
+        jobs.append(("music", manager.music_sources, ".ogg", lambda s, d: bake_music(s, d, ffmpeg)))
+    for kind, index, ext, bake in jobs:
+        os.makedirs(os.path.join(BAKED_DIR, kind), exist_ok=True)
+        for key, src in sorted(index.items()):
+            digest = _sha1(src)
+            out_name = f"{kind}/{key}-{digest[:10]}{ext}"
+            dst = os.path.join(BAKED_DIR, out_name)
+            prev = old.get(kind, {}).get(key)
+            if not args.force and prev and prev.get("sha1") == digest and os.path.exists(dst):
+                # Mismo contenido: refrescar el mtime (p.ej. tras un checkout) y no re-hornear
+                manifest[kind][key] = dict(prev, **_source_stat(src))
+                continue
+            try:
+                extra = bake(src, dst)
+            except Exception as e:
+                print(f"[Bake] {_rel(src)}: {e}")
+                continue
+            manifest[kind][key] = dict(
+                source=_rel(src), sha1=digest, file=out_name, **_source_stat(src), **extra
+            )
+            print(f"[Bake] {_rel(src)} -> {out_name} "
+                  f"({os.path.getsize(src) // 1024} KB -> {os.path.getsize(dst) // 1024} KB)")
+
+    # Borrar salidas de versiones anteriores que ya no están en el manifest
+    keep = {e["file"] for entries in manifest.values() for e in entries.values()}
+    for kind in ("sounds", "music"):
+        folder = os.path.join(BAKED_DIR, kind)
+        if os.path.isdir(folder):
+            for name in os.listdir(folder):
+                if f"{kind}/{name}" not in keep:
+                    os.remove(os.path.join(folder, name))
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
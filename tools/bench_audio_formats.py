@@ -0,0 +1,66 @@
+"""
+Compara tiempo de carga y memoria de cada sonido en su formato original y en su
+versión horneada (tools/bake_audio.py).
+
+Uso:
+    python tools/bench_audio_formats.py [-n 20]
+
+Para cada archivo: tiempo de pygame.mixer.Sound(path) (mediana de n cargas) y bytes
+en memoria (PCM ya convertido al formato del mixer). La música se mide igual que los
+SFX porque SoundManager la decodifica entera a un Sound (en el worker de música) para
+hacer crossfade en sus canales, así que ocupa el PCM completo mientras está cargada.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from audio.sound_manager import SoundManager  # noqa: E402
+
+
+def _time_ms(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def _row(label: str, path: str, load_ms: float, mem: int) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    return (f"  {label:<16} {ext:<5} {os.path.getsize(path) / 1024:9.0f} KB "
+            f"{load_ms:9.2f} ms {mem / 1024:9.0f} KB")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--runs", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    manager = SoundManager()
+    pygame.mixer.pre_init(*manager.mixer_params)
+    pygame.mixer.init()
+
+    print(f"  {'sonido':<16} {'fmt':<5} {'archivo':>12} {'carga p50':>12} {'memoria':>12}")
+    for title, sources, index in (("SFX", manager.sfx_sources, manager._sfx_index),
+                                  ("Música", manager.music_sources, manager._music_index)):
+        print(f" {title}")
+        for key, src in sorted(sources.items()):
+            for path in dict.fromkeys((src, index[key])):
+                mem = len(pygame.mixer.Sound(path).get_raw())
+                label = key if path == src else "  (horneado)"
+                print(_row(label, path, _time_ms(lambda: pygame.mixer.Sound(path), args.runs), mem))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
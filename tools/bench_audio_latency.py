@@ -0,0 +1,134 @@
+"""
+Mide, para cada tamaño de buffer del mixer, la latencia de disparo de un SFX y la
+tasa de underruns, sin dispositivo de audio real (drivers SDL "dummy" o "disk").
+
+Uso:
+    python tools/bench_audio_latency.py
+    python tools/bench_audio_latency.py --buffers 128 256 512 1024 -n 300 --load 2
+    python tools/bench_audio_latency.py --driver disk
+
+Cómo se mide: se reproduce un "blip" de silencio más corto que un buffer y se espera
+(polling de Channel.get_busy) a que el mixer lo consuma. Eso ocurre en el siguiente
+callback de audio, así que el tiempo medido es la espera de planificación entre
+play_sfx y el momento en que el sonido entra al buffer. A eso hay que sumarle un
+buffer de salida (columna "total"), que es lo que tarda en llegar al parlante.
+
+Si un callback llega más de 1.5 períodos tarde, en un dispositivo real se habría
+reproducido un hueco (underrun); se cuenta como tal. --load N lanza N procesos que
+ocupan CPU para ver qué buffers aguantan con la máquina cargada.
+
+El perfil elegido se configura en audio/audio_config.py (AUDIO_PROFILES) o con
+"audio_buffer" en settings.json.
+"""
+import argparse
+import array
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from perf.frame_stats import percentile  # noqa: E402
+
+# Un callback más tarde que esto (en períodos de buffer) cuenta como underrun
+LATE_FACTOR = 1.5
+
+
+def _busy(stop) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(10000))
+
+
+def measure(pygame, buf: int, freq: int, channels: int, runs: int, rng: random.Random) -> dict:
+    pygame.mixer.pre_init(freq, -16, channels, buf)
+    pygame.mixer.init()
+    try:
+        pygame.mixer.set_num_channels(1)
+        ch = pygame.mixer.Channel(0)
+        # Blip de un cuarto de buffer: el mixer lo consume entero en un solo callback
+        blip = pygame.mixer.Sound(buffer=array.array("h", [0] * (max(1, buf // 4) * channels)).tobytes())
+        period = buf / float(freq)
+        samples, late = [], 0
+        for i in range(runs + 5):
+            # Fase aleatoria respecto del callback, como un play_sfx disparado por input
+            time.sleep(rng.uniform(0.0, period * 1.5))
+            t0 = time.perf_counter()
+            ch.play(blip)
+            while ch.get_busy() and time.perf_counter() - t0 < 1.0:
+                pass
+            elapsed = time.perf_counter() - t0
+            if i < 5:
+                continue  # calentamiento
+            samples.append(elapsed * 1000.0)
+            if elapsed > period * LATE_FACTOR:
+                late += 1
+    finally:
+        pygame.mixer.quit()
+    samples.sort()
+    return {
+        "buffer": buf,
+        "period_ms": period * 1000.0,
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "max": samples[-1] if samples else 0.0,
+        "underrun_pct": 100.0 * late / max(1, len(samples)),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--buffers", type=int, nargs="+", default=[128, 256, 512, 1024, 2048])
+    ap.add_argument("--frequency", type=int, default=44100)
+    ap.add_argument("--channels", type=int, default=2, choices=(1, 2))
+    ap.add_argument("-n", "--runs", type=int, default=200, help="disparos por tamaño de buffer")
+    ap.add_argument("--driver", choices=("dummy", "disk"), default="dummy")
+    ap.add_argument("--load", type=int, default=0, help="procesos que ocupan CPU durante la medición")
+    ap.add_argument("--max-underrun", type=float, default=1.0,
+                    help="%% de underruns tolerado al sugerir un buffer")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    os.environ["SDL_AUDIODRIVER"] = args.driver
+    disk_file = None
+    if args.driver == "disk":
+        fd, disk_file = tempfile.mkstemp(prefix="cg-audio-", suffix=".raw")
+        os.close(fd)
+        os.environ["SDL_DISKAUDIOFILE"] = disk_file
+    import pygame
+
+    stop = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=_busy, args=(stop,), daemon=True) for _ in range(args.load)]
+    for w in workers:
+        w.start()
+    rng = random.Random(args.seed)
+    rows = []
+    try:
+        for buf in args.buffers:
+            rows.append(measure(pygame, buf, args.frequency, args.channels, args.runs, rng))
+    finally:
+        stop.set()
+        for w in workers:
+            w.join()
+        if disk_file:
+            os.remove(disk_file)
+
+    print(f"driver={args.driver} {args.frequency} Hz {args.channels} ch, {args.runs} disparos, carga={args.load}")
+    print(f"  {'buffer':>6} {'período':>9} {'p50':>8} {'p95':>8} {'max':>8} {'total p95':>10} {'underruns':>10}")
+    for r in rows:
+        print(f"  {r['buffer']:>6} {r['period_ms']:>7.1f}ms {r['p50']:>6.1f}ms {r['p95']:>6.1f}ms "
+              f"{r['max']:>6.1f}ms {r['p95'] + r['period_ms']:>8.1f}ms {r['underrun_pct']:>9.1f}%")
+    ok = [r for r in rows if r["underrun_pct"] <= args.max_underrun]
+    if ok:
+        best = min(ok, key=lambda r: r["buffer"])
+        print(f"Buffer sugerido: {best['buffer']} (menor con <= {args.max_underrun:g}% de underruns)")
+    else:
+        print("Ningún buffer quedó bajo el umbral de underruns")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
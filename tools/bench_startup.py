@@ -0,0 +1,83 @@
+"""
+Benchmark de arranque: lanza el juego N veces sin ventana (drivers SDL "dummy"),
+sale tras el primer frame y reporta la distribución de cada fase.
+
+Uso:
+    python tools/bench_startup.py -n 20
+    python tools/bench_startup.py -n 10 --exe dist/CheeseGates.exe
+
+Cada corrida escribe su timeline (perf/startup.py) a un JSON temporal; además se mide
+el tiempo de pared del proceso completo (incluye el bootloader de PyInstaller con --exe).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from perf.frame_stats import percentile  # noqa: E402
+
+
+def run_once(cmd, report_path):
+    env = dict(os.environ)
+    env.update({
+        "SDL_VIDEODRIVER": "dummy",
+        "SDL_AUDIODRIVER": "dummy",
+        "CHEESEGATES_EXIT_AFTER_FIRST_FRAME": "1",
+        "CHEESEGATES_STARTUP_REPORT": report_path,
+        "CHEESEGATES_WATCHDOG_MS": "0",
+    })
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0 or not os.path.exists(report_path):
+        raise RuntimeError(f"arranque falló (código {proc.returncode}): {proc.stderr.decode(errors='replace')[-500:]}")
+    with open(report_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    os.remove(report_path)
+    return wall, data
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--runs", type=int, default=10)
+    ap.add_argument("--exe", help="medir un ejecutable (p.ej. dist/CheeseGates.exe) en lugar de main.py")
+    ap.add_argument("--warmup", type=int, default=1, help="corridas descartadas (cache de disco caliente)")
+    args = ap.parse_args(argv)
+
+    cmd = [os.path.abspath(args.exe)] if args.exe else [sys.executable, os.path.join(ROOT, "main.py")]
+    samples = defaultdict(list)
+    tmp = tempfile.mkdtemp(prefix="cg-startup-")
+    for i in range(args.warmup + args.runs):
+        wall, data = run_once(cmd, os.path.join(tmp, f"run-{i}.json"))
+        if i < args.warmup:
+            continue
+        samples["proceso completo (pared)"].append(wall * 1000.0)
+        if data.get("pre_python_s") is not None:
+            samples["antes de Python"].append(data["pre_python_s"] * 1000.0)
+        for p in data.get("phases", []):
+            samples[p["name"]].append((p["end_s"] - p["start_s"]) * 1000.0)
+        if data.get("first_frame_s") is not None:
+            samples["primer frame"].append(data["first_frame_s"] * 1000.0)
+        print(f"  corrida {i - args.warmup + 1}/{args.runs}: {wall * 1000.0:.0f} ms")
+    try:
+        os.rmdir(tmp)
+    except OSError:
+        pass
+
+    print(f"\n[Startup] {' '.join(cmd)}  ({args.runs} corridas, ms)")
+    print(f"  {'fase':<28} {'min':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+    for name, vals in samples.items():
+        vals.sort()
+        print(f"  {name:<28} {vals[0]:8.1f} {percentile(vals, 50):8.1f} {percentile(vals, 95):8.1f} {vals[-1]:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
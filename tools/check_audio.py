@@ -0,0 +1,28 @@
+"""
+Validar audio/audio_config.json contra los archivos de assets/sounds y assets/music.
+
+Uso:
+    python tools/check_audio.py
+
+Sale con código 1 si algún evento, música o escena apunta a algo que no existe.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from audio.sound_manager import SoundManager  # noqa: E402
+
+
+def main() -> int:
+    problems = SoundManager().validate()
+    for line in problems:
+        print(f"[Audio] {line}")
+    if not problems:
+        print("[Audio] audio_config.json OK")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Generar niveles procedurales verificados (logic/generator.py) y guardarlos como JSON
+en el formato de LEVELS ({"<número>": {"inputs", "circuit", "stones", "time_limit", ...}}).
+
+Uso:
+    python tools/generate_levels.py -n 200                         # 200 niveles "normal"
+    python tools/generate_levels.py -n 100 --difficulty hard --workers 8
+    python tools/generate_levels.py -n 50 --difficulty easy --first 5 --out levels/easy.json
+
+Cada candidato se verifica con el solver (tiene solución, no se resuelve sin piedras y
+el score cae en el rango de la dificultad). Con la misma --seed la salida es la misma
+sin importar --workers. Los niveles generados no traen "circuit_bg": el juego dibuja el
+nivel sin imagen de circuito.
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from logic.generator import DEFAULT_DIFFICULTY, DIFFICULTIES, generate_levels, write_levels  # noqa: E402
+from perf.frame_stats import percentile  # noqa: E402
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--count", type=int, default=100, help="niveles a generar")
+    ap.add_argument("--difficulty", choices=sorted(DIFFICULTIES), default=DEFAULT_DIFFICULTY)
+    ap.add_argument("--workers", type=int, default=None, help="procesos (por defecto, uno por CPU; 1 = sin pool)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--capacity", type=int, default=2, help="piedras por InputZone")
+    ap.add_argument("--first", type=int, default=1, help="número del primer nivel en el JSON")
+    ap.add_argument("--out", default=os.path.join("logs", "generated_levels.json"))
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    levels, stats = generate_levels(args.count, args.difficulty, seed=args.seed,
+                                    workers=args.workers, capacity=args.capacity)
+    dt = time.perf_counter() - t0
+    if not levels:
+        print("[Generator] No se generó ningún nivel")
+        return 1
+    write_levels(args.out, levels, first=args.first)
+
+    scores = sorted(stats["scores"])
+    rejected = ", ".join(f"{k} {v}" for k, v in sorted(stats["rejected"].items(), key=lambda kv: -kv[1]))
+    print(f"[Generator] {len(levels)} niveles '{args.difficulty}' -> {args.out}")
+    print(f"  {stats['candidates']} candidatos en {dt:.2f}s ({stats['candidates'] / dt:.0f}/s, "
+          f"{len(levels) / dt:.1f} niveles/s)")
+    print(f"  rechazados: {rejected or '-'}")
+    print(f"  score p50 {percentile(scores, 50):.2f}  min {scores[0]:.2f}  max {scores[-1]:.2f}")
+    return 0 if len(levels) == args.count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
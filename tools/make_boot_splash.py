@@ -0,0 +1,29 @@
+"""
+Genera splash-boot.jpg: versión mínima de splash.png que se pinta en el primer
+frame, antes de inicializar audio y de decodificar el splash completo.
+
+Uso (volver a correrlo si cambia splash.png):
+    python tools/make_boot_splash.py
+"""
+import os
+import sys
+
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join(ROOT, "splash.png")
+TARGET = os.path.join(ROOT, "splash-boot.jpg")
+WIDTH = 480
+
+
+def main() -> int:
+    src = pygame.image.load(SOURCE)
+    w, h = src.get_size()
+    small = pygame.transform.smoothscale(src, (WIDTH, round(h * WIDTH / w)))
+    pygame.image.save(small, TARGET)
+    print(f"{TARGET}: {small.get_size()} ({os.path.getsize(TARGET) // 1024} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Resolver los niveles de logic/level_logic.py: si tienen solución y la solución con
+menos piedras (logic/solver.py); con --count, también cuántas soluciones distintas hay.
+
+Uso:
+    python tools/solve_levels.py            # todos los niveles
+    python tools/solve_levels.py 2 4        # solo esos
+    python tools/solve_levels.py --count    # contar soluciones (con tope de pasos)
+    python tools/solve_levels.py --count --count-budget 0   # contar sin tope (puede tardar)
+    python tools/solve_levels.py --file logs/generated_levels.json  # niveles generados
+
+Sale con código 1 si algún nivel no tiene solución.
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from logic.level_logic import LEVELS  # noqa: E402
+from logic.generator import read_levels  # noqa: E402
+from logic.solver import COUNT_BUDGET, solve  # noqa: E402
+
+
+def _fmt_placement(placement) -> str:
+    return "  ".join(f"I{i}=[{'+'.join(map(str, p)) or '-'}]" for i, p in enumerate(placement))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("levels", type=int, nargs="*", help="niveles a resolver (por defecto todos)")
+    ap.add_argument("--capacity", type=int, default=2, help="piedras por InputZone")
+    ap.add_argument("--count", action="store_true", help="contar soluciones")
+    ap.add_argument("--count-budget", type=int, default=COUNT_BUDGET,
+                    help="pasos máximos del conteo (0 = sin tope)")
+    ap.add_argument("--file", help="JSON de tools/generate_levels.py en lugar de LEVELS")
+    args = ap.parse_args(argv)
+
+    levels = read_levels(args.file) if args.file else LEVELS
+    failed = 0
+    for level in args.levels or sorted(levels):
+        t0 = time.perf_counter()
+        result = solve(levels[level], capacity=args.capacity, count=args.count,
+                       count_budget=args.count_budget or None)
+        ms = (time.perf_counter() - t0) * 1000.0
+        if not result.solvable:
+            failed += 1
+            print(f"[Solver] nivel {level}: SIN SOLUCIÓN ({ms:.1f} ms)")
+            continue
+        if result.count is None:
+            count = ""
+        elif result.count_capped:
+            count = f", >= {result.count} soluciones (conteo cortado por --count-budget)"
+        else:
+            count = f", {result.count} soluciones"
+        print(f"[Solver] nivel {level}: mínima {result.stones_used} piedras{count} ({ms:.1f} ms)")
+        print(f"         {_fmt_placement(result.placement)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
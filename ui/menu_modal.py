@@ -26,8 +26,8 @@ class MenuModal:
         total_h = len(self.options) * self.button_h + (len(self.options) - 1) * self.button_spacing
         top_y = self.rect.centery - total_h // 2
 
-        # Cargar skin de botón
-        self.button_skin_raw = pygame.image.load("button.png").convert_alpha()
+        # Cargar skin de botón (precargada en segundo plano durante el arranque)
+        self.button_skin_raw = game.assets.load("button.png").convert_alpha()
 
         # Crear botones como instancias Button con animación de hover
         self.buttons = []
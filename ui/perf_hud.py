@@ -0,0 +1,95 @@
+import time
+import pygame
+
+
+class PerfHUD:
+    """Overlay de rendimiento (F3): tiempos por fase, percentiles, contadores y gráfico.
+
+    Lee de un perf.frame_stats.FrameStats. El texto y el gráfico se re-renderizan
+    pocas veces por segundo y se cachean en una superficie; cada frame solo se
+    hace un blit. Se dibuja sobre la ventana (no sobre el canvas) para no
+    ensuciar las mediciones del frame.
+    """
+
+    SIZE = (400, 200)
+    GRAPH_H = 64
+    GRAPH_MAX_MS = 33.3
+
+    def __init__(self, stats, refresh_hz: float = 4.0):
+        self.stats = stats
+        self.visible = False
+        self.refresh_s = 1.0 / max(0.5, refresh_hz)
+        self._next_refresh = 0.0
+        self._surface = None
+        self._font = None
+        self._line_providers = []
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._next_refresh = 0.0
+
+    def add_line_provider(self, provider):
+        """provider() -> str | None: línea extra (audio, latencia, GC, ...)."""
+        self._line_providers.append(provider)
+
+    def draw(self, target: pygame.Surface):
+        if not self.visible or self.stats.count == 0:
+            return
+        now = time.perf_counter()
+        if self._surface is None or now >= self._next_refresh:
+            self._render()
+            self._next_refresh = now + self.refresh_s
+        target.blit(self._surface, (8, 8))
+
+    def _lines(self):
+        recent = 30
+        def avg(name):
+            col = self.stats.column(name, last=recent)
+            return sum(col) / len(col) if col else 0.0
+
+        work = self.stats.summary("work_ms")
+        dt = avg("dt_ms")
+        fps = 1000.0 / dt if dt > 0 else 0.0
+        lines = [
+            f"frame {avg('work_ms'):5.2f} ms   dt {dt:5.2f} ms   {fps:5.1f} fps",
+            f"events {avg('events_ms'):4.2f}  update {avg('update_ms'):4.2f}  "
+            f"draw {avg('draw_ms'):4.2f}  present {avg('present_ms'):4.2f}",
+            f"p50 {work['p50']:5.2f}  p95 {work['p95']:5.2f}  p99 {work['p99']:5.2f}  max {work['max']:5.2f}",
+            f"blits {avg('blits'):5.1f}  transforms {avg('transforms'):4.1f}  fonts {avg('font_renders'):4.1f}",
+        ]
+        for provider in self._line_providers:
+            try:
+                line = provider()
+            except Exception:
+                line = None
+            if line:
+                lines.append(line)
+        return lines
+
+    def _render(self):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        lines = self._lines()
+        line_h = self._font.get_linesize()
+        w = self.SIZE[0]
+        h = 10 + line_h * len(lines) + 8 + self.GRAPH_H + 8
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        surf.fill((10, 12, 20, 190))
+        y = 8
+        for line in lines:
+            surf.blit(self._font.render(line, True, (235, 238, 255)), (8, y))
+            y += line_h
+
+        # Gráfico: un pixel de ancho por frame (los más recientes a la derecha)
+        graph = pygame.Rect(8, y + 6, w - 16, self.GRAPH_H)
+        pygame.draw.rect(surf, (30, 34, 52, 220), graph)
+        values = self.stats.column("work_ms", last=graph.width)
+        x0 = graph.right - len(values)
+        for i, ms in enumerate(values):
+            bar_h = min(graph.height, int(graph.height * ms / self.GRAPH_MAX_MS))
+            color = (120, 200, 120) if ms <= 8.4 else (230, 200, 90) if ms <= 16.7 else (230, 90, 80)
+            pygame.draw.line(surf, color, (x0 + i, graph.bottom - 1), (x0 + i, graph.bottom - bar_h))
+        for ref_ms in (8.33, 16.67):
+            ry = graph.bottom - int(graph.height * ref_ms / self.GRAPH_MAX_MS)
+            pygame.draw.line(surf, (140, 150, 240), (graph.left, ry), (graph.right - 1, ry))
+        self._surface = surf